@@ -5,9 +5,15 @@ from materials import fibers, matrices
 from utils import spacer, set_mpl_style, crop_image, invert_colors
 from wing_load_calculator import calculate_wing_load
 
-from material_math.properties import calculate_properties, plot_properties, display_theories, get_property_units
-from material_math.formulas import micromech_properties, strength_properties, failure_criteria
-from material_math.hooke_law import display_hooke_law_matrices
+from material_math.properties import plot_properties, display_theories, get_property_units
+from material_math.formulas import micromech_properties, strength_properties, thermal_properties, failure_criteria
+from material_math.hooke_law import display_hooke_law_matrices, display_laminate_stiffness
+from material_math.batch import compare_all_combos, plot_combo_cube
+from material_math.property_cache import cached_calculate_properties, property_cache
+from material_math.stacking_optimizer import stacking_optimizer_ui
+from material_math.failure_envelope import failure_envelope_ui
+from material_math.hygrothermal import hygrothermal_ui
+from material_math.failure_kernels import F12_MODELS
 from material_math.composite_materials import initialize_composite_materials, add_composite_material, display_composite_materials, get_composite_properties
 
 
@@ -16,7 +22,9 @@ from cad.cad_ui import cad_ui
 # from cad.step_dl import export_step
 # from cad.assembly_step import export_step_from_assembly
 
-from femap.wing_load import calc_wing_load
+from femap.wing_load import calc_wing_load, select_distribution, INTEGRATION_MODES
+from femap.internal_loads import internal_loads_ui
+from femap.vn_diagram import vn_ui
 
 initialize_composite_materials()
 
@@ -78,9 +86,13 @@ Vf = st.sidebar.slider('Fiber volume fraction $$(V_{{f}})$$ `Vf`', 0.0, 1.0, air
 Vm = 1 - Vf
 Vvoid = st.sidebar.slider('Void space $$(V_{{void}})$$ `Vvoid`', 0.0, 1.0, aircraft_presets[st.session_state.current_preset]["materials"]["Vvoid"], 0.01, help="Adjust void ratio in the composite (between 0 and 1)", on_change=on_change_custom)
 
+F12_model = st.sidebar.selectbox("Tsai-Wu $$F_{12}$$ model", list(F12_MODELS.keys()), help="Interaction term stored with saved materials")
+
 if st.sidebar.button("💾 Save material", type="primary"):
-    properties = calculate_properties(micromech_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=False)[0]
-    add_composite_material(fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, properties)
+    properties = cached_calculate_properties(micromech_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=False)[0]
+    strengths = cached_calculate_properties(strength_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=False)[0]
+    thermal = cached_calculate_properties(thermal_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=False)[0]
+    add_composite_material(fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, properties, strengths, F12_model, thermal)
     st.sidebar.success(f"Material {fiber_material_key}/{matrix_material_key} added.")
 
 display_composite_materials()
@@ -94,6 +106,7 @@ graph_style = "dark" if dark_graphs else "light"
 
 theme_mode = set_mpl_style(graph_style)
 show_individual_graphs = st.sidebar.checkbox(f"Show graphs", value=False)
+graph_resolution = st.sidebar.number_input("Graph points", min_value=20, max_value=20000, value=200, step=50, disabled=not show_individual_graphs, help="Point budget per property; samples are placed where theory curves bend or cross")
 show_math = st.sidebar.checkbox("Full math", value=False)
 
 # math_ui()
@@ -149,24 +162,36 @@ def main():
     st.header("Wing Load Calculation")
     st.write("")
 
+    with st.expander("V-n envelope and critical load case"):
+        critical = vn_ui(aircraft_presets, st.session_state.current_preset)
+
     col1, col2, col3 = st.columns(3)
     with col1:
         selected_mass = st.number_input('Mass of aircraft (kg)', value=aircraft_df['specs'][0]['mass'], step=100.0, on_change=on_change_custom)
-        load_factor = st.number_input('Load Factor', value=aircraft_df['specs'][0]['load_factor'], help="The load factor represents the ratio of the maximum load the wing can support to the aircraft's weight. A higher load factor indicates greater structural stress.", on_change=on_change_custom)
+        use_critical = critical is not None and st.checkbox(f"Critical V-n case ({critical[0]}, n = {critical[1]:.2f})", value=True, key="use_critical_case")
+        load_factor = st.number_input('Load Factor', value=aircraft_df['specs'][0]['load_factor'], disabled=use_critical, help="The load factor represents the ratio of the maximum load the wing can support to the aircraft's weight. A higher load factor indicates greater structural stress.", on_change=on_change_custom)
+        if use_critical:
+            load_factor = critical[1]
     with col2:
         nodes_between_ribs = st.number_input('Nodes between Ribs', value=15, on_change=on_change_custom)
         num_ribs = st.number_input('Number of Ribs', value=12, on_change=on_change_custom)
     with col3:
         wing_length = st.number_input('Wing Length (mm)', value=aircraft_df['wing'].get('span_wet', 1) * 1000, on_change=on_change_custom)
         num_nodes = st.number_input('Number of Nodes for Force Calculation', value=20, on_change=on_change_custom)
+    integration = st.radio('Force integration', INTEGRATION_MODES, horizontal=True, help="trapezoid: sampled distribution between force nodes; exact: closed-form integral over each node's tributary length")
+
+    distribution = select_distribution(aircraft_df['wing'][0], load_factor)
 
+    yk, Fk = calc_wing_load(selected_mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes, integration=integration, distribution=distribution)
+
+    with st.expander("Shear, bending and torque"):
+        internal_loads_ui(yk[None], Fk[None], aircraft_df['wing'][0], wing_length)
 
-    calc_wing_load(selected_mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes)
     # calculate_wing_load(selected_mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes)
 
     st.markdown("***")
     st.header('2️⃣ Bake composite materials')
-    st.write('Now it\'s time to choose the fiber and matrix materials. For faster processing, deselect the Show Graphs option.')
+    st.write('Now it\'s time to choose the fiber and matrix materials.')
     col1, col2 = st.columns([3, 4])
     with col1:
         st.info('Choose materials & options in the sidebar', icon="👈")
@@ -180,14 +205,20 @@ def main():
     
     with st.expander("Hooke's Law"):
         display_hooke_law_matrices()
+
+    with st.expander("Laminate stiffness (CLT)"):
+        display_laminate_stiffness()
+
+    with st.expander("Stacking sequence search"):
+        stacking_optimizer_ui(yk, Fk, aircraft_df['wing'][0])
     
     
     materials_dataframe(fiber_material_key, matrix_material_key, fibers, matrices)
 
     sigma = {'sigma1': 100, 'sigma2': 50, 'tau12': 30}  # Example values
 
-    micromechanics_results, micromechanics_latex, micromechanics_math, micromechanics_coefficients, micromechanics_theories = calculate_properties(micromech_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=show_math)
-    strength_results, strength_latex, strength_math, strength_coefficients, strength_theories = calculate_properties(strength_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=show_math)
+    micromechanics_results, micromechanics_latex, micromechanics_math, micromechanics_coefficients, micromechanics_theories = cached_calculate_properties(micromech_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=show_math)
+    strength_results, strength_latex, strength_math, strength_coefficients, strength_theories = cached_calculate_properties(strength_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=show_math)
 
     st.markdown("***")
 
@@ -207,21 +238,23 @@ def main():
 
     col1, col2 = st.columns([6, 1])
     with col1:
-        micromechanics_results, micromechanics_latex, micromechanics_math, micromechanics_coefficients, micromechanics_theories = calculate_properties(micromech_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=show_math)
+        micromechanics_results, micromechanics_latex, micromechanics_math, micromechanics_coefficients, micromechanics_theories = cached_calculate_properties(micromech_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=show_math)
         micromechanics_df = plot_properties(micromechanics_results, properties, units, micromechanics_theories)
 
     # with col2:
     st.write(micromechanics_df)
 
     if st.button("Compare all material combos", type="primary"): 
-        # fancy 3D Graph
-        st.write("3D Graph")
+        combo_cube = compare_all_combos(micromech_properties, Vvoid=Vvoid, properties=properties)
+        for tab, property_name, unit in zip(st.tabs(properties), properties, units):
+            with tab:
+                st.pyplot(plot_combo_cube(combo_cube[property_name], property_name, Vf, unit))
 
     st.markdown("***")
 
     for property_name in properties:
         if property_name in micromech_properties:
-            display_theories(property_name, micromechanics_results, micromechanics_latex, micromechanics_math, micromechanics_coefficients, fiber_material_key, fibers[fiber_material_key], matrix_material_key, matrices[matrix_material_key], Vf, Vm, Vvoid, sigma, show_individual_graphs, show_math)
+            display_theories(property_name, micromechanics_results, micromechanics_latex, micromechanics_math, micromechanics_coefficients, fiber_material_key, fibers[fiber_material_key], matrix_material_key, matrices[matrix_material_key], Vf, Vm, Vvoid, sigma, show_individual_graphs, show_math, graph_resolution)
             st.markdown("***")
     
     # def compute_ni21(ni12, E2, E1):
@@ -275,7 +308,28 @@ def main():
 
     for property_name in properties:
         if property_name in strength_properties:
-            display_theories(property_name, strength_results, strength_latex, strength_math, strength_coefficients, fiber_material_key, fibers[fiber_material_key], matrix_material_key, matrices[matrix_material_key], Vf, Vm, Vvoid, sigma, show_individual_graphs, show_math)
+            display_theories(property_name, strength_results, strength_latex, strength_math, strength_coefficients, fiber_material_key, fibers[fiber_material_key], matrix_material_key, matrices[matrix_material_key], Vf, Vm, Vvoid, sigma, show_individual_graphs, show_math, graph_resolution)
+
+    # ------ THERMAL ------
+    st.markdown("***")
+    st.header("Thermal Properties")
+
+    properties = ["alpha1", "alpha2"]
+    units = get_property_units(properties)
+
+    thermal_results, thermal_latex, thermal_math, thermal_coefficients, thermal_theories = cached_calculate_properties(thermal_properties, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=show_math)
+    col1, col2 = st.columns([6, 1])
+    with col1:
+        thermal_df = plot_properties(thermal_results, properties, units, thermal_theories)
+    st.dataframe(thermal_df)
+
+    st.markdown("***")
+
+    for property_name in properties:
+        display_theories(property_name, thermal_results, thermal_latex, thermal_math, thermal_coefficients, fiber_material_key, fibers[fiber_material_key], matrix_material_key, matrices[matrix_material_key], Vf, Vm, Vvoid, sigma, show_individual_graphs, show_math, graph_resolution)
+
+    with st.expander("Hot/wet environment"):
+        hygrothermal_ui((micromech_properties, strength_properties), fiber_material_key, matrix_material_key, Vf, Vvoid)
 
 
     st.markdown('***')
@@ -285,9 +339,14 @@ def main():
 
     st.code(f"Failure Criteria for {fiber_material_key} / {matrix_material_key}")
 
+    failure_envelope_ui()
+
     # SEE HERE CHATGPT
     # list materials created by user
     st.sidebar.write("AS-4/3501-6 Vf=0.63") 
 
+    cache_info = property_cache.info()
+    st.sidebar.caption(f"Property cache: {cache_info['hits']} hits / {cache_info['misses']} misses ({cache_info['size']}/{cache_info['maxsize']})")
+
 if __name__ == "__main__":
     main()
@@ -7,6 +7,8 @@ aircraft_presets = {
                 "manufacturer": "North American Aviation",
                 "mass": 5489.00,
                 "load_factor": 10,
+                "v_cruise": 162.0,      # [m/s]
+                "cl_max": 1.5,
                 "wingspan": 11.286,
                 "3_view": "cad/imgs/P-51_3-view.png",
                 "crop_params": [0, 1103, 1693, 1100],
@@ -44,6 +46,8 @@ aircraft_presets = {
                 "manufacturer": "Extra Aircraft",
                 "mass": 950.00,
                 "load_factor": 10,
+                "v_cruise": 105.0,      # [m/s]
+                "cl_max": 1.4,
                 "wingspan": 7.50,
                 "3_view": "cad/imgs/placeholder.png",
                 "crop_params": [0, 0, 200, 100],
@@ -78,6 +82,8 @@ aircraft_presets = {
             "manufacturer": "Glider Inc.",
             "mass": 8.500,
             "load_factor": 6,
+            "v_cruise": 15.0,       # [m/s]
+            "cl_max": 1.3,
             "wingspan": 15.000,
             "3_view": "cad/imgs/placeholder.png",
             "crop_params": [0, 0, 200, 100],
@@ -112,6 +118,8 @@ aircraft_presets = {
             "manufacturer": "Jzro & Sons, Inc.",
             "mass": 8.500e6,
             "load_factor": 1,
+            "v_cruise": 3000.0,     # [m/s]
+            "cl_max": 1.2,
             "wingspan": 15.000e5,
             # "wingspan": 15.000,
             "3_view": "cad/imgs/space_elevator.png",
@@ -7,6 +7,12 @@ import numpy as np
 import scipy.io
 import plotly.graph_objects as go
 
+from material_math.failure_kernels import evaluate_failure, MODES
+from material_math.composite_materials import initialize_composite_materials
+
+STRESS_COMPONENTS = ('sigma1', 'sigma2', 'tau12')
+STRAIN_COMPONENTS = ('epsilon1', 'epsilon2', 'gamma12')
+
 # Function to read FEA results (example for .mat files)
 def read_femap_results(file_path):
     data = scipy.io.loadmat(file_path)
@@ -20,13 +26,33 @@ def process_data(data):
     elements = data.get('elements')
     return nodes, elements
 
-# Function to calculate failure criteria (example calculation)
-def calculate_failure_criteria(elements):
+# Stack one field of every element into a single float array
+def element_array(elements, key):
+    return np.asarray([element[key] for element in elements], dtype=float)
+
+# Peak stress/strain plus every failure criterion over all element ply stresses in one array pass
+def calculate_failure_criteria(elements, strengths=None):
     results = {}
-    # Example calculation (replace with actual criteria logic)
-    results['Max_Stress_Criterion'] = max(element['stress'] for element in elements)  # Replace with actual criterion calculation
-    results['Max_Strain_Criterion'] = max(element['strain'] for element in elements)  # Replace with actual criterion calculation
-    # Add more criteria as needed
+    stress = element_array(elements, 'stress')
+    strain = element_array(elements, 'strain')
+
+    # Ply-axis [sigma1, sigma2, tau12] per element (or per element and ply); a flat array of
+    # scalar stresses (e.g. 3 elements) is not a ply stress state
+    ply_stress = stress.ndim >= 2 and stress.shape[-1] == 3
+    for name, values, components in (('Stress', stress, STRESS_COMPONENTS), ('Strain', strain, STRAIN_COMPONENTS)):
+        if values.ndim >= 2 and values.shape[-1] == 3:
+            # One peak per component, sigma1/sigma2/tau12 don't share a scale
+            for component, column in zip(components, np.moveaxis(values, -1, 0)):
+                results[f'Max |{component}|'] = np.max(np.abs(column))
+        else:
+            results[f'Max_{name}_Criterion'] = np.max(values)
+
+    if strengths is not None and ply_stress:
+        for criterion, result in evaluate_failure(stress.reshape(-1, 3), strengths).items():
+            worst = np.argmin(result['reserve'])
+            results[f'{criterion} FI'] = result['index'][worst]
+            results[f'{criterion} RF'] = result['reserve'][worst]
+            results[f'{criterion} mode'] = MODES[result['mode'][worst]]
     return results
 
 # Function to visualize FEA model
@@ -63,12 +89,18 @@ def main():
         st.write("FEA Results Data:")
         st.write(data)
 
+        # Ply strengths and Tsai-Wu coefficients of a saved composite material
+        initialize_composite_materials()
+        composites = st.session_state['composite_materials']
+        material_id = st.selectbox("Ply material", composites.index, format_func=lambda idx: f"{composites.loc[idx, 'Fiber']} / {composites.loc[idx, 'Matrix']} (Vf={composites.loc[idx, 'Vf']})")
+        strengths = composites.loc[material_id].to_dict()
+
         # Calculate failure criteria
-        failure_results = calculate_failure_criteria(elements)
+        failure_results = calculate_failure_criteria(elements, strengths)
 
         st.write("Failure Criteria Results:")
         for criterion, value in failure_results.items():
-            st.write(f"{criterion}: {value:.3f}")
+            st.write(f"{criterion}: {value}" if isinstance(value, str) else f"{criterion}: {value:.3f}")
 
         # Visualize FEA model
         st.write("FEA Model Visualization:")
@@ -0,0 +1,127 @@
+# femap/internal_loads.py
+
+# Shear, bending moment and torque along the span from nodal forces, for any number of load cases
+# and stations. Everything outboard of a station loads it, so each diagram is a reverse cumulative
+# sum over the (sorted) nodes, looked up at the stations:
+#   V(s) = sum F_k,  M(s) = sum F_k y_k - s sum F_k,  T(s) = sum F_k e_k   over y_k >= s
+# e_k is the chordwise arm from the load line (quarter chord) to the wing box center.
+# Units: F [N], y [mm] -> V [N], M [N mm], T [N mm].
+
+import numpy as np
+import matplotlib.pyplot as plt
+import streamlit as st
+
+AERODYNAMIC_CENTER = 0.25     # chord fraction of the load line
+DIAGRAMS = {"V": ("Shear", "V [kN]", 1e-3), "M": ("Bending moment", "M [kN m]", 1e-6), "T": ("Torque", "T [kN m]", 1e-6)}
+
+def outboard_sums(y, values, stations):
+    # sum of values[..., node] over nodes with y >= station, for stations[..., station], so a node on a
+    # station (the root node at the root) loads it. Nodes must be sorted along the last axis; NaN
+    # (padding) nodes count as beyond the tip.
+    y = np.where(np.isnan(y), np.inf, y)
+    total = np.concatenate([np.cumsum(values[..., ::-1], axis=-1)[..., ::-1], np.zeros(values.shape[:-1] + (1,))], axis=-1)
+    batch = np.broadcast_shapes(y.shape[:-1], values.shape[:-1], np.shape(stations)[:-1])
+    y = np.broadcast_to(y, batch + y.shape[-1:]).reshape(-1, y.shape[-1])
+    stations_flat = np.broadcast_to(stations, batch + np.shape(stations)[-1:]).reshape(len(y), -1)
+    # Row-wise searchsorted in one call: shift every row into its own band
+    finite = np.concatenate([y[np.isfinite(y)], stations_flat.ravel(), [0.0]])
+    band = np.abs(finite).max() * 2 + 1
+    offset = np.arange(len(y))[:, None] * band
+    first = np.searchsorted((np.minimum(y, band / 2) + offset).ravel(), (stations_flat + offset).ravel(), side='left')
+    first = first.reshape(stations_flat.shape) - np.arange(len(y))[:, None] * y.shape[-1]
+    total = np.broadcast_to(total, batch + total.shape[-1:]).reshape(len(y), -1)
+    return np.take_along_axis(total, first, axis=-1).reshape(batch + stations_flat.shape[-1:])
+
+def internal_loads(y, F, stations, arms=None):
+    # y, F[..., node] (wing_load_cases layout), stations[..., station] -> {"V", "M", "T": [..., station]}
+    y, F = np.asarray(y, dtype=float), np.asarray(F, dtype=float)
+    stations = np.asarray(stations, dtype=float)
+    moment_sum = outboard_sums(y, F * np.nan_to_num(y), stations)
+    shear = outboard_sums(y, F, stations)
+    torque = outboard_sums(y, F * np.asarray(arms, dtype=float), stations) if arms is not None else np.zeros_like(shear)
+    return {"V": shear, "M": moment_sum - stations * shear, "T": torque}
+
+def thickness_ratio(airfoil):
+    # NACA 4-digit "NACA-2418" -> 0.18
+    return int(airfoil[-2:]) / 100
+
+def wing_sections(wing, y, wing_length):
+    # Chord [mm], box depth [mm] and load arm [mm] at y [mm], straight taper from root to tip
+    eta = np.clip(np.asarray(y, dtype=float) / wing_length, 0.0, 1.0)
+    chord = (wing["root"] + (wing["tip"] - wing["root"]) * eta) * 1000
+    ratio = thickness_ratio(wing["airfoil_root"]) + (thickness_ratio(wing["airfoil_tip"]) - thickness_ratio(wing["airfoil_root"])) * eta
+    box_center = (wing["fwd_spar"] + 1 - wing["aft_spar"]) / 2
+    return {"chord": chord, "depth": ratio * chord, "arm": (box_center - AERODYNAMIC_CENTER) * chord}
+
+def envelope(values):
+    # [case, station] -> the value with the largest magnitude at every station, sign kept
+    values = np.atleast_2d(values)
+    return np.take_along_axis(values, np.abs(values).argmax(axis=0)[None], axis=0)[0]
+
+def size_spar(loads, depth, strengths, safety_factor=1.5):
+    # Spar caps take M as a couple over the box depth, the web takes V. Areas per cap [mm^2] from the
+    # fiber strengths (compression cap on top for positive M), web thickness [mm] from the shear strength.
+    force = np.abs(loads["M"]) / depth * safety_factor
+    upper = np.where(loads["M"] >= 0, strengths["F1C"], strengths["F1T"])
+    lower = np.where(loads["M"] >= 0, strengths["F1T"], strengths["F1C"])
+    return {
+        "upper_cap": force / upper,
+        "lower_cap": force / lower,
+        "web": np.abs(loads["V"]) / depth * safety_factor / strengths["F6"],
+    }
+
+def plot_diagrams(stations, loads, labels=None):
+    # loads {"V", "M", "T": [case, station]} -> one figure per diagram
+    figures = []
+    for key, (title, ylabel, scale) in DIAGRAMS.items():
+        fig, ax = plt.subplots()
+        for idx, values in enumerate(np.atleast_2d(loads[key])):
+            ax.plot(stations, values * scale, label=labels[idx] if labels else None)
+        ax.set_title(title)
+        ax.set_xlabel('y [mm]')
+        ax.set_ylabel(ylabel)
+        if labels:
+            ax.legend(fontsize="small")
+        figures.append(fig)
+    return figures
+
+def internal_loads_ui(y, F, wing, wing_length, composites=None, labels=None):
+    # y, F[case, node]: nodal forces of one or more load cases (wing_load_cases layout)
+    composites = st.session_state['composite_materials'] if composites is None else composites
+    col1, col2, col3 = st.columns(3)
+    n_stations = col1.number_input("Stations", min_value=10, max_value=100000, value=1000, step=100)
+    safety_factor = col2.number_input("Safety factor", min_value=1.0, value=1.5, step=0.1, key="spar_safety_factor")
+    material_id = col3.selectbox("Spar material", composites.index, index=len(composites) - 1, format_func=lambda idx: f"{composites.loc[idx, 'Fiber']} / {composites.loc[idx, 'Matrix']}", key="spar_material")
+
+    stations = np.linspace(0, wing_length, int(n_stations))
+    sections = wing_sections(wing, stations, wing_length)
+    arms = wing_sections(wing, np.nan_to_num(y), wing_length)["arm"]
+    loads = internal_loads(y, F, stations, arms)
+
+    columns = st.columns(3)
+    for column, fig in zip(columns, plot_diagrams(stations, loads, labels)):
+        column.pyplot(fig)
+
+    strengths = {key: float(composites.loc[material_id, key]) if key in composites else np.nan for key in ("F1T", "F1C", "F6")}
+    if not all(np.isfinite(value) for value in strengths.values()):
+        st.caption("Saved material has no strengths, save it again to add them.")
+        return loads
+    sizing = size_spar({key: envelope(value) for key, value in loads.items()}, sections["depth"], strengths, safety_factor)
+    fig, ax = plt.subplots()
+    ax.plot(stations, sizing["upper_cap"], label="Upper cap")
+    ax.plot(stations, sizing["lower_cap"], label="Lower cap")
+    ax.set_title("Required spar cap area (envelope of cases)")
+    ax.set_xlabel('y [mm]')
+    ax.set_ylabel('A [mm²]')
+    ax.legend()
+    col1, col2 = st.columns(2)
+    col1.pyplot(fig)
+    col2.code("\n".join([
+        f"Root V = {np.abs(loads['V'][:, 0]).max() / 1000:.2f} kN",
+        f"Root M = {np.abs(loads['M'][:, 0]).max() / 1e6:.2f} kN m",
+        f"Root T = {np.abs(loads['T'][:, 0]).max() / 1e6:.3f} kN m",
+        f"Root box depth = {sections['depth'][0]:.1f} mm",
+        f"Root cap area = {max(sizing['upper_cap'][0], sizing['lower_cap'][0]):.1f} mm²",
+        f"Root web thickness = {sizing['web'][0]:.2f} mm",
+    ]))
+    return loads
@@ -0,0 +1,114 @@
+# femap/lift_distribution.py
+
+# Spanwise lift shapes from the preset planforms (straight taper from root to tip chord), on one
+# normalized station grid eta = y / semispan shared by every preset:
+#   Schrenk: average of the planform chord and the elliptic chord of the same area
+#   Lifting line: Prandtl's monoplane equation, odd sine terms for a symmetric wing, collocated at
+#   as many stations as terms and solved densely for every preset and angle of attack at once.
+#   Camber sets the zero-lift angle (thin airfoil theory on the NACA 4-digit mean line, linear
+#   from root to tip airfoil); sweep enters through the section lift slope a0 cos(sweep).
+# Shapes are normalized to integrate to 1 over eta, so wing_load_cases scales them to n m g / 2.
+
+import numpy as np
+
+STATIONS = 201
+SECTION_LIFT_SLOPE = 2 * np.pi      # 1/rad
+MIN_LIFT_COEFFICIENT = 1e-3         # below this the lifting line circulation has no usable shape
+DISTRIBUTIONS = ["Elliptic", "Schrenk", "Lifting line"]
+
+def station_grid(stations=STATIONS):
+    return np.linspace(0.0, 1.0, stations)
+
+def naca_zero_lift_angle(code, points=400):
+    # Thin airfoil alpha_0 [rad] of a NACA 4-digit airfoil ("NACA-2418"): -1/pi int dz/dx (cos t - 1) dt
+    digits = code.split("-")[-1]
+    m, p = int(digits[0]) / 100, int(digits[1]) / 10
+    if m == 0 or p == 0:
+        return 0.0
+    theta = (np.arange(points) + 0.5) * np.pi / points
+    x = (1 - np.cos(theta)) / 2
+    slope = np.where(x < p, 2 * m / p ** 2 * (p - x), 2 * m / (1 - p) ** 2 * (p - x))
+    return float(-np.sum(slope * (np.cos(theta) - 1)) * (np.pi / points) / np.pi)
+
+def planform(wings):
+    # Preset wing dicts -> {name: array[preset]}, lengths in m, angles in rad
+    return {
+        "semispan": np.array([wing["span_wet"] for wing in wings], dtype=float),
+        "root": np.array([wing["root"] for wing in wings], dtype=float),
+        "tip": np.array([wing["tip"] for wing in wings], dtype=float),
+        "sweep": np.radians([wing["sweep_angle"] for wing in wings]),
+        "alpha0_root": np.array([naca_zero_lift_angle(wing["airfoil_root"]) for wing in wings]),
+        "alpha0_tip": np.array([naca_zero_lift_angle(wing["airfoil_tip"]) for wing in wings]),
+    }
+
+def chord(geometry, eta):
+    # c[preset, station] with straight taper
+    return geometry["root"][:, None] + (geometry["tip"] - geometry["root"])[:, None] * eta
+
+def normalize(eta, shape):
+    # Scale shape[..., station] to unit area over eta (trapezoids)
+    area = np.sum((shape[..., 1:] + shape[..., :-1]) / 2 * np.diff(eta), axis=-1)
+    return shape / area[..., None]
+
+def schrenk(wings, eta=None):
+    # Normalized lift shape [preset, station]
+    geometry = planform(wings)
+    eta = station_grid() if eta is None else eta
+    c = chord(geometry, eta)
+    area = (geometry["root"] + geometry["tip"]) / 2 * geometry["semispan"]
+    elliptic = 4 * area[:, None] / (np.pi * geometry["semispan"][:, None]) * np.sqrt(np.clip(1 - eta ** 2, 0.0, None))
+    return normalize(eta, (c + elliptic) / 2)
+
+def lifting_line(wings, alpha, eta=None, terms=None):
+    # Monoplane equation sum_n A_n sin(n t) (mu n + sin t) = mu (alpha - alpha_0) sin t, mu = a0 c / (4 b),
+    # n = 1, 3, 5, ... at collocation angles t_j in (0, pi/2]. alpha [rad] is [case], shared by every
+    # preset, or [preset, case] for each preset's own angles.
+    # -> {"shape": [preset, case, station], "CL": [preset, case], "A": [preset, term, case]}
+    geometry = planform(wings)
+    eta = station_grid() if eta is None else eta
+    alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+    alpha = np.broadcast_to(alpha, (len(wings),) + alpha.shape[-1:])
+    terms = terms or len(eta) - 1
+    n = 2 * np.arange(terms) + 1
+    theta = np.arange(1, terms + 1) * np.pi / (2 * terms)
+    span = 2 * geometry["semispan"]
+    c = chord(geometry, np.cos(theta))
+    mu = SECTION_LIFT_SLOPE * np.cos(geometry["sweep"])[:, None] * c / (4 * span[:, None])
+    alpha0 = geometry["alpha0_root"][:, None] + (geometry["alpha0_tip"] - geometry["alpha0_root"])[:, None] * np.cos(theta)
+
+    sines = np.sin(n[None, :] * theta[:, None])
+    matrix = sines[None] * (mu[..., None] * n + np.sin(theta)[None, :, None])
+    rhs = mu[..., None] * (alpha[:, None, :] - alpha0[..., None]) * np.sin(theta)[None, :, None]
+    A = np.linalg.solve(matrix, rhs)
+
+    # Circulation ~ sum A_n sin(n t) at the stations, t = arccos(eta)
+    circulation = np.einsum('sk,pkc->pcs', np.sin(np.arccos(np.clip(eta, 0.0, 1.0))[:, None] * n), A)
+    aspect_ratio = span ** 2 / ((geometry["root"] + geometry["tip"]) * geometry["semispan"])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shape = normalize(eta, circulation)
+    return {"shape": shape, "CL": np.pi * aspect_ratio[:, None] * A[:, 0], "A": A}
+
+def lifting_line_shape(wing, alpha, load_factor, eta=None):
+    # Lifting line shape of one wing at alpha [rad] for a load factor -> (shape or None, CL). The shape is
+    # normalized by its own area, so at zero lift it is undefined and with CL against the load factor's
+    # sign it would silently flip the load; both come back as None.
+    solution = lifting_line([wing], alpha, eta)
+    CL = float(solution["CL"][0, 0])
+    if abs(CL) < MIN_LIFT_COEFFICIENT or CL * load_factor < 0:
+        return None, CL
+    return solution["shape"][0, 0], CL
+
+def elliptic(wings, eta=None):
+    eta = station_grid() if eta is None else eta
+    return np.broadcast_to(normalize(eta, np.sqrt(np.clip(1 - eta ** 2, 0.0, None))), (len(wings), len(eta)))
+
+def lift_shapes(wings, alpha, eta=None):
+    # Every distribution for every preset and angle of attack -> {name: [preset, case, station]}
+    eta = station_grid() if eta is None else eta
+    alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+    cases = (len(wings), len(alpha), len(eta))
+    return {
+        "Elliptic": np.broadcast_to(elliptic(wings, eta)[:, None], cases),
+        "Schrenk": np.broadcast_to(schrenk(wings, eta)[:, None], cases),
+        "Lifting line": lifting_line(wings, alpha, eta)["shape"],
+    }
@@ -0,0 +1,163 @@
+# femap/vn_diagram.py
+
+# V-n envelopes (maneuver + gust, CS-23 style) for every aircraft preset at once, sea level.
+# Maneuver: stall lines n = rho V^2 S CL / (2 W) up to n_max at V_A and n_min at V_G, flat to V_D,
+# n_min back to 0 between V_C and V_D. Gust: n = 1 +- Kg rho U V CLa / (2 W/S), Kg = 0.88 mu / (5.3 + mu),
+# with U_de at V_C and V_D. CLa is the whole wing's from the lifting line solver.
+# Every corner of every preset goes through wing_load_cases and internal_loads in one batched pass
+# and the case with the largest root bending moment is the critical one.
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from femap.lift_distribution import station_grid, lifting_line, lift_shapes
+from femap.wing_load import wing_load_cases, G
+from femap.internal_loads import internal_loads, wing_sections
+
+RHO = 1.225                 # kg/m^3, sea level
+GUST_CRUISE = 15.24         # m/s, U_de at V_C
+GUST_DIVE = 7.62            # m/s, U_de at V_D
+DIVE_FACTOR = 1.25          # V_D / V_C
+NEGATIVE_LOAD_FACTOR = 0.4  # n_min = -0.4 n_max
+NEGATIVE_CL_RATIO = 0.6     # CL_min = -0.6 CL_max
+CORNERS = ["A", "D", "G", "C-", "D0", "gust C+", "gust C-", "gust D+", "gust D-"]
+
+def preset_arrays(presets):
+    # Aircraft preset dicts -> {name: array[preset]} in SI units
+    specs = [preset["specs"] for preset in presets]
+    wings = [preset["wing"] for preset in presets]
+    area = np.array([(wing["root"] + wing["tip"]) * wing["span_wet"] for wing in wings])
+    return {
+        "mass": np.array([spec["mass"] for spec in specs], dtype=float),
+        "n_max": np.array([spec["load_factor"] for spec in specs], dtype=float),
+        "v_cruise": np.array([spec.get("v_cruise", np.nan) for spec in specs], dtype=float),
+        "cl_max": np.array([spec.get("cl_max", np.nan) for spec in specs], dtype=float),
+        "area": area,
+        "mean_chord": area / np.array([2 * wing["span_wet"] for wing in wings]),
+        "semispan": np.array([wing["span_wet"] for wing in wings]),
+    }
+
+def lift_curve_slope(wings):
+    # Wing CLa [1/rad] from two lifting line solutions
+    CL = lifting_line(wings, [0.0, 1.0])["CL"]
+    return CL[:, 1] - CL[:, 0]
+
+def gust_load_factor(V, U, wing_loading, mean_chord, CLa, g=G):
+    mu = 2 * wing_loading / (RHO * mean_chord * CLa * g)
+    Kg = 0.88 * mu / (5.3 + mu)
+    return Kg * RHO * U * V * CLa / (2 * wing_loading)
+
+def vn_envelope(presets, g=G):
+    # Corner load cases of every preset -> {"V", "n": [preset, corner], "corners": CORNERS, "valid": [preset],
+    # "V_S", "V_A", "V_C", "V_D", "CLa", "wing_loading"} (speeds in m/s)
+    data = preset_arrays(presets)
+    CLa = lift_curve_slope([preset["wing"] for preset in presets])
+    weight = data["mass"] * g
+    wing_loading = weight / data["area"]
+    n_max, n_min = data["n_max"], -NEGATIVE_LOAD_FACTOR * data["n_max"]
+    V_S = np.sqrt(2 * wing_loading / (RHO * data["cl_max"]))
+    V_S_negative = np.sqrt(2 * wing_loading / (RHO * NEGATIVE_CL_RATIO * data["cl_max"]))
+    V_A = V_S * np.sqrt(n_max)
+    V_G = V_S_negative * np.sqrt(-n_min)
+    V_C = data["v_cruise"]
+    V_D = DIVE_FACTOR * V_C
+    # The corners only make an envelope for V_S <= V_A <= V_C <= V_D (and V_G <= V_C); other presets
+    # get NaN corners and valid = False
+    valid = (V_S <= V_A) & (V_A <= V_C) & (V_G <= V_C) & (V_C <= V_D)
+    gust_C = gust_load_factor(V_C, GUST_CRUISE, wing_loading, data["mean_chord"], CLa, g)
+    gust_D = gust_load_factor(V_D, GUST_DIVE, wing_loading, data["mean_chord"], CLa, g)
+    V = np.stack([V_A, V_D, V_G, V_C, V_D, V_C, V_C, V_D, V_D], axis=-1)
+    n = np.stack([n_max, n_max, n_min, n_min, np.zeros_like(n_max), 1 + gust_C, 1 - gust_C, 1 + gust_D, 1 - gust_D], axis=-1)
+    V, n = np.where(valid[:, None], V, np.nan), np.where(valid[:, None], n, np.nan)
+    return {"V": V, "n": n, "corners": CORNERS, "valid": valid, "V_S": V_S, "V_S_negative": V_S_negative, "V_A": V_A, "V_G": V_G,
+            "V_C": V_C, "V_D": V_D, "n_min": n_min, "CLa": CLa, "wing_loading": wing_loading}
+
+def case_angles(presets, envelope, g=G):
+    # Angle of attack [rad] of every corner from its lift coefficient, CL = alpha CLa + CL(0)
+    data = preset_arrays(presets)
+    CL0 = lifting_line([preset["wing"] for preset in presets], [0.0])["CL"][:, 0]
+    CL = 2 * envelope["n"] * data["mass"][:, None] * g / (RHO * envelope["V"] ** 2 * data["area"][:, None])
+    return (CL - CL0[:, None]) / envelope["CLa"][:, None]
+
+def corner_loads(presets, distribution="Schrenk", nodes_between_ribs=15, num_ribs=12, num_nodes=20, stations=200, g=G):
+    # Every corner of every preset through the wing-load core at once -> {"envelope", "cases", "loads":
+    # {"V", "M", "T": [preset, corner, station]}, "stations": [preset, station], "critical": [preset]}; the
+    # critical corner of a preset without a valid envelope means nothing
+    envelope = vn_envelope(presets, g)
+    wings = [preset["wing"] for preset in presets]
+    eta = station_grid()
+    if distribution == "Lifting line":
+        # Every preset solved at its own corner angles
+        shape = np.nan_to_num(lifting_line(wings, case_angles(presets, envelope, g), eta)["shape"])
+    else:
+        shape = lift_shapes(wings, [0.0], eta)[distribution][:, 0][:, None]
+    data = preset_arrays(presets)
+    wing_length = data["semispan"] * 1000
+    cases = wing_load_cases(data["mass"][:, None], envelope["n"], nodes_between_ribs, num_ribs, wing_length[:, None], num_nodes, g, "exact", (eta, shape))
+
+    station_y = np.linspace(0.0, 1.0, stations)[None] * wing_length[:, None]
+    arms = np.stack([wing_sections(wing, np.nan_to_num(cases["y"][idx]), wing_length[idx])["arm"] for idx, wing in enumerate(wings)])
+    loads = internal_loads(cases["y"], cases["F"], station_y[:, None, :], arms)
+    critical = np.nan_to_num(np.abs(loads["M"][..., 0]), nan=-1.0).argmax(axis=-1)
+    return {"envelope": envelope, "cases": cases, "loads": loads, "stations": station_y, "critical": critical}
+
+def plot_vn(envelope, index, name):
+    fig, ax = plt.subplots()
+    V_D = envelope["V_D"][index]
+    n_max = envelope["n"][index, 0]
+    n_min = envelope["n_min"][index]
+    V = np.linspace(0, envelope["V_A"][index], 100)
+    ax.plot(V, (V / envelope["V_S"][index]) ** 2, color="C0", label="Maneuver")
+    V_negative = np.linspace(0, envelope["V_G"][index], 100)
+    ax.plot(V_negative, -(V_negative / envelope["V_S_negative"][index]) ** 2, color="C0")
+    ax.plot([envelope["V_A"][index], V_D, V_D, envelope["V_C"][index], envelope["V_G"][index]], [n_max, n_max, 0, n_min, n_min], color="C0")
+    for corner in range(5, 9):
+        ax.plot([0, envelope["V"][index, corner]], [1, envelope["n"][index, corner]], "--", color="C1", label="Gust" if corner == 5 else None)
+    ax.scatter(envelope["V"][index], envelope["n"][index], color="C3", zorder=3)
+    for label, V_corner, n_corner in zip(envelope["corners"], envelope["V"][index], envelope["n"][index]):
+        ax.annotate(label, (V_corner, n_corner), textcoords="offset points", xytext=(4, 4), fontsize="small")
+    ax.axhline(0, linewidth=0.5, color="gray")
+    ax.set_title(f"V-n diagram – {name}")
+    ax.set_xlabel("V [m/s]")
+    ax.set_ylabel("n [-]")
+    ax.legend()
+    return fig
+
+def vn_ui(aircraft_presets, current_preset):
+    names = list(aircraft_presets.keys())
+    col1, col2 = st.columns([1, 2])
+    distribution = col1.radio("Lift distribution", ["Schrenk", "Lifting line", "Elliptic"], key="vn_distribution")
+    result = corner_loads(list(aircraft_presets.values()), distribution)
+    envelope, loads = result["envelope"], result["loads"]
+    index = names.index(current_preset)
+    if not envelope["valid"].all():
+        invalid = ", ".join(name for name, ok in zip(names, envelope["valid"]) if not ok)
+        st.warning(f"V-n speeds out of order (need V_S <= V_A, V_G <= V_C <= V_D) for: {invalid}; raise v_cruise or check cl_max and mass.")
+    if not envelope["valid"][index]:
+        return None
+    col2.pyplot(plot_vn(envelope, index, aircraft_presets[current_preset]["specs"]["name"]))
+
+    st.write(f"##### Corner cases – {current_preset}")
+    st.dataframe(pd.DataFrame({
+        "V [m/s]": envelope["V"][index],
+        "n": envelope["n"][index],
+        "Root V [kN]": loads["V"][index, :, 0] / 1000,
+        "Root M [kN m]": loads["M"][index, :, 0] / 1e6,
+        "Root T [kN m]": loads["T"][index, :, 0] / 1e6,
+        "Critical": np.arange(len(CORNERS)) == result["critical"][index],
+    }, index=CORNERS).style.format({"V [m/s]": "{:.1f}", "n": "{:.2f}", "Root V [kN]": "{:.2f}", "Root M [kN m]": "{:.2f}", "Root T [kN m]": "{:.3f}"}))
+
+    st.write("##### Critical case per preset")
+    rows = np.arange(len(names))
+    st.dataframe(pd.DataFrame({
+        "Corner": np.where(envelope["valid"], np.asarray(CORNERS)[result["critical"]], "–"),
+        "V [m/s]": envelope["V"][rows, result["critical"]],
+        "n": envelope["n"][rows, result["critical"]],
+        "Root M [kN m]": loads["M"][rows, result["critical"], 0] / 1e6,
+        "CLa [1/rad]": envelope["CLa"],
+    }, index=names))
+    # Critical corner of the current preset, for the wing-load inputs
+    critical = result["critical"][index]
+    return CORNERS[critical], float(envelope["n"][index, critical])
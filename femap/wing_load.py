@@ -4,56 +4,195 @@ import numpy as np
 import matplotlib.pyplot as plt
 import streamlit as st
 
-def calc_wing_load(mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes):
-    g = 9.80665
-    total_force = mass * g * load_factor / 2
-    total_nodes = int(nodes_between_ribs * num_ribs - (num_ribs - 2))  # Ensure total_nodes is an integer
-    y_positions = np.linspace(0, wing_length, total_nodes)
-    dy_position = y_positions[1] - y_positions[0]
-    p = round(wing_length / (dy_position * num_nodes))
-    st.write(f'Forces are applied every {p-1} nodes.')
-    dy = p * dy_position
-    y_interpolated = np.arange(0, num_nodes * dy, dy)
-    if y_interpolated[-1] > wing_length:
-        y_interpolated = y_interpolated[:-1]
+from femap.lift_distribution import DISTRIBUTIONS, station_grid, schrenk, lifting_line_shape
+from femap.internal_loads import internal_loads
+
+G = 9.80665     # m/s^2
+DISTRIBUTION_POINTS = 1001
+INTEGRATION_MODES = ["trapezoid", "exact"]
+
+# Load cases are arrays of (mass, load factor, nodes between ribs, rib count, span, force nodes) that
+# broadcast together; every output has the case shape in front. Cases end up with different node
+# counts, so node arrays are padded to the longest case: y is NaN and F is 0 past "nodes".
 
+def elliptic_load(y, total_force, wing_length):
+    # Running load q(y) [N/mm] = sqrt(a^2 / L (L - y)), a = 3/2 F / L, so that q integrates to F over the
+    # half span; written as a sqrt((L - y) / L) to keep the sign of negative load factors
+    total_force, wing_length = np.asarray(total_force, dtype=float), np.asarray(wing_length, dtype=float)
     a = 3 / 2 * total_force / wing_length
-    y = np.linspace(0, wing_length, 1001)
-    assumed_force_distribution = np.sqrt(a ** 2 / wing_length * (wing_length - y))
+    return a * np.sqrt(np.clip(wing_length - y, 0.0, None) / wing_length)
+
+def elliptic_load_integral(y0, y1, total_force, wing_length):
+    # Closed-form integral of elliptic_load over [y0, y1]: a / sqrt(L) * 2/3 [(L - y0)^3/2 - (L - y1)^3/2]
+    total_force, wing_length = np.asarray(total_force, dtype=float), np.asarray(wing_length, dtype=float)
+    a = 3 / 2 * total_force / wing_length
+    outboard = lambda y: np.clip(wing_length - y, 0.0, None) ** 1.5
+    return a / np.sqrt(wing_length) * 2 / 3 * (outboard(y0) - outboard(y1))
+
+def running_load(y, total_force, wing_length, distribution=None):
+    # q(y) [N/mm] of the elliptic load or of a (eta, shape) distribution
+    if distribution is None:
+        return elliptic_load(y, total_force, wing_length)
+    eta, shape = distribution
+    return total_force / wing_length * np.interp(np.asarray(y) / wing_length, eta, shape)
+
+def shape_integral(eta0, eta1, eta, shape):
+    # Exact integral over [eta0, eta1] of a piecewise-linear shape[..., station] on the 1D grid eta
+    cumulative = np.concatenate([np.zeros(shape.shape[:-1] + (1,)), np.cumsum((shape[..., 1:] + shape[..., :-1]) / 2 * np.diff(eta), axis=-1)], axis=-1)
+
+    def primitive(x):
+        segment = np.clip(np.searchsorted(eta, x, side='right') - 1, 0, len(eta) - 2)
+        t = x - eta[segment]
+        q0, q1 = np.take_along_axis(shape, segment, axis=-1), np.take_along_axis(shape, segment + 1, axis=-1)
+        return np.take_along_axis(cumulative, segment, axis=-1) + q0 * t + (q1 - q0) * t ** 2 / (2 * np.diff(eta)[segment])
+
+    return primitive(eta1) - primitive(eta0)
+
+def force_stations(nodes_between_ribs, num_ribs, wing_length, num_nodes):
+    # Spacing of the force nodes: every p-th FE node along the spar -> (p, dy [mm], node count, ok).
+    # Cases asking for more force nodes than the spar has round p to 0; those are not ok and get no nodes.
+    total_nodes = (nodes_between_ribs * num_ribs - (num_ribs - 2)).astype(int)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dy_position = wing_length / (total_nodes - 1)
+        p = np.nan_to_num(np.round(wing_length / (dy_position * num_nodes))).astype(int)
+    ok = (total_nodes >= 2) & (num_nodes >= 1) & (p >= 1) & (wing_length > 0)
+    dy = np.where(ok, p * dy_position, np.nan)
+    count = np.where(ok, num_nodes.astype(int) - ((num_nodes - 1) * dy > wing_length), 0)
+    return p, dy, count, ok
+
+def wing_load_cases(mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes, g=G, integration="trapezoid", distribution=None):
+    # Nodal forces for every case at once -> {"y", "F": [..., node], "nodes", "valid", "spacing", "dy",
+    # "total_force", "applied_force", "relative_error"}. integration: one of INTEGRATION_MODES.
+    # distribution: (eta, shape[..., station]) from femap.lift_distribution instead of the elliptic
+    # load, unit area over eta = y / wing_length; always integrated exactly over the tributary lengths.
+    # Cases with valid False can't place their force nodes: no nodes, NaN applied force and error.
+    values = [np.asarray(value, dtype=float) for value in (mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes)]
+    case_shape = np.broadcast_shapes(*(value.shape for value in values), () if distribution is None else np.shape(distribution[1])[:-1])
+    mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes = (np.broadcast_to(value, case_shape) for value in values)
+    total_force = mass * g * load_factor / 2
+    p, dy, count, ok = force_stations(nodes_between_ribs, num_ribs, wing_length, num_nodes)
+
+    index = np.arange(count.max() if count.size else 0)
+    valid = index < count[..., None]
+    y_nodes = np.where(valid, index * dy[..., None], np.nan)
+
+    if integration == "exact" or distribution is not None:
+        # Every node takes the load on its tributary length: half way to its neighbours, the last
+        # one out to the tip. The root node sits on the support, so its strip [0, dy/2] goes to the
+        # first free node (as with trapezoids) and the spar model carries the whole load.
+        last = index == count[..., None] - 1
+        y0 = np.nan_to_num(np.clip(y_nodes - dy[..., None] / 2, 0.0, None))
+        y1 = np.nan_to_num(np.where(last, wing_length[..., None], np.minimum(y_nodes + dy[..., None] / 2, wing_length[..., None])))
+        if distribution is None:
+            tributary = elliptic_load_integral(y0, y1, total_force[..., None], wing_length[..., None])
+        else:
+            eta, shape = distribution
+            shape = np.broadcast_to(shape, y_nodes.shape[:-1] + np.shape(shape)[-1:])
+            tributary = total_force[..., None] * shape_integral(y0 / wing_length[..., None], y1 / wing_length[..., None], eta, shape)
+        F_nodes = np.where(valid, tributary, 0.0)
+        if F_nodes.shape[-1] > 1:
+            lump = count > 1
+            F_nodes[..., 1] += np.where(lump, F_nodes[..., 0], 0.0)
+            F_nodes[..., 0] = np.where(lump, 0.0, F_nodes[..., 0])
+        applied_force = F_nodes.sum(axis=-1)
+    else:
+        # The assumed distribution is sampled on a fixed grid, interpolated to the nodes and
+        # integrated with trapezoids between them
+        grid = np.linspace(0, 1, DISTRIBUTION_POINTS)
+        y_grid = grid * wing_length[..., None]
+        q_grid = elliptic_load(y_grid, total_force[..., None], wing_length[..., None])
+        position = np.clip(np.nan_to_num(y_nodes) / wing_length[..., None] * (DISTRIBUTION_POINTS - 1), 0, DISTRIBUTION_POINTS - 1)
+        lower = np.minimum(position.astype(int), DISTRIBUTION_POINTS - 2)
+        weight = position - lower
+        q_nodes = np.take_along_axis(q_grid, lower, axis=-1) * (1 - weight) + np.take_along_axis(q_grid, lower + 1, axis=-1) * weight
 
-    interpolated_forces = np.interp(y_interpolated, y, assumed_force_distribution)
+        F_nodes = np.zeros(y_nodes.shape)
+        F_nodes[..., 1:] = np.where(valid[..., 1:], (q_nodes[..., 1:] + q_nodes[..., :-1]) / 2 * dy[..., None], 0.0)
+        applied_force = F_nodes.sum(axis=-1)
+    applied_force = np.where(ok, applied_force, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_error = np.abs(100 - total_force / applied_force * 100)
+    return {
+        "y": y_nodes,
+        "F": F_nodes,
+        "nodes": count,
+        "valid": ok,
+        "spacing": p - 1,
+        "dy": dy,
+        "total_force": total_force,
+        "applied_force": applied_force,
+        "relative_error": relative_error,
+    }
+
+def case_forces(cases, index=()):
+    # One case out of wing_load_cases -> (yk, Fk) trimmed to its nodes, as the Femap export expects
+    if not cases["valid"][index]:
+        raise ValueError("No force nodes for this case: more force nodes than spar nodes, or fewer than two spar nodes")
+    count = int(cases["nodes"][index])
+    return cases["y"][index][:count], cases["F"][index][:count]
+
+def plot_wing_load(cases, wing_length, index=(), distribution=None):
+    # Streamlit view of one case of wing_load_cases; distribution: (eta, shape[station]) of that case
+    yk, Fk = case_forces(cases, index)
+    total_force = cases["total_force"][index]
+    st.write(f'Forces are applied every {cases["spacing"][index]} nodes.')
+    y = np.linspace(0, wing_length, DISTRIBUTION_POINTS)
 
     col1, col2 = st.columns(2)
     with col1:
         fig1, ax1 = plt.subplots()
-        ax1.plot(y, assumed_force_distribution, label='Assumed Distribution', linewidth=2)
-        ax1.plot(y_interpolated, interpolated_forces, '--', label='Interpolated', linewidth=2)
+        ax1.plot(y, running_load(y, total_force, wing_length, distribution), label='Assumed Distribution', linewidth=2)
+        ax1.plot(yk, running_load(yk, total_force, wing_length, distribution), '--', label='Interpolated', linewidth=2)
         ax1.legend()
         ax1.set_title('Load Distribution Along the Wing')
         ax1.set_xlabel('y [mm]')
         ax1.set_ylabel('F [N/mm]')
         st.pyplot(fig1)
 
-    yk = np.zeros(len(y_interpolated))
-    Fk = np.zeros(len(y_interpolated))
-    yk[1:] = np.cumsum(np.full(len(y_interpolated)-1, dy))
-    Fk[1:] = (interpolated_forces[1:] + interpolated_forces[:-1]) / 2 * dy
-    total_interpolated_force = np.sum(Fk)
-
     with col2:
         fig2, ax2 = plt.subplots()
-        ax2.stem(yk[1:], Fk[1:], basefmt=" ")
+        ax2.stem(yk, Fk, basefmt=" ")
         ax2.set_title('Distribution of Concentrated Forces on the Front Spar')
         ax2.set_xlabel('y [mm]')
         ax2.set_ylabel('F [N]')
         st.pyplot(fig2)
 
-    st.write(f'Relative error for normal force: {abs(100 - total_force / total_interpolated_force * 100):.2f} %.')
+    st.write(f'Relative error for normal force: {cases["relative_error"][index]:.2f} %.')
+
+def select_distribution(wing, load_factor=1.0):
+    # Lift shape of the preset wing picked in the UI -> distribution for wing_load_cases (None = elliptic)
+    col1, col2 = st.columns(2)
+    name = col1.radio('Lift distribution', DISTRIBUTIONS, horizontal=True, help="Elliptic: planform-independent; Schrenk and lifting line use the preset's root/tip chord, airfoils and sweep")
+    alpha = col2.number_input('Angle of attack [°]', value=5.0, step=1.0, disabled=name != "Lifting line")
+    if name == "Elliptic":
+        return None
+    eta = station_grid()
+    if name == "Lifting line":
+        shape, CL = lifting_line_shape(wing, np.radians(alpha), load_factor, eta)
+        if shape is not None:
+            return eta, shape
+        st.warning(f"Lifting line gives CL = {CL:.3f} at {alpha:g}°, which can't carry load factor {load_factor:g}; using Schrenk instead.")
+    return eta, schrenk([wing], eta)[0]
+
+def calc_wing_load(mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes, g=G, integration="trapezoid", distribution=None):
+    cases = wing_load_cases(mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes, g, integration, distribution)
+    plot_wing_load(cases, wing_length, distribution=distribution)
 
     st.latex(fr"""
-    \sum F_l = \frac{{R_z}}{{2}} = \frac{{m_{{max}} \cdot g \cdot n}}{{2}} = \frac{{{mass} \cdot {g} \cdot {load_factor}}}{{2}} = {total_force / 1000:.2f} \, \text{{kN}}
+    \sum F_l = \frac{{R_z}}{{2}} = \frac{{m_{{max}} \cdot g \cdot n}}{{2}} = \frac{{{mass} \cdot {g} \cdot {load_factor}}}{{2}} = {cases["total_force"] / 1000:.2f} \, \text{{kN}}
     """)
 
+    return case_forces(cases)
+
+def skin_running_loads(yk, Fk, box_width, box_height, stations=None):
+    # Nodal forces [N] at yk [mm] -> CLT loads [station, 6] for the upper wing-box skin. The bending
+    # moment from internal_loads is taken by the skins as a force couple over the box height.
+    stations = yk if stations is None else np.asarray(stations, dtype=float)
+    moment = internal_loads(yk, Fk, stations)["M"]
+    loads = np.zeros((len(stations), 6))
+    loads[:, 0] = -moment / (box_height * box_width)    # upper skin in compression for positive load factors
+    return loads
+
 def wing_load_ui():
     st.header("Wing Load Calculation")
     st.write("""
@@ -73,5 +212,5 @@ def wing_load_ui():
         num_nodes = st.number_input('Number of Nodes for Force Calculation', value=20)
     
     if st.button('Calculate Load'):
-        calculate_wing_load(mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes)
+        calc_wing_load(mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes)
 
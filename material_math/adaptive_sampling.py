@@ -0,0 +1,145 @@
+# material_math/adaptive_sampling.py
+
+import numpy as np
+
+GOLDEN = (np.sqrt(5) - 1) / 2
+
+def _normalize(values):
+    # Scale each theory to its own finite range so curvature is comparable across theories
+    finite = np.where(np.isfinite(values), values, np.nan)
+    with np.errstate(all='ignore'):
+        scale = np.nanmax(finite, axis=1) - np.nanmin(finite, axis=1)
+    scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+    return values / scale[:, None]
+
+def _pair_differences(values, rtol=1e-9):
+    # Differences below rtol of the curves' size count as zero, so algebraically identical
+    # theories and curves meeting at Vf = 1 don't show up as round-off crossovers
+    rows_a, rows_b = np.triu_indices(len(values), k=1)
+    diff = values[rows_a] - values[rows_b]
+    with np.errstate(all='ignore'):
+        size = np.maximum(np.abs(values[rows_a]), np.abs(values[rows_b]))
+    return rows_a, rows_b, np.where(np.abs(diff) <= rtol * size, 0.0, diff)
+
+def _interval_scores(x, values):
+    h = np.diff(x)
+    y = _normalize(values)
+    scores = np.zeros(len(h))
+
+    # Linear interpolation error at each interior sample, measured against the chord of its neighbours
+    if len(x) > 2:
+        t = (x[1:-1] - x[:-2]) / (x[2:] - x[:-2])
+        with np.errstate(all='ignore'):
+            deviation = np.abs(y[:, 1:-1] - (y[:, :-2] + (y[:, 2:] - y[:, :-2]) * t))
+        deviation = np.where(np.isfinite(deviation), deviation, 0.0).max(axis=0)
+        scores[:-1] = np.maximum(scores[:-1], deviation)
+        scores[1:] = np.maximum(scores[1:], deviation)
+
+    # Intervals where a curve blows up or two theories cross keep getting split while they're wide
+    finite = np.isfinite(y)
+    blow_up = (finite[:, :-1] != finite[:, 1:]).any(axis=0)
+    _, _, diff = _pair_differences(y)
+    crossing = (diff[:, :-1] * diff[:, 1:] < 0).any(axis=0) if len(diff) else np.zeros(len(h), dtype=bool)
+    scores = np.where(blow_up | crossing, np.maximum(scores, h), scores)
+    return scores
+
+def _find_crossovers(evaluate, x, values, theory_names, tol):
+    rows_a, rows_b, diff = _pair_differences(values)
+    pair_idx, interval_idx = np.nonzero(diff[:, :-1] * diff[:, 1:] < 0)
+    if len(pair_idx) == 0:
+        return [], 0
+
+    # Illinois regula falsi, all brackets advanced together with one batched evaluation per step
+    a, b = x[interval_idx], x[interval_idx + 1]
+    fa, fb = diff[pair_idx, interval_idx], diff[pair_idx, interval_idx + 1]
+    side = np.zeros(len(a), dtype=int)
+    evaluations = 0
+    for _ in range(100):
+        c = np.where(fb != fa, b - fb * (b - a) / (fb - fa), (a + b) / 2)
+        c_values = evaluate(c)
+        evaluations += len(c)
+        fc = c_values[rows_a[pair_idx], np.arange(len(c))] - c_values[rows_b[pair_idx], np.arange(len(c))]
+
+        left = fa * fc < 0
+        fa = np.where(~left, fc, np.where(side == -1, fa / 2, fa))
+        fb = np.where(left, fc, np.where(side == 1, fb / 2, fb))
+        a, b = np.where(left, a, c), np.where(left, c, b)
+        side = np.where(left, -1, 1)
+        if np.all((b - a < tol) | (fc == 0)):
+            break
+
+    roots = (a + b) / 2
+    root_values = evaluate(roots)
+    evaluations += len(roots)
+    crossovers = [
+        (theory_names[rows_a[pair]], theory_names[rows_b[pair]], float(root), float(root_values[rows_a[pair], idx]))
+        for idx, (pair, root) in enumerate(zip(pair_idx, roots))
+    ]
+    return sorted(crossovers, key=lambda crossover: crossover[2]), evaluations
+
+def _find_maxima(evaluate, x, values, theory_names, tol):
+    maxima = {}
+    evaluations = 0
+    finite = np.where(np.isfinite(values), values, -np.inf)
+    best = finite.argmax(axis=1)
+
+    # Interior maxima with finite neighbours get a golden-section refinement, all theories at once
+    interior = np.array([
+        0 < idx < len(x) - 1 and np.isfinite(finite[theory, idx - 1]) and np.isfinite(finite[theory, idx + 1])
+        for theory, idx in enumerate(best)
+    ], dtype=bool)
+    theories = np.nonzero(interior)[0]
+    if len(theories):
+        a, b = x[best[theories] - 1], x[best[theories] + 1]
+        for _ in range(100):
+            c = b - GOLDEN * (b - a)
+            d = a + GOLDEN * (b - a)
+            points = evaluate(np.concatenate([c, d]))
+            evaluations += 2 * len(c)
+            fc = points[theories, np.arange(len(c))]
+            fd = points[theories, len(c) + np.arange(len(c))]
+            b = np.where(fc > fd, d, b)
+            a = np.where(fc > fd, a, c)
+            if np.all(b - a < tol):
+                break
+        peaks = (a + b) / 2
+        peak_values = evaluate(peaks)
+        evaluations += len(peaks)
+        for idx, theory in enumerate(theories):
+            maxima[theory_names[theory]] = (float(peaks[idx]), float(peak_values[theory, idx]))
+
+    for theory, idx in enumerate(best):
+        if theory_names[theory] not in maxima and np.isfinite(finite[theory, idx]):
+            maxima[theory_names[theory]] = (float(x[idx]), float(values[theory, idx]))
+    return maxima, evaluations
+
+def adaptive_sample(evaluate, theory_names, budget=200, lo=0.0, hi=1.0, initial=17, batch=16, split_fraction=0.25, min_width=1e-6, tol=1e-10):
+    # evaluate(Vf_array) -> values[theory, len(Vf_array)], e.g. engine.evaluate_entry bound to one material pair.
+    # Samples are added where curves bend, blow up or cross until the point budget is used,
+    # then crossover and maximum locations are solved to tol on top of the samples.
+    # Every round splits the top split_fraction of the intervals (at least batch), so the number of
+    # rounds only grows with log(budget); midpoints are inserted in place, x stays sorted.
+    x = np.linspace(lo, hi, min(initial, budget))
+    with np.errstate(all='ignore'):
+        values = evaluate(x)
+        while len(x) < budget:
+            scores = _interval_scores(x, values)
+            scores[np.diff(x) < 2 * min_width] = 0
+            n_new = min(max(batch, int(split_fraction * len(scores))), budget - len(x), np.count_nonzero(scores > 0))
+            if n_new == 0:
+                break
+            split = np.sort(np.argpartition(-scores, n_new - 1)[:n_new])
+            new_x = (x[split] + x[split + 1]) / 2
+            x = np.insert(x, split + 1, new_x)
+            values = np.insert(values, split + 1, evaluate(new_x), axis=1)
+
+        crossovers, crossover_evaluations = _find_crossovers(evaluate, x, values, theory_names, tol)
+        maxima, maximum_evaluations = _find_maxima(evaluate, x, values, theory_names, tol)
+
+    return {
+        "Vf": x,
+        "values": values,
+        "crossovers": crossovers,
+        "maxima": maxima,
+        "evaluations": len(x) + crossover_evaluations + maximum_evaluations,
+    }
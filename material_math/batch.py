@@ -0,0 +1,57 @@
+# material_math/batch.py
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from material_math.material_table import MaterialTable, fiber_table, matrix_table, evaluate_property_by_id
+
+CUBE_DIMS = ("theory", "fiber", "matrix", "Vf")
+
+def compare_all_combos(category, fibers=None, matrices=None, Vf_grid=None, Vvoid=0.0, properties=None):
+    # Every fiber x matrix x theory x Vf in one broadcast pass per theory, materials addressed by id.
+    # Defaults to the built-in catalog tables; pass fibers/matrices dicts to compare another catalog.
+    # Returns {property: {"values": array[theory, fiber, matrix, Vf], "dims": CUBE_DIMS, "coords": {...}}}
+    Vf_grid = np.linspace(0, 1, 101) if Vf_grid is None else np.asarray(Vf_grid, dtype=float)
+    tables = None if fibers is None and matrices is None else (MaterialTable(fibers), MaterialTable(matrices))
+    fibers_table, matrices_table = tables or (fiber_table, matrix_table)
+    fiber_ids = np.arange(len(fibers_table))[:, None, None]
+    matrix_ids = np.arange(len(matrices_table))[None, :, None]
+
+    cube = {}
+    for property_name in (properties or category.keys()):
+        theory_names, values = evaluate_property_by_id(category, property_name, fiber_ids, matrix_ids, Vf_grid[None, None, :], Vvoid, tables)
+        cube[property_name] = {
+            "values": values,
+            "dims": CUBE_DIMS,
+            "coords": {"theory": theory_names, "fiber": fibers_table.names, "matrix": matrices_table.names, "Vf": Vf_grid},
+        }
+    return cube
+
+def cube_to_dataframe(property_cube):
+    # Long format, one row per (theory, fiber, matrix, Vf)
+    coords = property_cube["coords"]
+    index = pd.MultiIndex.from_product([coords[dim] for dim in CUBE_DIMS], names=CUBE_DIMS)
+    return pd.DataFrame({"value": property_cube["values"].ravel()}, index=index).reset_index()
+
+def plot_combo_cube(property_cube, property_name, Vf, unit=""):
+    # 3D bars of the theory-averaged property at the Vf closest to the current one
+    coords = property_cube["coords"]
+    Vf_index = np.abs(coords["Vf"] - Vf).argmin()
+    with np.errstate(all='ignore'):
+        average = np.nanmean(property_cube["values"][:, :, :, Vf_index], axis=0)
+
+    fiber_idx, matrix_idx = np.meshgrid(np.arange(len(coords["fiber"])), np.arange(len(coords["matrix"])), indexing='ij')
+    heights = np.nan_to_num(average.ravel())
+
+    fig = plt.figure(figsize=(12, 9))
+    ax = fig.add_subplot(projection='3d')
+    colors = plt.get_cmap('viridis')(heights / heights.max() if heights.max() > 0 else heights)
+    ax.bar3d(fiber_idx.ravel(), matrix_idx.ravel(), np.zeros_like(heights), 0.6, 0.6, heights, color=colors, shade=True)
+
+    ax.set_xticks(np.arange(len(coords["fiber"])) + 0.3)
+    ax.set_xticklabels(coords["fiber"], rotation=45, ha='right', fontsize=8)
+    ax.set_yticks(np.arange(len(coords["matrix"])) + 0.3)
+    ax.set_yticklabels(coords["matrix"], rotation=-15, ha='left', fontsize=8)
+    ax.set_zlabel(f"{property_name} [{unit}]")
+    ax.set_title(f"{property_name} averaged over theories at Vf = {coords['Vf'][Vf_index]:.2f}")
+    return fig
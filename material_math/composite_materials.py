@@ -1,8 +1,25 @@
 # material_math/composite_materials.py
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from material_math.failure_kernels import tsai_wu_coefficients, TSAI_WU_KEYS
+
+STRENGTH_KEYS = ['F1T', 'F1C', 'F2T', 'F2C', 'F6']
+THERMAL_KEYS = ['alpha1', 'alpha2']     # µε/°C
+SOLID_KEYS = ['E3', 'nu23', 'G13', 'G23']  # 3D constants for solid elements
+
+def first_value(values):
+    # First theory that produced a number; unsupported theories come back as None
+    return next((float(value) for value in values if value is not None and np.isfinite(value)), np.nan)
+
+def strength_columns(strengths, F12_model):
+    # Strengths plus their Tsai-Wu coefficients, computed once when the material is saved
+    strengths = {key: strengths[key] for key in STRENGTH_KEYS}
+    coefficients = tsai_wu_coefficients(strengths, F12_model)
+    return {**strengths, 'F12 model': F12_model, **{key: float(coefficients[key]) for key in TSAI_WU_KEYS}}
+
 def initialize_composite_materials():
     if 'composite_materials' not in st.session_state:
         default_material = {
@@ -15,11 +32,18 @@ def initialize_composite_materials():
             'E2': 50.0,
             'nu12': 0.3,
             'nu21': 0.15,
-            'G12': 25.0
+            'G12': 25.0,
+            'E3': 50.0,
+            'nu23': 0.45,
+            'G13': 25.0,
+            'G23': 17.0,
+            **strength_columns({'F1T': 1500.0, 'F1C': 1200.0, 'F2T': 50.0, 'F2C': 200.0, 'F6': 70.0}, 'Tsai-Hahn'),
+            'alpha1': 4.0,
+            'alpha2': 8.0,
         }
         st.session_state['composite_materials'] = pd.DataFrame([default_material])
 
-def add_composite_material(fiber, matrix, Vf, Vm, Vvoid, properties):
+def add_composite_material(fiber, matrix, Vf, Vm, Vvoid, properties, strengths=None, F12_model='Tsai-Hahn', thermal=None):
     new_material = {
         'Fiber': fiber,
         'Matrix': matrix,
@@ -30,8 +54,13 @@ def add_composite_material(fiber, matrix, Vf, Vm, Vvoid, properties):
         'E2': properties['E2'][0],
         'nu12': properties['nu12'][0],
         'nu21': properties['nu21'][0],
-        'G12': properties['G12'][0]
+        'G12': properties['G12'][0],
+        **{key: first_value(properties[key]) for key in SOLID_KEYS if key in properties},
     }
+    if strengths is not None:
+        new_material.update(strength_columns({key: first_value(strengths[key]) for key in STRENGTH_KEYS}, F12_model))
+    if thermal is not None:
+        new_material.update({key: first_value(thermal[key]) for key in THERMAL_KEYS})
     new_material_df = pd.DataFrame([new_material])
     st.session_state['composite_materials'] = pd.concat([st.session_state['composite_materials'], new_material_df], ignore_index=True)
 
@@ -0,0 +1,50 @@
+# material_math/engine.py
+
+from collections import defaultdict
+
+import numpy as np
+from material_math.registry import get_registry
+from material_math.material_table import known_params
+
+def as_float_material(material):
+    # None holes and absent keys read as NaN, so array math propagates them instead of raising
+    return defaultdict(lambda: np.nan, {key: (np.nan if value is None else value) for key, value in material.items() if not isinstance(value, str)})
+
+def broadcast_shape(f, m, Vf, Vvoid):
+    arrays = [np.asarray(value) for value in (*f.values(), *m.values(), Vf, Vvoid)]
+    return np.broadcast_shapes(*(array.shape for array in arrays))
+
+def missing_mask(theory, f, m, shape):
+    # Where a parameter the theory reads is missing, the result is NaN whatever the formula's branches do
+    missing = np.zeros(shape, dtype=bool)
+    for param in theory["params"] & known_params:
+        missing = missing | np.isnan(f[param] if param in f else m[param])
+    return missing
+
+def evaluate_theory(theory, f, m, Vf, Vvoid=0.0):
+    # theory is a compiled registry entry
+    f = as_float_material(f)
+    m = as_float_material(m)
+    Vf = np.asarray(Vf, dtype=float)
+    Vvoid = np.asarray(Vvoid, dtype=float)
+    Vm = 1 - Vf
+    shape = broadcast_shape(f, m, Vf, Vvoid)
+
+    missing = missing_mask(theory, f, m, shape)
+
+    with np.errstate(all='ignore'):
+        coefficients = theory["coefficients"](f, m, Vf, Vm)
+        result = theory["formula"](f, m, Vf, Vm, Vvoid, coefficients)
+
+    return np.where(missing, np.nan, np.broadcast_to(np.asarray(result, dtype=float), shape))
+
+def evaluate_entry(entry, f, m, Vf, Vvoid=0.0):
+    # One array pass per theory of a registry property entry -> values[theory, *shape]
+    return np.stack([evaluate_theory(entry["theories"][theory], f, m, Vf, Vvoid) for theory in entry["theory_names"]])
+
+def evaluate_property(category, property_name, f, m, Vf, Vvoid=0.0):
+    entry = get_registry(category)[property_name]
+    return entry["theory_names"], evaluate_entry(entry, f, m, Vf, Vvoid)
+
+def evaluate_category(category, f, m, Vf, Vvoid=0.0):
+    return {property_name: evaluate_property(category, property_name, f, m, Vf, Vvoid) for property_name in category}
@@ -0,0 +1,82 @@
+# material_math/failure_envelope.py
+
+# Failure envelopes in the σ1–σ2 and σ2–τ12 planes. Every criterion's reserve factor is the exact
+# load multiplier along a radial stress path, so one kernel call over all ray directions gives the
+# whole envelope. Envelopes are cached per (material strengths, criterion, plane, rays).
+
+import numpy as np
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from material_math.failure_kernels import failure_kernels, TSAI_WU_KEYS
+from material_math.composite_materials import STRENGTH_KEYS
+from material_math.property_cache import PropertyCache
+
+PLANES = {
+    "σ1–σ2": (0, 1),
+    "σ2–τ12": (1, 2),
+}
+PLANE_LABELS = {
+    "σ1–σ2": (r"$\sigma_1$ [MPa]", r"$\sigma_2$ [MPa]"),
+    "σ2–τ12": (r"$\sigma_2$ [MPa]", r"$\tau_{12}$ [MPa]"),
+}
+N_RAYS = 3600
+
+envelope_cache = PropertyCache(128)
+
+def failure_envelope(strengths, criterion, plane="σ1–σ2", n_rays=N_RAYS):
+    # -> {"x", "y", "mode"} along n_rays radial load paths; open (unbounded) directions are NaN
+    axes = PLANES[plane]
+    theta = np.linspace(0, 2 * np.pi, n_rays, endpoint=False)
+    directions = np.zeros((n_rays, 3))
+    directions[:, axes[0]] = np.cos(theta)
+    directions[:, axes[1]] = np.sin(theta)
+    result = failure_kernels[criterion](directions, strengths)
+    reserve = np.where(np.isfinite(result["reserve"]), result["reserve"], np.nan)
+    return {
+        "x": directions[:, axes[0]] * reserve,
+        "y": directions[:, axes[1]] * reserve,
+        "mode": result["mode"],
+    }
+
+def material_envelope(material, criterion, plane="σ1–σ2", n_rays=N_RAYS):
+    # material: a saved composite material row; stored Tsai-Wu coefficients are used as saved
+    strengths = {key: float(material[key]) for key in (*STRENGTH_KEYS, *TSAI_WU_KEYS) if key in material}
+    key = (tuple(sorted(strengths.items())), criterion, plane, n_rays)
+    envelope = envelope_cache.get(key)
+    if envelope is None:
+        envelope = failure_envelope(strengths, criterion, plane, n_rays)
+        envelope_cache.put(key, envelope)
+    return envelope
+
+def plot_failure_envelopes(composites, material_ids, criteria, plane="σ1–σ2"):
+    fig, ax = plt.subplots()
+    for material_id in material_ids:
+        material = composites.loc[material_id]
+        for criterion in criteria:
+            envelope = material_envelope(material, criterion, plane)
+            closed = np.append(np.arange(len(envelope["x"])), 0)
+            ax.plot(envelope["x"][closed], envelope["y"][closed], label=f"{material['Fiber']}/{material['Matrix']} – {criterion}")
+    ax.axhline(0, linewidth=0.5, color="gray")
+    ax.axvline(0, linewidth=0.5, color="gray")
+    ax.set_xlabel(PLANE_LABELS[plane][0])
+    ax.set_ylabel(PLANE_LABELS[plane][1])
+    ax.set_title(f"Failure envelopes ({plane})")
+    ax.legend(fontsize="small")
+    return fig
+
+def failure_envelope_ui(composites=None):
+    composites = st.session_state['composite_materials'] if composites is None else composites
+    has_strengths = [idx for idx in composites.index if all(key in composites and np.isfinite(composites.loc[idx, key]) for key in STRENGTH_KEYS)]
+    if not has_strengths:
+        st.caption("No saved material has strengths yet.")
+        return
+    col1, col2, col3 = st.columns([3, 3, 2])
+    with col1:
+        material_ids = st.multiselect("Materials", has_strengths, default=has_strengths[-1:], format_func=lambda idx: f"{idx}: {composites.loc[idx, 'Fiber']} / {composites.loc[idx, 'Matrix']} (Vf={composites.loc[idx, 'Vf']})")
+    with col2:
+        criteria = st.multiselect("Criteria", list(failure_kernels.keys()), default=list(failure_kernels.keys()))
+    with col3:
+        plane = st.radio("Plane", list(PLANES.keys()), horizontal=True)
+    if material_ids and criteria:
+        st.pyplot(plot_failure_envelopes(composites, material_ids, criteria, plane))
@@ -0,0 +1,107 @@
+# material_math/failure_kernels.py
+
+# Array versions of failure_criteria in formulas.py. Stresses are ply-axis (..., 3) arrays
+# [sigma1, sigma2, tau12] in MPa, from FE results or CLT; strengths are F1T, F1C, F2T, F2C, F6
+# (positive magnitudes, MPa) as scalars or arrays broadcasting against stress[..., 0].
+# Every kernel returns {"index": failure index, "mode": governing mode, "reserve": reserve factor}.
+# Intentional differences from failure_criteria, which shows one strength per direction:
+#   Maximum Stress and Tsai-Hill pick the tension or compression strength by the sign of each stress,
+#   so they match failure_criteria for tensile stresses and use F1C/F2C otherwise.
+#   Strengths are always F1T/F1C/F2T/F2C/F6; failure_criteria's F['F1'], F['F2'] (Maximum Stress) and
+#   F['F1t'], F['F2t'] (Tsai-Hill) are strengths, while F1, F2 here are the Tsai-Wu linear coefficients.
+
+import numpy as np
+
+MODES = ("fiber", "transverse", "shear")
+
+def _components(stress):
+    stress = np.asarray(stress, dtype=float)
+    return stress[..., 0], stress[..., 1], stress[..., 2]
+
+def _strengths(strengths):
+    return tuple(np.asarray(strengths[key], dtype=float) for key in ("F1T", "F1C", "F2T", "F2C", "F6"))
+
+def _governing(*terms):
+    return np.argmax(np.stack(np.broadcast_arrays(*terms), axis=-1), axis=-1)
+
+def max_stress(stress, strengths):
+    sigma1, sigma2, tau12 = _components(stress)
+    F1T, F1C, F2T, F2C, F6 = _strengths(strengths)
+    ratios = np.stack(np.broadcast_arrays(
+        np.where(sigma1 >= 0, sigma1 / F1T, -sigma1 / F1C),
+        np.where(sigma2 >= 0, sigma2 / F2T, -sigma2 / F2C),
+        np.abs(tau12) / F6,
+    ), axis=-1)
+    index = ratios.max(axis=-1)
+    with np.errstate(divide='ignore'):
+        reserve = 1 / index
+    return {"index": index, "mode": ratios.argmax(axis=-1), "reserve": reserve}
+
+TSAI_WU_KEYS = ("F1", "F2", "F11", "F22", "F66", "F12")
+
+# Interaction term F12 from F11, F22
+F12_MODELS = {
+    "Tsai-Hahn": lambda F11, F22: -0.5 * np.sqrt(F11 * F22),
+    "Hoffman": lambda F11, F22: -0.5 * F11,
+    "Zero": lambda F11, F22: np.zeros_like(F11 * F22),
+}
+
+def tsai_wu_coefficients(strengths, F12_model="Tsai-Hahn"):
+    F1T, F1C, F2T, F2C, F6 = _strengths(strengths)
+    F11 = 1 / (F1T * F1C)
+    F22 = 1 / (F2T * F2C)
+    return {
+        "F1": 1 / F1T - 1 / F1C,
+        "F2": 1 / F2T - 1 / F2C,
+        "F11": F11,
+        "F22": F22,
+        "F66": 1 / F6 ** 2,
+        "F12": F12_MODELS[F12_model](F11, F22),
+    }
+
+def tsai_wu(stress, strengths, coefficients=None):
+    # Precomputed coefficients (passed in, or already part of strengths as on a saved composite
+    # material) skip straight to the multiply-adds
+    sigma1, sigma2, tau12 = _components(stress)
+    if coefficients is None:
+        coefficients = strengths if all(key in strengths for key in TSAI_WU_KEYS) else tsai_wu_coefficients(strengths)
+    F = {key: np.asarray(coefficients[key], dtype=float) for key in TSAI_WU_KEYS}
+    linear = F["F1"] * sigma1 + F["F2"] * sigma2
+    quadratic = F["F11"] * sigma1 ** 2 + F["F22"] * sigma2 ** 2 + 2 * F["F12"] * sigma1 * sigma2 + F["F66"] * tau12 ** 2
+    # Load multiplier R with quadratic R^2 + linear R = 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        reserve = np.where(
+            quadratic > 0,
+            2 / (linear + np.sqrt(linear ** 2 + 4 * quadratic)),
+            np.where(linear > 0, 1 / linear, np.inf),
+        )
+    mode = _governing(
+        np.abs(F["F1"] * sigma1 + F["F11"] * sigma1 ** 2),
+        np.abs(F["F2"] * sigma2 + F["F22"] * sigma2 ** 2),
+        F["F66"] * tau12 ** 2,
+    )
+    return {"index": linear + quadratic, "mode": mode, "reserve": reserve}
+
+def tsai_hill(stress, strengths):
+    # Tension or compression strength picked by the sign of each stress
+    sigma1, sigma2, tau12 = _components(stress)
+    F1T, F1C, F2T, F2C, F6 = _strengths(strengths)
+    X = np.where(sigma1 >= 0, F1T, F1C)
+    Y = np.where(sigma2 >= 0, F2T, F2C)
+    fiber = (sigma1 / X) ** 2
+    transverse = (sigma2 / Y) ** 2
+    shear = (tau12 / F6) ** 2
+    index = fiber - sigma1 * sigma2 / X ** 2 + transverse + shear
+    with np.errstate(divide='ignore', invalid='ignore'):
+        reserve = 1 / np.sqrt(index)
+    return {"index": index, "mode": _governing(fiber, transverse, shear), "reserve": reserve}
+
+failure_kernels = {
+    "Maximum Stress": max_stress,
+    "Tsai-Wu": tsai_wu,
+    "Tsai-Hill": tsai_hill,
+}
+
+def evaluate_failure(stress, strengths, criteria=None):
+    # {criterion: {"index", "mode", "reserve"}} for every point in one pass per criterion
+    return {name: failure_kernels[name](stress, strengths) for name in (criteria or failure_kernels)}
@@ -199,6 +199,105 @@ micromech_properties = {
             )(fetch_composite_properties(f, m, Vf, Vm))
         },
     },
+    "E3": {
+        "name": "Young's through-thickness modulus",
+        "help": "Transversely isotropic ply: same as the in-plane transverse modulus E2",
+        "unit": "GPa",
+        "Transverse isotropy (IROM)": {
+            "formula": lambda f, m, Vf, Vm: (f['E2f'] * m['Em']) / (Vf * m['Em'] + Vm * f['E2f']),
+            "latex": r"E_3 = E_2 = \frac{E_{2f} \cdot E_m}{V_f \cdot E_m + V_m \cdot E_{2f}}",
+            "math": lambda f, m, Vf, Vm: f"E_3 = \\frac{{{f['E2f']} \\cdot {m['Em']}}}{{{Vf:.3f} \\cdot {m['Em']} + {Vm:.3f} \\cdot {f['E2f']}}}"
+        },
+        "Transverse isotropy (Chamis)": {
+            "formula": lambda f, m, Vf, Vm: m['Em'] / (1 - np.sqrt(Vf) * (1 - m['Em'] / f['E2f'])),
+            "latex": r"E_3 = E_2 = \frac{E_m}{1 - \sqrt{V_f} \left( 1 - \frac{E_m}{E_{2f}} \right)}",
+            "math": lambda f, m, Vf, Vm: f"E_3 = \\frac{{{m['Em']}}}{{1 - \\sqrt{{{Vf:.3f}}} \\left( 1 - \\frac{{{m['Em']}}}{{{f['E2f']}}} \\right)}}"
+        },
+    },
+    "G13": {
+        "name": "Transverse shear modulus (1-3)",
+        "help": "Transversely isotropic ply: same as the in-plane shear modulus G12",
+        "unit": "GPa",
+        "Transverse isotropy (IROM)": {
+            "formula": lambda f, m, Vf, Vm: (f['G12f'] * m['Gm']) / (Vf * m['Gm'] + Vm * f['G12f']),
+            "latex": r"G_{13} = G_{12} = \frac{G_{12f} G_m}{V_f G_m + V_m G_{12f}}",
+            "math": lambda f, m, Vf, Vm: f"G_{{13}} = \\frac{{{f['G12f']} \\cdot {m['Gm']}}}{{{Vf:.3f} \\cdot {m['Gm']} + {Vm:.3f} \\cdot {f['G12f']}}}"
+        },
+        "Transverse isotropy (Chamis)": {
+            "formula": lambda f, m, Vf, Vm: m['Gm'] / (1 - np.sqrt(Vf) * (1 - m['Gm'] / f['G12f'])),
+            "latex": r"G_{13} = G_{12} = \frac{G_m}{1 - \sqrt{V_f} \left( 1 - \frac{G_m}{G_{12f}} \right)}",
+            "math": lambda f, m, Vf, Vm: f"G_{{13}} = \\frac{{{m['Gm']}}}{{1 - \\sqrt{{{Vf:.3f}}} \\left( 1 - \\frac{{{m['Gm']}}}{{{f['G12f']}}} \\right)}}"
+        },
+    },
+    "G23": {
+        "name": "Transverse shear modulus (2-3)",
+        "help": "Shear stiffness in the plane perpendicular to the fibers",
+        "unit": "GPa",
+        "IROM": {
+            "formula": lambda f, m, Vf, Vm: (f['G23f'] * m['Gm']) / (Vf * m['Gm'] + Vm * f['G23f']),
+            "latex": r"G_{23} = \frac{G_{23f} G_m}{V_f G_m + V_m G_{23f}}",
+            "math": lambda f, m, Vf, Vm: f"G_{{23}} = \\frac{{{f['G23f']} \\cdot {m['Gm']}}}{{{Vf:.3f} \\cdot {m['Gm']} + {Vm:.3f} \\cdot {f['G23f']}}}"
+        },
+        "Chamis": {
+            "formula": lambda f, m, Vf, Vm: m['Gm'] / (1 - np.sqrt(Vf) * (1 - m['Gm'] / f['G23f'])),
+            "latex": r"G_{23} = \frac{G_m}{1 - \sqrt{V_f} \left( 1 - \frac{G_m}{G_{23f}} \right)}",
+            "math": lambda f, m, Vf, Vm: f"G_{{23}} = \\frac{{{m['Gm']}}}{{1 - \\sqrt{{{Vf:.3f}}} \\left( 1 - \\frac{{{m['Gm']}}}{{{f['G23f']}}} \\right)}}"
+        },
+        "Stress partitioning": {
+            "formula": lambda f, m, Vf, Vm, eta23: m['Gm'] * (Vf + eta23 * Vm) / (eta23 * Vm + Vf * m['Gm'] / f['G23f']),
+            "latex": r"G_{23} = G_m \frac{V_f + \eta_{23} V_m}{\eta_{23} V_m + V_f \frac{G_m}{G_{23f}}}",
+            "math": lambda f, m, Vf, Vm, eta23: f"G_{{23}} = {m['Gm']} \\frac{{{Vf:.3f} + {eta23:.3f} \\cdot {Vm:.3f}}}{{{eta23:.3f} \\cdot {Vm:.3f} + {Vf:.3f} \\cdot \\frac{{{m['Gm']}}}{{{f['G23f']}}}}}",
+            "coefficients": {
+                "eta23": {
+                    "formula": lambda f, m: (3 - 4 * m['nim'] + m['Gm'] / f['G23f']) / (4 * (1 - m['nim'])),
+                    "latex": r"\eta_{23} = \frac{3 - 4\nu_m + \frac{G_m}{G_{23f}}}{4(1 - \nu_m)}"
+                }
+            }
+        },
+    },
+    "nu23": {
+        "name": "Poisson's transverse ratio",
+        "help": "Ratio of through-thickness to transverse strain",
+        "unit": "-",
+        "Transverse isotropy": {
+            "formula": lambda f, m, Vf, Vm, E2, G23: E2 / (2 * G23) - 1,
+            "latex": r"\nu_{23} = \frac{E_2}{2 G_{23}} - 1",
+            "math": lambda f, m, Vf, Vm, E2, G23: f"\\nu_{{23}} = \\frac{{{E2:.3f}}}{{2 \\cdot {G23:.3f}}} - 1",
+            "coefficients": {
+                "E2": {
+                    "formula": lambda f, m, Vf, Vm: m['Em'] / (1 - np.sqrt(Vf) * (1 - m['Em'] / f['E2f'])),
+                    "latex": r"E_2 = \frac{E_m}{1 - \sqrt{V_f} \left( 1 - \frac{E_m}{E_{2f}} \right)}"
+                },
+                "G23": {
+                    "formula": lambda f, m, Vf, Vm: m['Gm'] / (1 - np.sqrt(Vf) * (1 - m['Gm'] / f['G23f'])),
+                    "latex": r"G_{23} = \frac{G_m}{1 - \sqrt{V_f} \left( 1 - \frac{G_m}{G_{23f}} \right)}"
+                }
+            }
+        },
+        "Chamis": {
+            "formula": lambda f, m, Vf, Vm, nu23f, E2, E1, nu12: Vf * nu23f + Vm * (2 * m['nim'] - nu12 * E2 / E1),
+            "latex": r"\nu_{23} = V_f \nu_{23f} + V_m \left( 2\nu_m - \nu_{12} \frac{E_2}{E_1} \right)",
+            "math": lambda f, m, Vf, Vm, nu23f, E2, E1, nu12: f"\\nu_{{23}} = {Vf:.3f} \\cdot {nu23f:.3f} + {Vm:.3f} \\left( 2 \\cdot {m['nim']} - {nu12:.3f} \\frac{{{E2:.3f}}}{{{E1:.3f}}} \\right)",
+            "coefficients": {
+                "nu23f": {
+                    "formula": lambda f, m: f['E2f'] / (2 * f['G23f']) - 1,
+                    "latex": r"\nu_{23f} = \frac{E_{2f}}{2 G_{23f}} - 1"
+                },
+                "E2": {
+                    "formula": lambda f, m, Vf, Vm: m['Em'] / (1 - np.sqrt(Vf) * (1 - m['Em'] / f['E2f'])),
+                    "latex": r"E_2 = \frac{E_m}{1 - \sqrt{V_f} \left( 1 - \frac{E_m}{E_{2f}} \right)}"
+                },
+                "E1": {
+                    "formula": lambda f, m, Vf, Vm: f['E1f'] * Vf + m['Em'] * Vm,
+                    "latex": r"E_1 = E_{1f}V_f + E_mV_m"
+                },
+                "nu12": {
+                    "formula": lambda f, m, Vf, Vm: f['ni12f'] * Vf + m['nim'] * Vm,
+                    "latex": r"\nu_{12} = \nu_{12f}V_f + \nu_mV_m"
+                }
+            }
+        },
+    },
 
     # "nu21": {
     #     "name": "⚠️ Poisson's minor ratio",
@@ -235,8 +334,9 @@ strength_properties = {
         "help": "Maximum stress the composite can withstand while being stretched in the fiber direction",
         "unit": "MPa",
         "Standard": {
-            "formula": lambda f, m, Vf, Vm, eps_check: (
-                f['F1ft'] * (Vf + Vm * m['Em'] / f['E1f']) if eps_check <= 0 else
+            "formula": lambda f, m, Vf, Vm, eps_check: np.where(
+                eps_check <= 0,
+                f['F1ft'] * (Vf + Vm * m['Em'] / f['E1f']),
                 m['FmT'] * (Vf * f['E1f'] / m['Em'] + Vm)
             ),
             "latex": r"""
@@ -356,6 +456,51 @@ strength_properties = {
     }
 }
 
+# CTEs in 10^-6/°C; materials.py stores them in 1/°C
+thermal_properties = {
+    "alpha1": {
+        "name": "Longitudinal coefficient of thermal expansion",
+        "help": "Thermal strain per degree in the fiber direction",
+        "unit": "µε/°C",
+        "Schapery": {
+            "formula": lambda f, m, Vf, Vm: 1e6 * (f['E1f'] * f['alpha1f'] * Vf + m['Em'] * m['alpha_m'] * Vm) / (f['E1f'] * Vf + m['Em'] * Vm),
+            "latex": r"\alpha_1 = \frac{E_{1f} \alpha_{1f} V_f + E_m \alpha_m V_m}{E_{1f} V_f + E_m V_m}",
+            "math": lambda f, m, Vf, Vm: f"\\alpha_1 = \\frac{{{f['E1f']} \\cdot {f['alpha1f'] * 1e6:.2f} \\cdot {Vf:.3f} + {m['Em']} \\cdot {m['alpha_m'] * 1e6:.2f} \\cdot {Vm:.3f}}}{{{f['E1f']} \\cdot {Vf:.3f} + {m['Em']} \\cdot {Vm:.3f}}}"
+        },
+        "ROM": {
+            "formula": lambda f, m, Vf, Vm: 1e6 * (f['alpha1f'] * Vf + m['alpha_m'] * Vm),
+            "latex": r"\alpha_1 = \alpha_{1f} V_f + \alpha_m V_m",
+            "math": lambda f, m, Vf, Vm: f"\\alpha_1 = {f['alpha1f'] * 1e6:.2f} \\cdot {Vf:.3f} + {m['alpha_m'] * 1e6:.2f} \\cdot {Vm:.3f}"
+        },
+    },
+    "alpha2": {
+        "name": "Transverse coefficient of thermal expansion",
+        "help": "Thermal strain per degree perpendicular to the fibers",
+        "unit": "µε/°C",
+        "Schapery": {
+            "formula": lambda f, m, Vf, Vm, alpha1, nu12: 1e6 * ((f['alpha2f'] + f['ni12f'] * f['alpha1f']) * Vf + (1 + m['nim']) * m['alpha_m'] * Vm) - nu12 * alpha1,
+            "latex": r"\alpha_2 = (\alpha_{2f} + \nu_{12f} \alpha_{1f}) V_f + (1 + \nu_m) \alpha_m V_m - \nu_{12} \alpha_1",
+            "math": lambda f, m, Vf, Vm, alpha1, nu12: f"\\alpha_2 = ({f['alpha2f'] * 1e6:.2f} + {f['ni12f']} \\cdot {f['alpha1f'] * 1e6:.2f}) \\cdot {Vf:.3f} + (1 + {m['nim']}) \\cdot {m['alpha_m'] * 1e6:.2f} \\cdot {Vm:.3f} - {nu12:.3f} \\cdot {alpha1:.2f}",
+            "coefficients": {
+                "alpha1": {
+                    "formula": lambda f, m, Vf, Vm: 1e6 * (f['E1f'] * f['alpha1f'] * Vf + m['Em'] * m['alpha_m'] * Vm) / (f['E1f'] * Vf + m['Em'] * Vm),
+                    "latex": r"\alpha_1 = \frac{E_{1f} \alpha_{1f} V_f + E_m \alpha_m V_m}{E_{1f} V_f + E_m V_m}"
+                },
+                "nu12": {
+                    "formula": lambda f, m, Vf, Vm: f['ni12f'] * Vf + m['nim'] * Vm,
+                    "latex": r"\nu_{12} = \nu_{12f} V_f + \nu_m V_m"
+                },
+            },
+        },
+        "ROM": {
+            "formula": lambda f, m, Vf, Vm: 1e6 * (f['alpha2f'] * Vf + m['alpha_m'] * Vm),
+            "latex": r"\alpha_2 = \alpha_{2f} V_f + \alpha_m V_m",
+            "math": lambda f, m, Vf, Vm: f"\\alpha_2 = {f['alpha2f'] * 1e6:.2f} \\cdot {Vf:.3f} + {m['alpha_m'] * 1e6:.2f} \\cdot {Vm:.3f}"
+        },
+    },
+}
+
+
 # Failure theories
 failure_criteria = {
     "Maximum Stress": {
@@ -1,7 +1,14 @@
 # material_math/hooke_law.py
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+from material_math.laminate import laminate_stiffness, parse_layup, engineering_constants, cure_residual_stresses, ply_strengths, STRESS_FREE_TEMPERATURE
+from material_math.failure_kernels import failure_kernels
+from material_math.progressive_failure import progressive_failure, mode_names
+from material_math.orthotropic import saved_solid_matrices, VOIGT_LABELS
+
 def display_hooke_law_matrices():
     st.latex(r"""
     \begin{bmatrix}
@@ -62,5 +69,77 @@ def display_hooke_law_matrices():
     \end{aligned}
     """)
 
+    composites = st.session_state['composite_materials']
+    material_id = st.selectbox("Saved material", composites.index, index=len(composites) - 1, format_func=lambda idx: f"{idx}: {composites.loc[idx, 'Fiber']} / {composites.loc[idx, 'Matrix']} (Vf={composites.loc[idx, 'Vf']})", key="solid_material")
+    matrices = saved_solid_matrices(composites)
+    if np.isnan(matrices["C"][material_id]).any():
+        st.caption("Saved material has no 3D constants, save it again to add them.")
+        return
+    col1, col2 = st.columns(2)
+    col1.write("##### [S] [1/MPa]")
+    col1.dataframe(pd.DataFrame(matrices["S"][material_id], index=VOIGT_LABELS, columns=VOIGT_LABELS).style.format("{:.4g}"))
+    col2.write("##### [C] = [S]⁻¹ [MPa]")
+    col2.dataframe(pd.DataFrame(matrices["C"][material_id], index=VOIGT_LABELS, columns=VOIGT_LABELS).style.format("{:.4g}"))
+
+def display_laminate_stiffness():
+    composites = st.session_state['composite_materials']
+    labels = [f"{idx}: {row['Fiber']} / {row['Matrix']} (Vf={row['Vf']})" for idx, row in composites.iterrows()]
+
+    col1, col2, col3 = st.columns([4, 3, 2])
+    with col1:
+        material_id = st.selectbox("Ply material", range(len(labels)), format_func=lambda idx: labels[idx], index=len(labels) - 1)
+    with col2:
+        layup = st.text_input("Layup", value="[0/±45/90]s")
+    with col3:
+        ply_thickness = st.number_input("Ply thickness [mm]", min_value=0.01, value=0.125, step=0.005, format="%.3f")
+
+    try:
+        angles = parse_layup(layup)
+    except ValueError:
+        st.error(f"Can't read layup '{layup}'")
+        return
+
+    thickness = np.full(len(angles), ply_thickness)
+    laminate = laminate_stiffness(np.full(len(angles), material_id), angles, thickness)
+    labels_abd = ["Nx", "Ny", "Nxy", "Mx", "My", "Mxy"]
+    st.write(f"##### [ABD] for {len(angles)} plies, h = {thickness.sum():.3f} mm")
+    st.dataframe(pd.DataFrame(laminate["ABD"], index=labels_abd, columns=["εx", "εy", "γxy", "κx", "κy", "κxy"]).style.format("{:.4g}"))
+    st.write("##### [abd] = [ABD]⁻¹")
+    st.dataframe(pd.DataFrame(laminate["abd"], index=["εx", "εy", "γxy", "κx", "κy", "κxy"], columns=labels_abd).style.format("{:.4g}"))
+    constants = engineering_constants(laminate["A"], thickness)
+    st.code(" / ".join(f"{name}: {value / 1000:.2f} GPa" if name != "nuxy" else f"{name}: {value:.3f}" for name, value in constants.items()))
+
+    st.write("##### Progressive failure")
+    load_cols = st.columns(7)
+    loads = [col.number_input(label, value=100.0 if label == "Nx" else 0.0, key=f"clt_{label}") for col, label in zip(load_cols, labels_abd)]
+    criterion = load_cols[6].selectbox("Criterion", list(failure_kernels.keys()), index=1)
+    ids = np.full(len(angles), material_id)
+    if any(loads):
+        failure = progressive_failure(ids, angles, thickness, loads, criterion)
+        if np.isnan(failure["fpf"]):
+            st.caption("Saved material has no strengths, save it again to add them.")
+        else:
+            st.code(f"FPF: {failure['fpf']:.3f} x load (ply {failure['fpf_ply'] + 1}, {mode_names(failure['fpf_mode'])}) / LPF: {failure['lpf']:.3f} x load")
+
+    st.write("##### Cure residual stresses")
+    col1, col2 = st.columns(2)
+    T_service = col1.number_input("Service temperature [°C]", value=20.0)
+    T_stress_free = col2.number_input("Stress-free temperature [°C]", value=STRESS_FREE_TEMPERATURE)
+    residual = cure_residual_stresses(ids, angles, thickness, T_service, T_stress_free)["stress"]
+    if np.isnan(residual).any():
+        st.caption("Saved material has no CTEs, save it again to add them.")
+        return
+    combined = cure_residual_stresses(ids, angles, thickness, T_service, T_stress_free, loads=loads)["stress"]
+    strengths = {key: value[:, None] for key, value in ply_strengths(ids).items()}
+    kernel = failure_kernels[criterion]
+    st.dataframe(pd.DataFrame({
+        "Angle": angles,
+        "σ1 [MPa]": residual[:, 1, 0],
+        "σ2 [MPa]": residual[:, 1, 1],
+        "τ12 [MPa]": residual[:, 1, 2],
+        f"{criterion} FI (thermal)": kernel(residual, strengths)["index"].max(axis=1),
+        f"{criterion} FI (thermal + loads)": kernel(combined, strengths)["index"].max(axis=1),
+    }, index=[f"Ply {idx + 1}" for idx in range(len(angles))]).style.format("{:.3g}"))
+
 # In the homepage or wherever you want to display these matrices:
 # display_hooke_law_matrices()
@@ -0,0 +1,103 @@
+# material_math/hygrothermal.py
+
+# Environmental (hot/wet) cases as array sweeps. Matrix properties are knocked down with Chamis'
+# factor sqrt((Tgw - T) / (Tg0 - T0)), Tgw = (0.005 M^2 - 0.10 M + 1) Tg0, and then go through the
+# regular micromechanics for every fiber x matrix x T x M at once. Fibers are taken as unaffected.
+# Free hygrothermal strains use alpha (1/°C) and beta (strain per unit moisture weight fraction).
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from material_math.material_table import MaterialTable, fiber_table, matrix_table, evaluate_property_by_id
+from material_math.composite_experimental import composites_experimental
+
+REFERENCE_TEMPERATURE = 21.0        # °C, T0 of the dry room-temperature properties
+MATRIX_KNOCKDOWN_PARAMS = ("Em", "Gm", "FmT", "FmC", "FmS")
+ENVIRONMENT_DIMS = ("theory", "fiber", "matrix", "T", "M")
+
+def wet_glass_transition(Tg0, M):
+    # M: moisture content in weight %
+    return (0.005 * np.asarray(M) ** 2 - 0.10 * np.asarray(M) + 1) * np.asarray(Tg0)
+
+def chamis_knockdown(Tg0, T, M, T0=REFERENCE_TEMPERATURE):
+    # 0 at or above the wet Tg, NaN where Tg0 is unknown
+    with np.errstate(invalid='ignore'):
+        ratio = (wet_glass_transition(Tg0, M) - np.asarray(T)) / (np.asarray(Tg0) - T0)
+    return np.sqrt(np.where(np.isnan(ratio), np.nan, np.clip(ratio, 0.0, None)))
+
+def environmental_properties(category, T_grid, M_grid, Vf, Vvoid=0.0, fibers=None, matrices=None, properties=None):
+    # Whole catalog under every (T, M): {property: {"values": array[theory, fiber, matrix, T, M],
+    # "dims": ENVIRONMENT_DIMS, "coords": {...}, "knockdown": array[matrix, T, M]}}
+    T_grid = np.atleast_1d(np.asarray(T_grid, dtype=float))
+    M_grid = np.atleast_1d(np.asarray(M_grid, dtype=float))
+    tables = None if fibers is None and matrices is None else (MaterialTable(fibers), MaterialTable(matrices))
+    fibers_table, matrices_table = tables or (fiber_table, matrix_table)
+    fiber_ids = np.arange(len(fibers_table))[:, None, None, None]
+    matrix_ids = np.arange(len(matrices_table))[None, :, None, None]
+
+    knockdown = chamis_knockdown(matrices_table.column("Tg")[:, None, None], T_grid[None, :, None], M_grid[None, None, :])
+    factors = {param: knockdown[None] for param in MATRIX_KNOCKDOWN_PARAMS}
+
+    cube = {}
+    for property_name in (properties or category.keys()):
+        theory_names, values = evaluate_property_by_id(category, property_name, fiber_ids, matrix_ids, Vf, Vvoid, tables, factors)
+        cube[property_name] = {
+            "values": values,
+            "dims": ENVIRONMENT_DIMS,
+            "coords": {"theory": theory_names, "fiber": fibers_table.names, "matrix": matrices_table.names, "T": T_grid, "M": M_grid},
+            "knockdown": knockdown,
+        }
+    return cube
+
+def moisture_strains(beta1, beta2, M):
+    # Free swelling strains [..., 2] (1, 2 directions) for moisture content M in weight %
+    M = np.asarray(M, dtype=float) / 100
+    return np.stack(np.broadcast_arrays(np.asarray(beta1) * M, np.asarray(beta2) * M), axis=-1)
+
+def hygrothermal_strains(T_grid, M_grid, composites=None, T_ref=REFERENCE_TEMPERATURE):
+    # Free strains of every composite in the catalog over the (T, M) grid:
+    # {"names": [...], "strain": array[composite, T, M, 2]}, NaN where alpha/beta are missing
+    composites = composites_experimental if composites is None else composites
+    names = list(composites.keys())
+
+    def column(key):
+        return np.array([np.nan if composites[name].get(key) is None else composites[name][key] for name in names], dtype=float)[:, None, None]
+
+    delta_T = np.asarray(T_grid, dtype=float)[None, :, None] - T_ref
+    M = np.asarray(M_grid, dtype=float)[None, None, :]
+    thermal = np.stack(np.broadcast_arrays(column("alpha1") * delta_T, column("alpha2") * delta_T), axis=-1)
+    return {"names": names, "strain": thermal + moisture_strains(column("beta1"), column("beta2"), M)}
+
+def hygrothermal_ui(categories, fiber_material_key, matrix_material_key, Vf, Vvoid=0.0):
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        T_range = st.slider("Temperature range [°C]", -60.0, 200.0, (-55.0, 120.0), 5.0)
+    with col2:
+        M_range = st.slider("Moisture content range [wt %]", 0.0, 3.0, (0.0, 1.5), 0.1)
+    with col3:
+        property_name = st.selectbox("Property", [name for category in categories for name in category])
+    category = next(category for category in categories if property_name in category)
+
+    T_grid = np.linspace(*T_range, 8)
+    M_grid = np.linspace(*M_range, 4)
+    cube = environmental_properties(category, T_grid, M_grid, Vf, Vvoid, properties=[property_name])[property_name]
+    fiber_idx = fiber_table.ids[fiber_material_key]
+    matrix_idx = matrix_table.ids[matrix_material_key]
+
+    st.write(f"##### Chamis knockdown for {matrix_material_key}")
+    st.dataframe(pd.DataFrame(cube["knockdown"][matrix_idx], index=[f"{T:.0f} °C" for T in T_grid], columns=[f"M = {M:.1f} %" for M in M_grid]).style.format("{:.3f}"))
+
+    st.write(f"##### {property_name} of {fiber_material_key} / {matrix_material_key}, averaged over theories")
+    with np.errstate(all='ignore'):
+        average = np.nanmean(cube["values"][:, fiber_idx, matrix_idx], axis=0)
+    st.dataframe(pd.DataFrame(average, index=[f"{T:.0f} °C" for T in T_grid], columns=[f"M = {M:.1f} %" for M in M_grid]).style.format("{:.3f}"))
+
+    strains = hygrothermal_strains(T_grid[[0, -1]], M_grid[[-1]])
+    st.write(f"##### Free hygrothermal strains at M = {M_grid[-1]:.1f} % [µε]")
+    st.dataframe(pd.DataFrame({
+        f"ε1 at {T_grid[0]:.0f} °C": strains["strain"][:, 0, 0, 0] * 1e6,
+        f"ε2 at {T_grid[0]:.0f} °C": strains["strain"][:, 0, 0, 1] * 1e6,
+        f"ε1 at {T_grid[-1]:.0f} °C": strains["strain"][:, 1, 0, 0] * 1e6,
+        f"ε2 at {T_grid[-1]:.0f} °C": strains["strain"][:, 1, 0, 1] * 1e6,
+    }, index=strains["names"]).style.format("{:.0f}"))
@@ -0,0 +1,211 @@
+# material_math/laminate.py
+
+# Classical laminate theory over stacks of layups. Ply arrays carry any leading batch dims
+# (layups, spanwise stations, ...) followed by the ply axis; padding plies have zero thickness.
+# Units: E/G in GPa on input, Q/Q-bar in MPa, thickness in mm -> A [N/mm], B [N], D [N mm].
+
+import numpy as np
+import streamlit as st
+
+from material_math.property_cache import PropertyCache
+from material_math.composite_materials import STRENGTH_KEYS, THERMAL_KEYS
+from material_math.failure_kernels import TSAI_WU_KEYS
+
+PLY_COLUMNS = ["E1", "E2", "nu12", "G12"]
+TRANSFORM_NAMES = ["T_sigma", "T_epsilon", "Q", "Qbar"]
+PLY_CACHE_SIZE = 4096
+STRESS_FREE_TEMPERATURE = 177.0     # °C, typical autoclave cure of the epoxy systems in materials.py
+
+# (ply table fingerprint, material id, angle) -> {T_sigma, T_epsilon, Q, Qbar}; shared by stiffness, failure and thermal code
+ply_cache = PropertyCache(PLY_CACHE_SIZE)
+
+def ply_table(composites=None):
+    # Saved composite materials (st.session_state['composite_materials']) -> {column: array[material_id]}.
+    # Strengths and Tsai-Wu coefficients come along when the table has them.
+    if composites is None:
+        composites = st.session_state['composite_materials']
+    columns = PLY_COLUMNS + [column for column in (*STRENGTH_KEYS, *TSAI_WU_KEYS, *THERMAL_KEYS) if column in composites]
+    return {column: composites[column].to_numpy(dtype=float) for column in columns}
+
+def ply_strengths(material_ids, plies=None):
+    # Per-ply strengths and Tsai-Wu coefficients, gathered for the failure kernels
+    plies = plies or ply_table()
+    return {key: plies[key][material_ids] for key in (*STRENGTH_KEYS, *TSAI_WU_KEYS) if key in plies}
+
+def reduced_stiffness(E1, E2, nu12, G12):
+    # Plane-stress Q[..., 3, 3] in MPa; nu21 from symmetry so Q is always symmetric
+    E1, E2, G12 = (np.asarray(value, dtype=float) * 1000 for value in (E1, E2, G12))
+    nu12 = np.asarray(nu12, dtype=float)
+    nu21 = nu12 * E2 / E1
+    denominator = 1 - nu12 * nu21
+    Q = np.zeros(np.broadcast(E1, E2, nu12, G12).shape + (3, 3))
+    Q[..., 0, 0] = E1 / denominator
+    Q[..., 1, 1] = E2 / denominator
+    Q[..., 0, 1] = Q[..., 1, 0] = nu12 * E2 / denominator
+    Q[..., 2, 2] = G12
+    return Q
+
+def stress_transformation(theta):
+    # T_sigma[..., 3, 3]: global (x, y, xy) stresses -> ply (1, 2, 12); theta in degrees
+    c, s = np.cos(np.radians(theta)), np.sin(np.radians(theta))
+    T = np.empty(np.shape(theta) + (3, 3))
+    T[..., 0, :] = np.stack([c * c, s * s, 2 * c * s], axis=-1)
+    T[..., 1, :] = np.stack([s * s, c * c, -2 * c * s], axis=-1)
+    T[..., 2, :] = np.stack([-c * s, c * s, c * c - s * s], axis=-1)
+    return T
+
+def strain_transformation(theta):
+    # T_epsilon[..., 3, 3] for engineering shear strain: global (x, y, gamma_xy) -> ply (1, 2, gamma_12)
+    c, s = np.cos(np.radians(theta)), np.sin(np.radians(theta))
+    T = np.empty(np.shape(theta) + (3, 3))
+    T[..., 0, :] = np.stack([c * c, s * s, c * s], axis=-1)
+    T[..., 1, :] = np.stack([s * s, c * c, -c * s], axis=-1)
+    T[..., 2, :] = np.stack([-2 * c * s, 2 * c * s, c * c - s * s], axis=-1)
+    return T
+
+def transformed_stiffness(Q, theta):
+    # Q-bar[..., 3, 3] = T_sigma^-1 Q T_epsilon, written out term by term
+    c, s = np.cos(np.radians(theta)), np.sin(np.radians(theta))
+    c2, s2, cs = c * c, s * s, c * s
+    Q11, Q12, Q22, Q66 = Q[..., 0, 0], Q[..., 0, 1], Q[..., 1, 1], Q[..., 2, 2]
+    Qbar = np.empty(np.broadcast_shapes(Q.shape[:-2], np.shape(theta)) + (3, 3))
+    Qbar[..., 0, 0] = Q11 * c2 * c2 + 2 * (Q12 + 2 * Q66) * s2 * c2 + Q22 * s2 * s2
+    Qbar[..., 1, 1] = Q11 * s2 * s2 + 2 * (Q12 + 2 * Q66) * s2 * c2 + Q22 * c2 * c2
+    Qbar[..., 0, 1] = Qbar[..., 1, 0] = (Q11 + Q22 - 4 * Q66) * s2 * c2 + Q12 * (s2 * s2 + c2 * c2)
+    Qbar[..., 2, 2] = (Q11 + Q22 - 2 * Q12 - 2 * Q66) * s2 * c2 + Q66 * (s2 * s2 + c2 * c2)
+    Qbar[..., 0, 2] = Qbar[..., 2, 0] = (Q11 - Q12 - 2 * Q66) * c2 * cs - (Q22 - Q12 - 2 * Q66) * s2 * cs
+    Qbar[..., 1, 2] = Qbar[..., 2, 1] = (Q11 - Q12 - 2 * Q66) * s2 * cs - (Q22 - Q12 - 2 * Q66) * c2 * cs
+    return Qbar
+
+def ply_interfaces(thickness):
+    # z of the bottom/top face of every ply, mid-plane at z = 0
+    thickness = np.asarray(thickness, dtype=float)
+    top = np.cumsum(thickness, axis=-1) - thickness.sum(axis=-1, keepdims=True) / 2
+    return top - thickness, top
+
+def laminate_abd(Qbar, thickness):
+    # Qbar[..., ply, 3, 3], thickness[..., ply] -> A, B, D[..., 3, 3]
+    z_bottom, z_top = ply_interfaces(thickness)
+    A = np.einsum('...kij,...k->...ij', Qbar, z_top - z_bottom)
+    B = np.einsum('...kij,...k->...ij', Qbar, (z_top ** 2 - z_bottom ** 2) / 2)
+    D = np.einsum('...kij,...k->...ij', Qbar, (z_top ** 3 - z_bottom ** 3) / 3)
+    return A, B, D
+
+def assemble_abd(A, B, D):
+    return np.concatenate([np.concatenate([A, B], axis=-1), np.concatenate([B, D], axis=-1)], axis=-2)
+
+def ply_fingerprint(plies):
+    # Material ids are only meaningful together with the table they index
+    return hash(tuple(np.asarray(plies[column], dtype=float).tobytes() for column in PLY_COLUMNS))
+
+def ply_transforms(material_ids, angles, plies=None, names=TRANSFORM_NAMES):
+    # {T_sigma, T_epsilon, Q, Qbar}[..., 3, 3] for every ply (only the requested names). Trig and Q-bar
+    # are only computed for (material id, angle) pairs the cache hasn't seen; everything else is a gather.
+    plies = plies or ply_table()
+    material_ids, angles = np.broadcast_arrays(np.asarray(material_ids), np.asarray(angles, dtype=float))
+    unique_angles, angle_codes = np.unique(angles, return_inverse=True)
+    pair_codes, inverse = np.unique(material_ids.ravel() * len(unique_angles) + angle_codes.ravel(), return_inverse=True)
+    ids, theta = pair_codes // len(unique_angles), unique_angles[pair_codes % len(unique_angles)]
+    fingerprint = ply_fingerprint(plies)
+    keys = [(fingerprint, int(material_id), float(angle)) for material_id, angle in zip(ids, theta)]
+    entries = [ply_cache.get(key) for key in keys]
+
+    missing = [idx for idx, entry in enumerate(entries) if entry is None]
+    if missing:
+        Q = reduced_stiffness(*(plies[column][ids[missing]] for column in PLY_COLUMNS))
+        built = {
+            "T_sigma": stress_transformation(theta[missing]),
+            "T_epsilon": strain_transformation(theta[missing]),
+            "Q": Q,
+            "Qbar": transformed_stiffness(Q, theta[missing]),
+        }
+        for row, idx in enumerate(missing):
+            entries[idx] = {name: matrices[row] for name, matrices in built.items()}
+            ply_cache.put(keys[idx], entries[idx])
+
+    inverse = inverse.reshape(material_ids.shape)
+    return {name: np.stack([entry[name] for entry in entries])[inverse] for name in names}
+
+def laminate_stiffness(material_ids, angles, thickness, plies=None):
+    # material_ids/angles/thickness[..., ply] (angles in degrees, thickness in mm). plies defaults to the
+    # saved composite materials. Returns the per-ply Q-bar, A, B, D, the 6x6 ABD and its inverse (abd).
+    Qbar = ply_transforms(material_ids, angles, plies, names=["Qbar"])["Qbar"]
+    A, B, D = laminate_abd(Qbar, thickness)
+    ABD = assemble_abd(A, B, D)
+    return {"Qbar": Qbar, "A": A, "B": B, "D": D, "ABD": ABD, "abd": np.linalg.inv(ABD)}
+
+def ply_expansion(material_ids, angles, plies=None):
+    # Free thermal strain per °C of every ply, in ply axes and laminate axes: [..., ply, 3] each
+    plies = plies or ply_table()
+    material_ids = np.asarray(material_ids)
+    alpha1, alpha2 = (plies[key][material_ids] * 1e-6 if key in plies else np.full(material_ids.shape, np.nan) for key in THERMAL_KEYS)
+    c, s = np.cos(np.radians(angles)), np.sin(np.radians(angles))
+    local = np.stack(np.broadcast_arrays(alpha1, alpha2, np.zeros_like(alpha1)), axis=-1)
+    laminate_axes = np.stack(np.broadcast_arrays(alpha1 * c * c + alpha2 * s * s, alpha1 * s * s + alpha2 * c * c, 2 * (alpha1 - alpha2) * c * s), axis=-1)
+    return local, laminate_axes
+
+def thermal_resultants(material_ids, angles, thickness, delta_T, plies=None):
+    # Thermal force and moment resultants [..., 6] for a temperature change delta_T [°C] (broadcasts
+    # against the laminate batch dims, e.g. [layup, 1] with [1, temperature])
+    Qbar = ply_transforms(material_ids, angles, plies, names=["Qbar"])["Qbar"]
+    _, alpha = ply_expansion(material_ids, angles, plies)
+    z_bottom, z_top = ply_interfaces(thickness)
+    N = np.einsum('...kij,...kj,...k->...i', Qbar, alpha, z_top - z_bottom)
+    M = np.einsum('...kij,...kj,...k->...i', Qbar, alpha, (z_top ** 2 - z_bottom ** 2) / 2)
+    return np.concatenate([N, M], axis=-1) * np.asarray(delta_T, dtype=float)[..., None]
+
+def ply_stresses(material_ids, angles, thickness, loads, plies=None, laminate=None, delta_T=0.0):
+    # loads[..., 6] = [Nx, Ny, Nxy (N/mm), Mx, My, Mxy (N mm/mm)] plus an optional temperature change
+    # delta_T [°C] -> ply-axis strains and stresses [..., ply, face, 3] at the bottom (face 0) and top
+    # (face 1) of every ply, ready for failure_kernels. Stresses come from the mechanical strain,
+    # i.e. total strain minus free thermal expansion.
+    laminate = laminate or laminate_stiffness(material_ids, angles, thickness, plies)
+    transforms = ply_transforms(material_ids, angles, plies, names=["T_epsilon", "Q"])
+    loads = np.asarray(loads, dtype=float)
+    thermal = np.any(delta_T)
+    if thermal:
+        loads = loads + thermal_resultants(material_ids, angles, thickness, delta_T, plies)
+    deformation = np.einsum('...ij,...j->...i', laminate["abd"], loads)
+    z = np.stack(ply_interfaces(thickness), axis=-1)
+    global_strain = deformation[..., None, None, :3] + z[..., None] * deformation[..., None, None, 3:]
+    strain = np.einsum('...kij,...kfj->...kfi', transforms["T_epsilon"], global_strain)
+    mechanical = strain
+    if thermal:
+        alpha, _ = ply_expansion(material_ids, angles, plies)
+        mechanical = strain - alpha[..., None, :] * np.asarray(delta_T, dtype=float)[..., None, None, None]
+    stress = np.einsum('...kij,...kfj->...kfi', transforms["Q"], mechanical)
+    return {"midplane": deformation, "strain": strain, "stress": stress}
+
+def cure_residual_stresses(material_ids, angles, thickness, T_service=20.0, T_stress_free=STRESS_FREE_TEMPERATURE, plies=None, loads=None):
+    # Ply stresses left by cooling from the stress-free (cure) temperature, optionally with mechanical
+    # loads on top. T_service broadcasts against the laminate batch dims.
+    delta_T = np.asarray(T_service, dtype=float) - T_stress_free
+    return ply_stresses(material_ids, angles, thickness, np.zeros(6) if loads is None else loads, plies, delta_T=delta_T)
+
+def parse_layup(layup):
+    # "[0/±45/90]s" -> [0, 45, -45, 90, 90, -45, 45, 0]; "_n" repeats a ply: "[0_2/90]s"
+    text = layup.replace(" ", "").replace("[", "").replace("]", "/")
+    symmetric = text.rstrip("/").endswith("s")
+    text = text.rstrip("/").rstrip("s")
+    angles = []
+    for token in filter(None, text.split("/")):
+        token, _, repeat = token.partition("_")
+        if token.startswith(("±", "+-")):
+            values = [float(token.lstrip("±+-")), -float(token.lstrip("±+-"))]
+        else:
+            values = [float(token)]
+        angles += values * int(repeat or 1)
+    if not angles:
+        raise ValueError(f"no plies in layup '{layup}'")
+    return angles + angles[::-1] if symmetric else angles
+
+def engineering_constants(A, thickness):
+    # In-plane effective moduli of the laminate from A^-1 (MPa, h in mm)
+    h = np.asarray(thickness, dtype=float).sum(axis=-1)
+    a = np.linalg.inv(A)
+    return {
+        "Ex": 1 / (h * a[..., 0, 0]),
+        "Ey": 1 / (h * a[..., 1, 1]),
+        "Gxy": 1 / (h * a[..., 2, 2]),
+        "nuxy": -a[..., 0, 1] / a[..., 0, 0],
+    }
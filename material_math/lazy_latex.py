@@ -0,0 +1,25 @@
+# material_math/lazy_latex.py
+
+class LazyLatex:
+    # Defers building a LaTeX string until something actually shows it; rendered once, then kept
+    __slots__ = ("_render", "_args", "_text")
+
+    def __init__(self, render, *args):
+        self._render = render
+        self._args = args
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self._render(*self._args)
+            self._args = None
+        return self._text
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __repr__(self):
+        return f"LazyLatex({'rendered' if self._text is not None else 'pending'})"
+
+def render_coefficient(coeff_latex, value):
+    return f"{coeff_latex} = {value:.3f}"
@@ -0,0 +1,100 @@
+# material_math/material_table.py
+
+from collections import defaultdict
+
+import numpy as np
+from materials import fibers, matrices
+from material_math.formulas import micromech_properties, strength_properties, thermal_properties
+from material_math.registry import get_registry
+
+class MaterialTable:
+    # Column-per-parameter view of a materials dict; materials are addressed by integer id.
+    # Missing values (None or absent keys) are NaN in `values` and False in `present`.
+    def __init__(self, materials):
+        self.names = list(materials.keys())
+        self.ids = {name: idx for idx, name in enumerate(self.names)}
+        self.params = sorted({param for material in materials.values() for param, value in material.items() if not isinstance(value, str)})
+        self.param_index = {param: idx for idx, param in enumerate(self.params)}
+        self.values = np.array([
+            [np.nan if materials[name].get(param) is None else materials[name][param] for name in self.names]
+            for param in self.params
+        ], dtype=float).reshape(len(self.params), len(self.names))
+        self.present = ~np.isnan(self.values)
+
+    def __len__(self):
+        return len(self.names)
+
+    def column(self, param):
+        return self.values[self.param_index[param]]
+
+    def select(self, ids):
+        # {param: values[ids]} with the shape of ids, ready to pass to the engine as f or m
+        ids = np.asarray(ids)
+        return defaultdict(lambda: np.nan, {param: self.values[idx][ids] for param, idx in self.param_index.items()})
+
+    def available(self, required):
+        # True per material when every required parameter this table knows about is present
+        rows = [self.param_index[param] for param in required if param in self.param_index]
+        return self.present[rows].all(axis=0) if rows else np.ones(len(self.names), dtype=bool)
+
+fiber_table = MaterialTable(fibers)
+matrix_table = MaterialTable(matrices)
+
+known_params = frozenset(fiber_table.params) | frozenset(matrix_table.params)
+
+def theory_applicability(theory, tables=None):
+    # bool[fiber, matrix]: does the pair carry every parameter the theory reads
+    fibers_table, matrices_table = tables or (fiber_table, matrix_table)
+    return fibers_table.available(theory["params"])[:, None] & matrices_table.available(theory["params"])[None, :]
+
+def property_applicability(entry, tables=None):
+    # bool[theory, fiber, matrix]
+    return np.stack([theory_applicability(entry["theories"][theory], tables) for theory in entry["theory_names"]])
+
+# Precomputed for the built-in catalog: {id(category): {property: bool[theory, fiber, matrix]}}
+applicability = {
+    id(category): {property_name: property_applicability(entry) for property_name, entry in get_registry(category).items()}
+    for category in (micromech_properties, strength_properties, thermal_properties)
+}
+
+def get_applicability(category, property_name, tables=None):
+    if tables is None and id(category) in applicability:
+        return applicability[id(category)][property_name]
+    return property_applicability(get_registry(category)[property_name], tables)
+
+def theory_supported(theory, fiber_material, matrix_material):
+    # Single-pair check straight on the material dicts
+    return all(
+        fiber_material.get(param) is not None or matrix_material.get(param) is not None
+        for param in theory["params"] & known_params
+    )
+
+def evaluate_property_by_id(category, property_name, fiber_ids, matrix_ids, Vf, Vvoid=0.0, tables=None, matrix_factors=None):
+    # Batch kernel over integer material ids (fiber_ids, matrix_ids, Vf and Vvoid broadcast together).
+    # Theories no selected pair can support are never evaluated; unsupported pairs come back NaN.
+    # matrix_factors {param: factor} scales matrix columns first (factors broadcast with the rest).
+    entry = get_registry(category)[property_name]
+    flags = get_applicability(category, property_name, tables)
+    fibers_table, matrices_table = tables or (fiber_table, matrix_table)
+    fiber_ids = np.asarray(fiber_ids)
+    matrix_ids = np.asarray(matrix_ids)
+    f = fibers_table.select(fiber_ids)
+    m = matrices_table.select(matrix_ids)
+    for param, factor in (matrix_factors or {}).items():
+        m[param] = m[param] * factor
+    Vf = np.asarray(Vf, dtype=float)
+    Vvoid = np.asarray(Vvoid, dtype=float)
+    Vm = 1 - Vf
+    shape = np.broadcast_shapes(fiber_ids.shape, matrix_ids.shape, Vf.shape, Vvoid.shape, *(np.shape(factor) for factor in (matrix_factors or {}).values()))
+
+    values = np.full((len(entry["theory_names"]),) + shape, np.nan)
+    for idx, theory_name in enumerate(entry["theory_names"]):
+        supported = np.broadcast_to(flags[idx][fiber_ids, matrix_ids], shape)
+        if not supported.any():
+            continue
+        theory = entry["theories"][theory_name]
+        with np.errstate(all='ignore'):
+            coefficients = theory["coefficients"](f, m, Vf, Vm)
+            result = np.broadcast_to(np.asarray(theory["formula"](f, m, Vf, Vm, Vvoid, coefficients), dtype=float), shape)
+        values[idx] = np.where(supported, result, np.nan)
+    return entry["theory_names"], values
@@ -0,0 +1,173 @@
+# material_math/monte_carlo.py
+
+# Monte Carlo propagation of constituent scatter through the micromech / strength theories.
+# Samples are drawn and evaluated chunk by chunk; only fixed-size running statistics are kept,
+# so memory doesn't grow with the sample count.
+
+import numpy as np
+
+from material_math.registry import get_registry
+from material_math.engine import as_float_material, evaluate_entry
+from material_math.material_table import known_params
+
+DEFAULT_COV = 0.05          # coefficient of variation for constituent properties
+DEFAULT_VF_STD = 0.02
+DEFAULT_VVOID_STD = 0.005
+
+class RunningStats:
+    # Mean/variance via Chan's parallel update, exact min/max, and a fixed-bin histogram for
+    # percentiles. Histogram range comes from the first chunk (padded); a later chunk outside it
+    # widens the range by a power of two with bin edges kept aligned, so old bins merge exactly.
+    def __init__(self, n_series, bins=4096, padding=0.5):
+        self.bins = bins
+        self.padding = padding
+        self.count = np.zeros(n_series, dtype=np.int64)
+        self.invalid = np.zeros(n_series, dtype=np.int64)
+        self.mean = np.zeros(n_series)
+        self.m2 = np.zeros(n_series)
+        self.min = np.full(n_series, np.inf)
+        self.max = np.full(n_series, -np.inf)
+        self.lo = None
+        self.hi = None
+        self.histogram = np.zeros((n_series, bins), dtype=np.int64)
+
+    def widen(self, low, high):
+        # Grow [lo, hi] of every series to cover [low, high]: bin width x 2^k, lo moved down by whole
+        # new bins, old bin i lands in new bin shift + i // 2^k
+        outside = (low < self.lo) | (high > self.hi)
+        for series in np.nonzero(outside)[0]:
+            lo, hi = self.lo[series], self.hi[series]
+            target_lo, target_hi = min(low[series], lo), max(high[series], hi)
+            width = (hi - lo) / self.bins
+            k = 0
+            while True:
+                k += 1
+                wide = width * 2.0 ** k
+                shift = int(np.ceil((lo - target_lo) / wide))
+                if lo - shift * wide + self.bins * wide >= target_hi:
+                    break
+            merged = np.zeros(self.bins, dtype=np.int64)
+            np.add.at(merged, shift + np.arange(self.bins) // min(2 ** k, self.bins), self.histogram[series])
+            self.histogram[series] = merged
+            self.lo[series] = lo - shift * wide
+            self.hi[series] = self.lo[series] + self.bins * wide
+
+    def update(self, values):
+        # values[series, samples]
+        valid = np.isfinite(values)
+        n = valid.sum(axis=1)
+        self.invalid += values.shape[1] - n
+        filled = np.where(valid, values, 0.0)
+        with np.errstate(all='ignore'):
+            chunk_mean = np.where(n > 0, filled.sum(axis=1) / np.maximum(n, 1), 0.0)
+            chunk_m2 = (np.where(valid, values - chunk_mean[:, None], 0.0) ** 2).sum(axis=1)
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        safe_total = np.maximum(total, 1)
+        self.mean = self.mean + delta * n / safe_total
+        self.m2 = self.m2 + chunk_m2 + delta ** 2 * self.count * n / safe_total
+        self.count = total
+        low = np.where(valid, values, np.inf).min(axis=1)
+        high = np.where(valid, values, -np.inf).max(axis=1)
+        self.min = np.minimum(self.min, low)
+        self.max = np.maximum(self.max, high)
+
+        if self.lo is None:
+            span = np.where(np.isfinite(self.max - self.min), self.max - self.min, 0.0)
+            span = np.where(span > 0, span, np.maximum(np.abs(self.mean), 1.0) * 1e-6)
+            self.lo = np.where(np.isfinite(self.min), self.min, 0.0) - self.padding * span
+            self.hi = np.where(np.isfinite(self.max), self.max, 0.0) + self.padding * span
+        else:
+            self.widen(low, high)
+
+        width = (self.hi - self.lo) / self.bins
+        with np.errstate(all='ignore'):
+            idx = np.floor((values - self.lo[:, None]) / width[:, None])
+        idx = np.clip(np.nan_to_num(idx, nan=0), 0, self.bins - 1).astype(np.int64)
+        flat = (idx + np.arange(len(idx))[:, None] * self.bins)[valid]
+        self.histogram += np.bincount(flat, minlength=self.histogram.size).reshape(self.histogram.shape)
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / np.maximum(self.count - 1, 1))
+
+    def percentile(self, q):
+        # q in [0, 100]; linear interpolation inside the histogram bin holding the rank
+        results = np.full(len(self.count), np.nan)
+        for series in range(len(self.count)):
+            if self.count[series] == 0:
+                continue
+            edges = np.linspace(self.lo[series], self.hi[series], self.bins + 1)
+            lower, upper = edges[:-1], edges[1:]
+            cumulative = np.cumsum(self.histogram[series])
+            rank = q / 100 * self.count[series]
+            bin_idx = min(np.searchsorted(cumulative, rank), len(cumulative) - 1)
+            before = cumulative[bin_idx - 1] if bin_idx > 0 else 0
+            fraction = (rank - before) / max(self.histogram[series, bin_idx], 1)
+            value = lower[bin_idx] + fraction * (upper[bin_idx] - lower[bin_idx])
+            results[series] = min(max(value, self.min[series]), self.max[series])
+        return results
+
+    def b_basis(self):
+        # Lower 95% confidence bound on the 10th percentile (non-parametric, normal approximation
+        # to the binomial rank; fine for the large sample counts this is meant for)
+        n = np.maximum(self.count, 1)
+        q = np.clip(0.10 - 1.645 * np.sqrt(0.10 * 0.90 / n), 0.0, 1.0)
+        results = np.full(len(self.count), np.nan)
+        for quantile in np.unique(q):
+            rows = q == quantile
+            results[rows] = self.percentile(100 * quantile)[rows]
+        return results
+
+def _sample_material(rng, material, params, size, cov, param_cov):
+    sampled = {}
+    for key, value in material.items():
+        if key in params and np.isfinite(value):
+            spread = param_cov.get(key, cov) * abs(value)
+            sampled[key] = rng.normal(value, spread, size)
+        else:
+            sampled[key] = value
+    return sampled
+
+def monte_carlo_properties(category, fiber, matrix, Vf, Vvoid=0.0, n_samples=10**6, chunk_size=65536,
+                           cov=DEFAULT_COV, param_cov=None, Vf_std=DEFAULT_VF_STD, Vvoid_std=DEFAULT_VVOID_STD,
+                           properties=None, percentiles=(1, 5, 50, 95, 99), seed=None):
+    # fiber/matrix are the nominal material dicts. Every constituent parameter the theories read is
+    # normal with its own CoV (param_cov overrides DEFAULT_COV per key), Vf and Vvoid are normal and
+    # clipped to their physical range. Returns {property: {"theories": [...], "mean": ..., "std": ...,
+    # "min": ..., "max": ..., "percentiles": {q: ...}, "b_basis": ..., "samples": n, "invalid": ...}}
+    rng = np.random.default_rng(seed)
+    param_cov = param_cov or {}
+    registry = get_registry(category)
+    property_names = list(properties or registry.keys())
+    fiber = as_float_material(fiber)
+    matrix = as_float_material(matrix)
+
+    used = {param for name in property_names for theory in registry[name]["theories"].values() for param in theory["params"]} & known_params
+    stats = {name: RunningStats(len(registry[name]["theory_names"])) for name in property_names}
+
+    drawn = 0
+    while drawn < n_samples:
+        size = min(chunk_size, n_samples - drawn)
+        f = as_float_material(_sample_material(rng, fiber, used, size, cov, param_cov))
+        m = as_float_material(_sample_material(rng, matrix, used, size, cov, param_cov))
+        Vf_samples = np.clip(rng.normal(Vf, Vf_std, size), 0.0, 1.0)
+        Vvoid_samples = np.clip(rng.normal(Vvoid, Vvoid_std, size), 0.0, 1.0 - Vf_samples)
+        for name in property_names:
+            stats[name].update(evaluate_entry(registry[name], f, m, Vf_samples, Vvoid_samples))
+        drawn += size
+
+    return {
+        name: {
+            "theories": registry[name]["theory_names"],
+            "mean": running.mean,
+            "std": running.std,
+            "min": running.min,
+            "max": running.max,
+            "percentiles": {q: running.percentile(q) for q in percentiles},
+            "b_basis": running.b_basis(),
+            "samples": running.count,
+            "invalid": running.invalid,
+        }
+        for name, running in stats.items()
+    }
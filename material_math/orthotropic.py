@@ -0,0 +1,72 @@
+# material_math/orthotropic.py
+
+# Full 3D orthotropic ply matrices for solid FE exports. Voigt order (1, 2, 3, 23, 13, 12) with
+# engineering shear strains, as in hooke_law.display_hooke_law_matrices. The ply is taken as
+# transversely isotropic for nu13 = nu12. Compliance S[..., 6, 6] is assembled per material, and
+# stiffness C = S^-1 for the whole stack is one np.linalg.inv call. Moduli in GPa -> S [1/MPa], C [MPa].
+
+import numpy as np
+
+from material_math.formulas import micromech_properties
+from material_math.material_table import fiber_table, matrix_table, evaluate_property_by_id
+from material_math.composite_materials import SOLID_KEYS
+
+ENGINEERING_CONSTANTS = ["E1", "E2", "E3", "nu12", "nu13", "nu23", "G12", "G13", "G23"]
+VOIGT_LABELS = ["1", "2", "3", "23", "13", "12"]
+
+def compliance_matrix(E1, E2, E3, nu12, nu13, nu23, G12, G13, G23):
+    # S[..., 6, 6] with nu21, nu31, nu32 from symmetry, so S is always symmetric
+    E1, E2, E3, G12, G13, G23 = (np.asarray(value, dtype=float) * 1000 for value in (E1, E2, E3, G12, G13, G23))
+    nu12, nu13, nu23 = (np.asarray(value, dtype=float) for value in (nu12, nu13, nu23))
+    S = np.zeros(np.broadcast(E1, E2, E3, nu12, nu13, nu23, G12, G13, G23).shape + (6, 6))
+    S[..., 0, 0] = 1 / E1
+    S[..., 1, 1] = 1 / E2
+    S[..., 2, 2] = 1 / E3
+    S[..., 0, 1] = S[..., 1, 0] = -nu12 / E1
+    S[..., 0, 2] = S[..., 2, 0] = -nu13 / E1
+    S[..., 1, 2] = S[..., 2, 1] = -nu23 / E2
+    S[..., 3, 3] = 1 / G23
+    S[..., 4, 4] = 1 / G13
+    S[..., 5, 5] = 1 / G12
+    return S
+
+def stiffness_matrix(S):
+    # C = S^-1 for every stacked matrix in one call; incomplete or singular materials come back NaN
+    S = np.asarray(S, dtype=float)
+    flat = S.reshape(-1, 6, 6)
+    C = np.full(flat.shape, np.nan)
+    with np.errstate(invalid='ignore'):
+        valid = np.isfinite(flat).all(axis=(1, 2)) & (np.abs(np.linalg.det(np.where(np.isfinite(flat), flat, 0))) > 0)
+    C[valid] = np.linalg.inv(flat[valid])
+    return C.reshape(S.shape)
+
+def first_theory(values):
+    # values[theory, ...] -> the first finite theory per point, NaN if none; same preference as saved materials
+    finite = np.isfinite(values)
+    pick = np.argmax(finite, axis=0)
+    return np.where(finite.any(axis=0), np.take_along_axis(values, pick[None], axis=0)[0], np.nan)
+
+def constants_from_properties(properties):
+    # {E1, E2, E3, nu12, nu23, G12, G13, G23} -> S, C; nu13 = nu12 (transverse isotropy)
+    S = compliance_matrix(*(properties["nu12" if name == "nu13" else name] for name in ENGINEERING_CONSTANTS))
+    return {"S": S, "C": stiffness_matrix(S)}
+
+def catalog_solid_matrices(Vf, Vvoid=0.0, fibers_table=None, matrices_table=None):
+    # Every fiber x matrix of the catalog (Vf, Vvoid broadcast against [fiber, matrix]) ->
+    # {"S", "C": array[fiber, matrix, ..., 6, 6], "constants": {name: array}, "fiber": names, "matrix": names}
+    tables = None if fibers_table is None and matrices_table is None else (fibers_table or fiber_table, matrices_table or matrix_table)
+    fibers, matrices = tables or (fiber_table, matrix_table)
+    Vf = np.asarray(Vf, dtype=float)
+    fiber_ids = np.arange(len(fibers)).reshape((-1, 1) + (1,) * Vf.ndim)
+    matrix_ids = np.arange(len(matrices)).reshape((1, -1) + (1,) * Vf.ndim)
+    properties = {
+        name: first_theory(evaluate_property_by_id(micromech_properties, name, fiber_ids, matrix_ids, Vf, Vvoid, tables)[1])
+        for name in ["E1", "E2", *SOLID_KEYS, "nu12", "G12"]
+    }
+    return {**constants_from_properties(properties), "constants": properties, "fiber": fibers.names, "matrix": matrices.names}
+
+def saved_solid_matrices(composites):
+    # Saved composite materials -> {"S", "C": array[material_id, 6, 6]}; NaN rows for materials saved
+    # before the 3D constants were stored
+    properties = {name: composites[name].to_numpy(dtype=float) if name in composites else np.full(len(composites), np.nan) for name in ["E1", "E2", *SOLID_KEYS, "nu12", "G12"]}
+    return constants_from_properties(properties)
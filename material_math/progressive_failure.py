@@ -0,0 +1,129 @@
+# material_math/progressive_failure.py
+
+# Load-stepping progressive ply failure for batches of laminates. Every step raises the load factor
+# on a reference load to the next ply failure, discounts the failed plies' stiffness and patches
+# A, B, D with those plies' change only, so ABD is never reassembled. First-ply failure (FPF) is the
+# first event; last-ply failure (LPF) is the load of the event after which the laminate has lost
+# its stiffness against the load (or every ply has failed in fiber mode).
+
+import numpy as np
+
+from material_math.laminate import ply_table, ply_transforms, ply_interfaces, ply_strengths, laminate_abd, assemble_abd, transformed_stiffness
+from material_math.failure_kernels import failure_kernels, MODES
+
+INTACT, MATRIX_FAILED, FIBER_FAILED = 0, 1, 2
+MATRIX_KNOCKDOWN = 0.01     # Q12, Q22, Q66 after transverse/shear failure
+FIBER_KNOCKDOWN = 1e-6      # whole ply after fiber failure, non-zero so ABD stays invertible
+COLLAPSE = 0.1              # laminate has failed once its stiffness against the load drops below this share
+
+def degraded_stiffness(Q, state, matrix_knockdown=MATRIX_KNOCKDOWN, fiber_knockdown=FIBER_KNOCKDOWN):
+    matrix = np.where(state >= MATRIX_FAILED, matrix_knockdown, 1.0)
+    Q = Q * np.where(state == FIBER_FAILED, fiber_knockdown, 1.0)[..., None, None]
+    Q[..., 0, 1] *= matrix
+    Q[..., 1, 0] *= matrix
+    Q[..., 1, 1] *= matrix
+    Q[..., 2, 2] *= matrix
+    return Q
+
+def _fiber_reserve(sigma1, strengths):
+    with np.errstate(divide='ignore'):
+        return np.where(sigma1 >= 0, strengths["F1T"] / sigma1, strengths["F1C"] / -sigma1)
+
+def progressive_failure(material_ids, angles, thickness, loads, criterion="Tsai-Wu", plies=None,
+                        matrix_knockdown=MATRIX_KNOCKDOWN, fiber_knockdown=FIBER_KNOCKDOWN, collapse=COLLAPSE, tol=1e-9):
+    # material_ids/angles/thickness[..., ply] as in laminate_stiffness; loads[..., 6] is the reference
+    # [Nx, Ny, Nxy, Mx, My, Mxy]. Failure loads are multiples of it. Returns {"fpf", "fpf_ply",
+    # "fpf_mode", "lpf", "ply_state", "ply_failure_load"[..., ply, 2] (matrix, fiber), "steps"}.
+    plies = plies or ply_table()
+    material_ids, angles, thickness = np.broadcast_arrays(np.asarray(material_ids), np.asarray(angles, dtype=float), np.asarray(thickness, dtype=float))
+    batch_shape, n_ply = material_ids.shape[:-1], material_ids.shape[-1]
+    ids, angles, thickness = (array.reshape(-1, n_ply) for array in (material_ids, angles, thickness))
+    n = len(ids)
+    loads = np.broadcast_to(np.asarray(loads, dtype=float), batch_shape + (6,)).reshape(n, 6)
+
+    transforms = ply_transforms(ids, angles, plies, names=["T_epsilon", "Q", "Qbar"])
+    strengths = {key: value[..., None] for key, value in ply_strengths(ids, plies).items()}
+    z = np.stack(ply_interfaces(thickness), axis=-1)
+    powers = np.stack([z[..., 1] - z[..., 0], (z[..., 1] ** 2 - z[..., 0] ** 2) / 2, (z[..., 1] ** 3 - z[..., 0] ** 3) / 3], axis=-1)
+
+    ABD = assemble_abd(*laminate_abd(transforms["Qbar"], thickness))
+    Qbar = transforms["Qbar"].copy()
+    Q = transforms["Q"].copy()
+    state = np.full((n, n_ply), INTACT)
+    load = np.zeros(n)
+    done = np.zeros(n, dtype=bool)
+    fpf = np.full(n, np.nan)
+    fpf_ply = np.full(n, -1)
+    fpf_mode = np.full(n, -1)
+    ply_failure_load = np.full((n, n_ply, 2), np.nan)
+    rows = np.arange(n)
+
+    for step in range(2 * n_ply + 1):
+        # Ply stresses under the reference load with the current (degraded) stiffness
+        with np.errstate(all='ignore'):
+            deformation = np.einsum('bij,bj->bi', np.linalg.inv(ABD), loads)
+        compliance = np.einsum('bi,bi->b', loads, deformation)
+        if step == 0:
+            intact_compliance = compliance
+        done |= ~(compliance * collapse <= intact_compliance)
+        global_strain = deformation[:, None, None, :3] + z[..., None] * deformation[:, None, None, 3:]
+        strain = np.einsum('bkij,bkfj->bkfi', transforms["T_epsilon"], global_strain)
+        stress = np.einsum('bkij,bkfj->bkfi', Q, strain)
+
+        result = failure_kernels[criterion](stress, strengths)
+        reserve = np.where(state[..., None] == INTACT, result["reserve"], _fiber_reserve(stress[..., 0], strengths))
+        mode = np.where(state[..., None] == INTACT, result["mode"], 0)
+        face = np.argmin(np.where(np.isnan(reserve), np.inf, reserve), axis=-1)
+        reserve = np.take_along_axis(reserve, face[..., None], axis=-1)[..., 0]
+        mode = np.take_along_axis(mode, face[..., None], axis=-1)[..., 0]
+        reserve = np.where((state == FIBER_FAILED) | (reserve <= 0), np.inf, reserve)
+
+        # Next event: the weakest ply, never below the current load (cascades happen at constant load)
+        next_load = np.maximum(load, reserve.min(axis=1))
+        done |= ~np.isfinite(next_load)
+        failing = (reserve <= next_load[:, None] * (1 + tol)) & ~done[:, None]
+        if not failing.any():
+            break
+        load = np.where(done, load, next_load)
+
+        first = failing.any(axis=1) & np.isnan(fpf)
+        weakest = np.argmin(reserve, axis=1)
+        fpf = np.where(first, load, fpf)
+        fpf_ply = np.where(first, weakest, fpf_ply)
+        fpf_mode = np.where(first, mode[rows, weakest], fpf_mode)
+
+        new_state = np.where(failing, np.where((mode == 0) | (state == MATRIX_FAILED), FIBER_FAILED, MATRIX_FAILED), state)
+        changed_b, changed_k = np.nonzero(new_state != state)
+        ply_failure_load[changed_b, changed_k, new_state[changed_b, changed_k] - 1] = load[changed_b]
+        state = new_state
+
+        # Incremental ABD update from the changed plies only
+        Q[changed_b, changed_k] = degraded_stiffness(transforms["Q"][changed_b, changed_k], state[changed_b, changed_k], matrix_knockdown, fiber_knockdown)
+        new_Qbar = transformed_stiffness(Q[changed_b, changed_k], angles[changed_b, changed_k])
+        delta = new_Qbar - Qbar[changed_b, changed_k]
+        Qbar[changed_b, changed_k] = new_Qbar
+        weights = powers[changed_b, changed_k]
+        np.add.at(ABD, (changed_b, slice(0, 3), slice(0, 3)), delta * weights[:, 0, None, None])
+        np.add.at(ABD, (changed_b, slice(0, 3), slice(3, 6)), delta * weights[:, 1, None, None])
+        np.add.at(ABD, (changed_b, slice(3, 6), slice(0, 3)), delta * weights[:, 1, None, None])
+        np.add.at(ABD, (changed_b, slice(3, 6), slice(3, 6)), delta * weights[:, 2, None, None])
+
+        done |= (state == FIBER_FAILED).all(axis=1)
+        if done.all():
+            break
+
+    # Laminates with missing strengths have no failure loads
+    known = np.all([np.isfinite(value[..., 0]).all(axis=1) for value in strengths.values()], axis=0) if strengths else np.zeros(n, dtype=bool)
+    lpf = np.where(known & (load > 0), load, np.nan)
+    return {
+        "fpf": np.where(known, fpf, np.nan).reshape(batch_shape),
+        "fpf_ply": fpf_ply.reshape(batch_shape),
+        "fpf_mode": fpf_mode.reshape(batch_shape),
+        "lpf": lpf.reshape(batch_shape),
+        "ply_state": state.reshape(batch_shape + (n_ply,)),
+        "ply_failure_load": ply_failure_load.reshape(batch_shape + (n_ply, 2)),
+        "steps": step + 1,
+    }
+
+def mode_names(modes):
+    return np.asarray(("",) + MODES)[np.asarray(modes) + 1]
@@ -3,8 +3,13 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 import matplotlib.pyplot as plt
-from material_math.formulas import micromech_properties, strength_properties, failure_criteria
+from material_math.formulas import micromech_properties, strength_properties, thermal_properties, failure_criteria
 from material_math.composite_materials import initialize_composite_materials, add_composite_material, display_composite_materials, get_composite_properties
+from material_math.registry import find_property, get_registry
+from material_math.engine import as_float_material, evaluate_entry
+from material_math.adaptive_sampling import adaptive_sample
+from material_math.lazy_latex import LazyLatex, render_coefficient
+from material_math.material_table import theory_supported
 
 import inspect
 
@@ -15,64 +20,40 @@ def calculate_properties(category, fibers, matrices, fiber_material_key, matrix_
     coefficients_latex = {}
     theories_map = {}
 
-    fiber_material = fibers[fiber_material_key]
-    matrix_material = matrices[matrix_material_key]
+    fiber_material = as_float_material(fibers[fiber_material_key])
+    matrix_material = as_float_material(matrices[matrix_material_key])
 
-    for property_name, theories in category.items():
+    for property_name, entry in get_registry(category).items():
         results[property_name] = []
         latex_results[property_name] = {}
         coefficients_latex[property_name] = {}
-        theories_map[property_name] = [theory_name for theory_name in theories if theory_name not in ["unit", "name", "help"]]
-
-        for theory_name, theory_details in theories.items():
-            if theory_name in ["unit", "name", "help"]:
+        theories_map[property_name] = entry["theory_names"]
+
+        for theory_name, theory in entry["theories"].items():
+            latex_results[property_name][theory_name] = theory["latex"]
+            if not theory_supported(theory, fibers[fiber_material_key], matrices[matrix_material_key]):
+                # material data is missing a parameter this theory needs; skip instead of computing NaN
+                results[property_name].append(None)
+                if show_math:
+                    math_results.setdefault(property_name, {})[theory_name] = None
                 continue
 
-            formula = theory_details["formula"]
-            latex_formula = theory_details["latex"]
-            math_formula = theory_details.get("math", None)
-
-            try:
-                coefficients = {}
-                if 'coefficients' in theory_details:
-                    coefficients_latex[property_name][theory_name] = {}
-                    for coeff_name, coeff_details in theory_details['coefficients'].items():
-                        if 'formula' in coeff_details:
-                            num_args = coeff_details['formula'].__code__.co_argcount
-                            if num_args == 2:
-                                coefficients[coeff_name] = coeff_details['formula'](fiber_material, matrix_material)
-                            elif num_args == 4:
-                                coefficients[coeff_name] = coeff_details['formula'](fiber_material, matrix_material, Vf, Vm)
-                            coefficients_latex[property_name][theory_name][coeff_name] = f"{coeff_details['latex']} = {coefficients[coeff_name]:.3f}"
-                        else:
-                            coefficients[coeff_name] = coeff_details['default']
-                            coefficients_latex[property_name][theory_name][coeff_name] = f"{coeff_details['latex']} = {coefficients[coeff_name]:.3f}"
-
-                if "Vvoid" in formula.__code__.co_varnames:
-                    result = formula(fiber_material, matrix_material, Vf, Vm, Vvoid, **coefficients)
-                else:
-                    result = formula(fiber_material, matrix_material, Vf, Vm, **coefficients)
-                
-                if math_formula:
-                    if 'Vvoid' in math_formula.__code__.co_varnames:
-                        interpolated_math = math_formula(fiber_material, matrix_material, Vf, Vm, Vvoid, **coefficients)
-                    else:
-                        interpolated_math = math_formula(fiber_material, matrix_material, Vf, Vm, **coefficients)
-                else:
-                    interpolated_math = None
-
-            except TypeError as e:
-                st.error(f"Error calculating {property_name} with {theory_name}: {e}")
-                result = None
-                interpolated_math = None
+            coefficients = theory["coefficients"](fiber_material, matrix_material, Vf, Vm)
+            if theory["coefficients_latex"]:
+                coefficients_latex[property_name][theory_name] = {
+                    coeff_name: LazyLatex(render_coefficient, coeff_latex, coefficients[coeff_name])
+                    for coeff_name, coeff_latex in theory["coefficients_latex"].items()
+                }
+
+            with np.errstate(all='ignore'):
+                result = theory["formula"](fiber_material, matrix_material, Vf, Vm, Vvoid, coefficients)
 
             results[property_name].append(result)
-            latex_results[property_name][theory_name] = latex_formula
 
             if show_math:
                 if property_name not in math_results:
                     math_results[property_name] = {}
-                math_results[property_name][theory_name] = interpolated_math
+                math_results[property_name][theory_name] = LazyLatex(theory["math"], fiber_material, matrix_material, Vf, Vm, Vvoid, coefficients) if theory["math"] else None
 
     # Ensure all lists are the same length
     max_length = max(len(results[prop]) for prop in results)
@@ -153,88 +134,69 @@ def plot_properties(results, properties, units, theories):
     return results_df
 
 def get_property_units(properties):
-    unit_map = {**micromech_properties, **strength_properties, **failure_criteria}
+    unit_map = {**micromech_properties, **strength_properties, **thermal_properties, **failure_criteria}
     return [unit_map[prop].get("unit", '') for prop in properties]
 
 
 
-def display_theories(property_name, results, latex_results, math_results, coefficients_latex, fiber_material_key, fiber_material, matrix_material_key, matrix_material, Vf, Vm, Vvoid, sigma=None, show_individual_graphs=False, show_math=False):
-    theory_dict = micromech_properties if property_name in micromech_properties else strength_properties if property_name in strength_properties else failure_criteria
-    theory_names = [name for name in theory_dict[property_name].keys() if name not in ["unit", "name", "help"]]
+def display_theories(property_name, results, latex_results, math_results, coefficients_latex, fiber_material_key, fiber_material, matrix_material_key, matrix_material, Vf, Vm, Vvoid, sigma=None, show_individual_graphs=False, show_math=False, graph_resolution=100):
+    entry = find_property(property_name)
+    theory_names = entry["theory_names"]
 
     col1, col2 = st.columns([3, 1])
     with col1:
-        st.subheader(f"`{property_name.title()}` {theory_dict[property_name]['name']}", help=theory_dict[property_name]['help'])
+        st.subheader(f"`{property_name.title()}` {entry['name']}", help=entry['help'])
     with col2:
         st.caption(f"""{fiber_material_key}\n {matrix_material_key}""")
 
-    unit = theory_dict[property_name].get('unit', '')
+    unit = entry['unit']
 
     if len(theory_names) > 1:
         selected_theory = st.radio(f'Select theory for {property_name} ', theory_names, horizontal=True, label_visibility="collapsed")
     else:
         selected_theory = theory_names[0]
 
-    theory_details = theory_dict[property_name][selected_theory]
-    formula = theory_details["formula"]
+    theory = entry["theories"][selected_theory]
     latex = latex_results[property_name][selected_theory]
     result = results[property_name][theory_names.index(selected_theory)]
 
     if selected_theory in coefficients_latex[property_name]:
         for coeff, coeff_latex in coefficients_latex[property_name][selected_theory].items():
-            st.latex(coeff_latex)
+            st.latex(str(coeff_latex))
 
-    if show_math and math_results[property_name][selected_theory]:
+    if result is None:
+        st.latex(f"{latex}")
+        st.caption(f"{selected_theory} needs material data that {fiber_material_key} / {matrix_material_key} doesn't have.")
+    elif show_math and math_results[property_name][selected_theory]:
         st.latex(f"{latex}")
         st.latex(f"{math_results[property_name][selected_theory]} = {result:.3f} \\ [{unit}]")
-        formula_code = inspect.getsource(theory_details["formula"])
+        formula_code = inspect.getsource(theory["source"])
         st.code(formula_code, language='python')
     else:
         st.latex(f"{latex} = {result:.3f} \\ [{unit}]")
         # st.write(f"aaaaa {latex} = {result:.3f} [{unit}]")
 
     if show_individual_graphs:
-        vfs = np.linspace(0, 1, 100)
-        all_values = {theory: [] for theory in theory_names}
-
-        for vf in vfs:
-            vm = 1 - vf
-            for theory in theory_names:
-                formula = theory_dict[property_name][theory]["formula"]
-                coeffs = {}
-                if 'coefficients' in theory_dict[property_name][theory]:
-                    for coeff_name, coeff_details in theory_dict[property_name][theory]['coefficients'].items():
-                        num_args = coeff_details['formula'].__code__.co_argcount
-                        if num_args == 2:
-                            coeffs[coeff_name] = coeff_details['formula'](fiber_material, matrix_material)
-                        elif num_args == 4:
-                            coeffs[coeff_name] = coeff_details['formula'](fiber_material, matrix_material, vf, vm)
-                        else:
-                            coeffs[coeff_name] = coeff_details['default']
-                if "Vvoid" in formula.__code__.co_varnames:
-                    value = formula(fiber_material, matrix_material, vf, vm, Vvoid, **coeffs)
-                else:
-                    value = formula(fiber_material, matrix_material, vf, vm, **coeffs)
-                all_values[theory].append(value)
+        # Adaptive Vf samples: points go where curves bend, blow up or cross, within the point budget
+        evaluate = lambda vfs: evaluate_entry(entry, fiber_material, matrix_material, vfs, Vvoid)
+        sampled = adaptive_sample(evaluate, theory_names, budget=graph_resolution)
 
         fig, ax = plt.subplots(figsize=(12, 6))
 
         color_map = plt.get_cmap('tab10')
         color_dict = {theory: color_map(i) for i, theory in enumerate(theory_names)}
 
-        # Initialize max_value as -infinity to find the actual maximum value
-        # max_value = -np.inf
-        max_value = -400
-        max_theory = None
-        max_value_at_Vf = None
+        for theory, values in zip(theory_names, sampled["values"]):
+            ax.plot(sampled["Vf"], values, label=theory)
 
-        for theory, values in all_values.items():
-            ax.plot(vfs, values, label=theory)
-            current_value = values[np.abs(vfs - Vf).argmin()]
-            if current_value > max_value:  # Correct comparison to find the maximum value
-                max_value = current_value
-                max_theory = theory
-                max_value_at_Vf = current_value
+        for theory_a, theory_b, crossover_Vf, crossover_value in sampled["crossovers"]:
+            ax.scatter(crossover_Vf, crossover_value, marker='x', color='gray', zorder=4)
+
+        # Highest theory at the current Vf
+        values_at_Vf = evaluate(np.array([Vf]))[:, 0]
+        max_idx = np.argmax(np.where(np.isfinite(values_at_Vf), values_at_Vf, -np.inf))
+        max_theory = theory_names[max_idx]
+        max_value_at_Vf = values_at_Vf[max_idx]
 
         # Add the dot and text box at the intersection
         ax.scatter(Vf, max_value_at_Vf, color=color_dict[max_theory], zorder=5)
@@ -247,4 +209,7 @@ def display_theories(property_name, results, latex_results, math_results, coeffi
         ax.set_ylabel(f'{property_name.replace("_", " ").title()} ({unit})')
         ax.legend()
         ax.grid(True)
-        st.pyplot(fig)
\ No newline at end of file
+        st.pyplot(fig)
+
+        if sampled["crossovers"]:
+            st.caption("Crossovers: " + ", ".join(f"{theory_a} / {theory_b} at Vf = {crossover_Vf:.4f}" for theory_a, theory_b, crossover_Vf, _ in sampled["crossovers"]))
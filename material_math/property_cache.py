@@ -0,0 +1,62 @@
+# material_math/property_cache.py
+
+import threading
+from collections import OrderedDict
+
+from material_math.properties import calculate_properties
+from material_math.registry import get_registry
+
+CACHE_SIZE = 256
+
+class PropertyCache:
+    # Bounded LRU shared by every Streamlit session in the process
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+property_cache = PropertyCache()
+
+def materials_version(fibers, matrices):
+    # Changes whenever any material value is edited, so stale entries are never served
+    return hash(repr(fibers) + repr(matrices))
+
+def theory_set(category):
+    return tuple((property_name, tuple(entry["theory_names"])) for property_name, entry in get_registry(category).items())
+
+def cached_calculate_properties(category, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid=0, show_math=True):
+    # Same return value as calculate_properties; results are shared between callers, don't mutate them.
+    # Vm follows from Vf (and Vvoid), so it isn't part of the key.
+    key = (fiber_material_key, matrix_material_key, Vf, Vvoid, show_math, theory_set(category), materials_version(fibers, matrices))
+    results = property_cache.get(key)
+    if results is None:
+        results = calculate_properties(category, fibers, matrices, fiber_material_key, matrix_material_key, Vf, Vm, Vvoid, show_math=show_math)
+        property_cache.put(key, results)
+    return results
@@ -0,0 +1,99 @@
+# material_math/registry.py
+
+# Compiles every theory in formulas.py once at import into evaluators with a fixed signature:
+#   coefficients(f, m, Vf, Vm) -> {name: value}
+#   formula(f, m, Vf, Vm, Vvoid, coefficients) -> value
+#   math(f, m, Vf, Vm, Vvoid, coefficients) -> str | None
+# so evaluation never has to look at __code__ or guess call signatures.
+
+import types
+
+from material_math.formulas import micromech_properties, strength_properties, thermal_properties
+
+META_KEYS = ["unit", "name", "help"]
+
+def _code_strings(code):
+    for const in code.co_consts:
+        if isinstance(const, str):
+            yield const
+        elif isinstance(const, types.CodeType):
+            yield from _code_strings(const)
+
+def _required_keys(theory_details):
+    # Every string constant the formula and its coefficients index with, e.g. f['E1f'] -> 'E1f'
+    functions = [theory_details["formula"]] + [coeff['formula'] for coeff in theory_details.get('coefficients', {}).values() if 'formula' in coeff]
+    return frozenset(key for function in functions for key in _code_strings(function.__code__))
+
+def _positional_args(function):
+    return function.__code__.co_varnames[:function.__code__.co_argcount]
+
+def _compile_coefficient(coeff_details):
+    if 'formula' not in coeff_details:
+        default = coeff_details['default']
+        return lambda f, m, Vf, Vm: default
+    formula = coeff_details['formula']
+    if len(_positional_args(formula)) == 2:
+        return lambda f, m, Vf, Vm: formula(f, m)
+    return formula
+
+def _compile_coefficients(coefficients):
+    if not coefficients:
+        return lambda f, m, Vf, Vm: {}
+    compiled = [(coeff_name, _compile_coefficient(coeff_details)) for coeff_name, coeff_details in coefficients.items()]
+    return lambda f, m, Vf, Vm: {coeff_name: evaluate(f, m, Vf, Vm) for coeff_name, evaluate in compiled}
+
+def _compile_formula(formula):
+    if formula is None:
+        return None
+    if "Vvoid" in _positional_args(formula):
+        return lambda f, m, Vf, Vm, Vvoid, coefficients: formula(f, m, Vf, Vm, Vvoid, **coefficients)
+    return lambda f, m, Vf, Vm, Vvoid, coefficients: formula(f, m, Vf, Vm, **coefficients)
+
+def compile_theory(theory_details):
+    coefficients = theory_details.get('coefficients', {})
+    return {
+        "formula": _compile_formula(theory_details["formula"]),
+        "math": _compile_formula(theory_details.get("math")),
+        "latex": theory_details["latex"],
+        "coefficients": _compile_coefficients(coefficients),
+        "coefficients_latex": {coeff_name: coeff_details['latex'] for coeff_name, coeff_details in coefficients.items()},
+        "source": theory_details["formula"],
+        "details": theory_details,
+        "params": _required_keys(theory_details),
+    }
+
+def compile_category(category):
+    registry = {}
+    for property_name, theories in category.items():
+        theory_names = [name for name in theories if name not in META_KEYS]
+        registry[property_name] = {
+            "name": theories.get("name", property_name),
+            "help": theories.get("help", ""),
+            "unit": theories.get("unit", ""),
+            "theory_names": theory_names,
+            "theories": {theory_name: compile_theory(theories[theory_name]) for theory_name in theory_names},
+        }
+    return registry
+
+micromech_registry = compile_category(micromech_properties)
+strength_registry = compile_category(strength_properties)
+thermal_registry = compile_category(thermal_properties)
+
+# keyed by id(); the category itself is held too so its id can't be reused
+_registries = {
+    id(micromech_properties): (micromech_properties, micromech_registry),
+    id(strength_properties): (strength_properties, strength_registry),
+    id(thermal_properties): (thermal_properties, thermal_registry),
+}
+
+def get_registry(category):
+    # Categories other than the built-in ones are compiled on first use and kept
+    if id(category) not in _registries:
+        _registries[id(category)] = (category, compile_category(category))
+    return _registries[id(category)][1]
+
+def find_property(property_name):
+    for registry in (micromech_registry, strength_registry, thermal_registry):
+        if property_name in registry:
+            return registry[property_name]
+    return None
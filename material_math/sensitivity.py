@@ -0,0 +1,99 @@
+# material_math/sensitivity.py
+
+# Analytic derivatives of every theory. Each formula is traced once with sympy symbols in place of
+# material values, differentiated, and lambdified into one vectorized callable returning the value
+# and every partial derivative together. Vm = 1 - Vf, so d/dVf includes the matrix share.
+
+import types
+
+import numpy as np
+import sympy as sp
+
+from material_math.registry import get_registry, compile_theory
+from material_math.engine import as_float_material, broadcast_shape, missing_mask
+
+Vf_symbol, Vvoid_symbol = sp.symbols("Vf Vvoid")
+
+# Stand-in for numpy inside the traced formulas
+sympy_np = types.SimpleNamespace(
+    sqrt=sp.sqrt,
+    pi=sp.pi,
+    where=lambda condition, a, b: sp.Piecewise((a, condition), (b, True)),
+)
+
+class _Symbols(dict):
+    # f['E1f'] -> Symbol('E1f'), created on first access
+    def __missing__(self, key):
+        self[key] = sp.Symbol(key)
+        return self[key]
+
+def _symbolic(function):
+    return types.FunctionType(function.__code__, {**function.__globals__, "np": sympy_np}, function.__name__, function.__defaults__, function.__closure__)
+
+def _symbolic_details(details):
+    return {
+        **details,
+        "formula": _symbolic(details["formula"]),
+        "math": None,
+        "coefficients": {
+            coeff_name: ({**coeff, "formula": _symbolic(coeff["formula"])} if "formula" in coeff else coeff)
+            for coeff_name, coeff in details.get("coefficients", {}).items()
+        },
+    }
+
+def trace_theory(theory):
+    # Registry theory -> sympy expression in Vf, Vvoid and the material parameters it reads
+    symbolic = compile_theory(_symbolic_details(theory["details"]))
+    f, m = _Symbols(), _Symbols()
+    Vm = 1 - Vf_symbol
+    coefficients = symbolic["coefficients"](f, m, Vf_symbol, Vm)
+    return sp.sympify(symbolic["formula"](f, m, Vf_symbol, Vm, Vvoid_symbol, coefficients))
+
+_gradients = {}
+
+def theory_gradient(category, property_name, theory_name):
+    # Built on first use, then reused: {"variables": [...], "function": callable, "expression": expr}
+    key = (id(category), property_name, theory_name)
+    if key not in _gradients:
+        theory = get_registry(category)[property_name]["theories"][theory_name]
+        expression = trace_theory(theory)
+        params = sorted((symbol for symbol in expression.free_symbols if symbol not in (Vf_symbol, Vvoid_symbol)), key=lambda symbol: symbol.name)
+        variables = [Vf_symbol, Vvoid_symbol] + params
+        derivatives = [sp.diff(expression, variable) for variable in variables]
+        _gradients[key] = {
+            "variables": [variable.name for variable in variables],
+            "function": sp.lambdify(variables, [expression] + derivatives, modules="numpy", cse=True),
+            "expression": expression,
+        }
+    return _gradients[key]
+
+def evaluate_with_gradient(category, property_name, theory_name, f, m, Vf, Vvoid=0.0):
+    # -> (value, {"Vf": d/dVf, "Vvoid": d/dVvoid, "E1f": d/dE1f, ...}), all broadcast to one shape
+    gradient = theory_gradient(category, property_name, theory_name)
+    theory = get_registry(category)[property_name]["theories"][theory_name]
+    f = as_float_material(f)
+    m = as_float_material(m)
+    Vf = np.asarray(Vf, dtype=float)
+    Vvoid = np.asarray(Vvoid, dtype=float)
+    shape = broadcast_shape(f, m, Vf, Vvoid)
+
+    arguments = [Vf, Vvoid] + [f[name] if name in f else m[name] for name in gradient["variables"][2:]]
+    with np.errstate(all='ignore'):
+        outputs = gradient["function"](*arguments)
+
+    missing = missing_mask(theory, f, m, shape)
+    outputs = [np.where(missing, np.nan, np.broadcast_to(np.asarray(output, dtype=float), shape)) for output in outputs]
+    return outputs[0], dict(zip(gradient["variables"], outputs[1:]))
+
+def property_sensitivities(category, property_name, f, m, Vf, Vvoid=0.0):
+    # Every theory of a property -> (theory_names, values[theory, ...], {variable: d/dvariable[theory, ...]}).
+    # Variables a theory doesn't depend on get zeros.
+    entry = get_registry(category)[property_name]
+    evaluated = [evaluate_with_gradient(category, property_name, theory_name, f, m, Vf, Vvoid) for theory_name in entry["theory_names"]]
+    values = np.stack([value for value, _ in evaluated])
+    variables = sorted({name for _, gradient in evaluated for name in gradient}, key=lambda name: (name not in ("Vf", "Vvoid"), name))
+    gradients = {
+        name: np.stack([gradient.get(name, np.zeros_like(value)) for value, gradient in evaluated])
+        for name in variables
+    }
+    return entry["theory_names"], values, gradients
@@ -0,0 +1,186 @@
+# material_math/stacking_optimizer.py
+
+# Minimum-thickness symmetric, balanced stacking sequences for a set of running loads. The search
+# grows the ply count until something passes. For each count, ply compositions (0 / ±45 pairs / 90
+# per half stack) are checked first: membrane stiffness and, without moments, ply stresses of a
+# symmetric laminate only depend on the counts. Stacking orders are only enumerated for compositions
+# that pass, filtered by the design rules and evaluated in batches on a process pool.
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import streamlit as st
+from numpy.lib.stride_tricks import sliding_window_view
+from sympy.utilities.iterables import multiset_permutations
+
+from material_math.laminate import ply_table, laminate_stiffness, ply_stresses, ply_strengths, engineering_constants
+from material_math.failure_kernels import failure_kernels
+from femap.wing_load import skin_running_loads
+from femap.internal_loads import wing_sections
+
+# Half-stack units; ±45 only comes as a pair, which keeps every laminate balanced
+UNITS = {0: [0.0], 1: [45.0, -45.0], 2: [90.0]}
+DEFAULT_TARGETS = {"Ex": 0.0, "Ey": 0.0, "Gxy": 0.0, "safety_factor": 1.5}
+DEFAULT_RULES = {"min_share": 0.1, "max_run": 4, "outer_45": True}
+BATCH_SIZE = 2048
+
+def compositions(n_half, min_share=0.0):
+    # (n0, n45 pairs, n90) filling n_half plies, each direction holding at least min_share of them
+    minimum = math.ceil(min_share * n_half - 1e-9)
+    return [
+        (n0, pairs, n_half - n0 - 2 * pairs)
+        for pairs in range(n_half // 2 + 1)
+        for n0 in range(n_half - 2 * pairs + 1)
+        if min(n0, 2 * pairs, n_half - n0 - 2 * pairs) >= minimum
+    ]
+
+def expand(orders):
+    # Unit codes [candidate, unit] -> symmetric ply angles [candidate, ply]
+    half = np.array([np.concatenate([UNITS[unit] for unit in order]) for order in orders])
+    return np.concatenate([half, half[:, ::-1]], axis=1)
+
+def follows_rules(angles, rules):
+    keep = np.ones(len(angles), dtype=bool)
+    if rules.get("max_run") and angles.shape[1] > rules["max_run"]:
+        windows = sliding_window_view(angles, rules["max_run"] + 1, axis=1)
+        keep &= ~(windows == windows[..., :1]).all(axis=-1).any(axis=-1)
+    if rules.get("outer_45"):
+        keep &= np.abs(angles[:, 0]) == 45
+    return keep
+
+def evaluate_candidates(angles, material_id, plies, ply_thickness, loads, targets, criterion):
+    # angles[candidate, ply] against every load in loads[load, 6] -> (feasible, min reserve, D11)
+    ids = np.full(angles.shape, material_id)
+    thickness = np.full(angles.shape, ply_thickness)
+    laminate = laminate_stiffness(ids, angles, thickness, plies)
+    constants = engineering_constants(laminate["A"], thickness)
+    stiff = np.all([constants[name] >= targets.get(name, 0.0) * 1000 for name in ("Ex", "Ey", "Gxy")], axis=0)
+
+    batched = {key: value[:, None] for key, value in laminate.items()}
+    stresses = ply_stresses(ids[:, None], angles[:, None], thickness[:, None], loads, plies, laminate=batched)["stress"]
+    strengths = {key: value[:, None, :, None] for key, value in ply_strengths(ids, plies).items()}
+    reserve = failure_kernels[criterion](stresses, strengths)["reserve"].reshape(len(angles), -1).min(axis=1)
+    return stiff & (reserve >= targets.get("safety_factor", 1.0)), reserve, laminate["D"][:, 0, 0]
+
+def _search_orders(orders, material_id, plies, ply_thickness, loads, targets, rules, criterion):
+    # Process pool worker: one batch of half-stack orders -> (rule rejects, passing designs)
+    angles = expand(orders)
+    keep = follows_rules(angles, rules)
+    if not keep.any():
+        return int((~keep).sum()), []
+    feasible, reserve, D11 = evaluate_candidates(angles[keep], material_id, plies, ply_thickness, loads, targets, criterion)
+    designs = [(angles[keep][idx].tolist(), float(reserve[idx]), float(D11[idx])) for idx in np.nonzero(feasible)[0]]
+    return int((~keep).sum()), designs
+
+def stacking_orders(composition, max_orders, rng):
+    # Every distinct order of the half stack, or a random sample of max_orders when there are more
+    units = np.repeat([0, 1, 2], composition)
+    count = math.factorial(len(units)) // math.prod(math.factorial(n) for n in composition)
+    if count <= max_orders:
+        return np.array(list(multiset_permutations(units.tolist())))
+    return np.unique(rng.permuted(np.tile(units, (max_orders, 1)), axis=1), axis=0)
+
+def optimize_stacking(loads, material_id, ply_thickness=0.125, targets=None, rules=None, criterion="Tsai-Wu",
+                      plies=None, max_plies=32, max_orders=20000, workers=None, top=5, seed=0):
+    # loads[..., 6] running loads [N/mm, N mm/mm] (stations, load cases); all plies of saved composite
+    # material_id. Returns the thinnest passing designs: {"plies", "thickness", "designs": [(angles,
+    # min reserve, D11)] best first, "stats"}; "designs" is empty when nothing up to max_plies passes.
+    plies = plies or ply_table()
+    targets = {**DEFAULT_TARGETS, **(targets or {})}
+    rules = {**DEFAULT_RULES, **(rules or {})}
+    loads = np.asarray(loads, dtype=float).reshape(-1, 6)
+    rng = np.random.default_rng(seed)
+    stats = {"compositions": 0, "bound": 0, "membrane": 0, "rules": 0, "evaluated": 0}
+
+    # Lower bound: the average stress over the thickness can't beat the fiber strength
+    strengths = {key: float(value[material_id]) for key, value in plies.items()}
+    running = np.abs(loads[:, :2]).max() * targets["safety_factor"]
+    fiber = min(strengths.get("F1T", np.inf), strengths.get("F1C", np.inf))
+    n_start = max(1, math.ceil(running / (fiber * ply_thickness) / 2)) if np.isfinite(fiber) else 1
+    membrane_only = not np.any(loads[:, 3:])
+
+    pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count()) if workers != 1 else None
+    try:
+        for n_half in range(1, max_plies // 2 + 1):
+            candidates = compositions(n_half, rules["min_share"])
+            stats["compositions"] += len(candidates)
+            if n_half < n_start:
+                stats["bound"] += len(candidates)
+                continue
+            if not candidates:
+                continue
+
+            # Without moments one representative order decides the whole composition
+            if membrane_only:
+                representatives = [[0] * n0 + [1] * pairs + [2] * n90 for n0, pairs, n90 in candidates]
+                feasible, _, _ = evaluate_candidates(expand(representatives), material_id, plies, ply_thickness, loads, targets, criterion)
+                stats["membrane"] += int((~feasible).sum())
+                candidates = [composition for composition, ok in zip(candidates, feasible) if ok]
+
+            batches = [
+                orders[start:start + BATCH_SIZE]
+                for composition in candidates
+                for orders in [stacking_orders(composition, max_orders, rng)]
+                for start in range(0, len(orders), BATCH_SIZE)
+            ]
+            if not batches:
+                continue
+            arguments = [(batch, material_id, plies, ply_thickness, loads, targets, rules, criterion) for batch in batches]
+            results = pool.map(_search_orders, *zip(*arguments)) if pool else (_search_orders(*args) for args in arguments)
+
+            designs = []
+            for batch, (rejected, passing) in zip(batches, results):
+                stats["rules"] += rejected
+                stats["evaluated"] += len(batch) - rejected
+                designs += passing
+            if designs:
+                designs.sort(key=lambda design: (-design[1], -design[2]))
+                return {"plies": 2 * n_half, "thickness": 2 * n_half * ply_thickness, "designs": designs[:top], "stats": stats}
+    finally:
+        if pool:
+            pool.shutdown()
+    return {"plies": None, "thickness": None, "designs": [], "stats": stats}
+
+def format_layup(angles):
+    half = [int(angle) for angle in angles[:len(angles) // 2]]
+    return "[" + "/".join(f"{angle:+d}" if abs(angle) == 45 else str(angle) for angle in half) + "]s"
+
+def stacking_optimizer_ui(yk, Fk, wing, composites=None):
+    # yk, Fk: nodal forces from femap.wing_load.calc_wing_load; wing: preset wing dict
+    composites = st.session_state['composite_materials'] if composites is None else composites
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        material_id = st.selectbox("Ply material", composites.index, index=len(composites) - 1, format_func=lambda idx: f"{composites.loc[idx, 'Fiber']} / {composites.loc[idx, 'Matrix']}", key="stacking_material")
+        ply_thickness = st.number_input("Ply thickness [mm]", min_value=0.01, value=0.125, step=0.005, format="%.3f", key="stacking_ply_thickness")
+    with col2:
+        safety_factor = st.number_input("Safety factor on FPF", min_value=1.0, value=1.5, step=0.1)
+        criterion = st.selectbox("Criterion", list(failure_kernels.keys()), index=1, key="stacking_criterion")
+    with col3:
+        Ex = st.number_input("Min Ex [GPa]", min_value=0.0, value=0.0)
+        Gxy = st.number_input("Min Gxy [GPa]", min_value=0.0, value=0.0)
+    with col4:
+        max_plies = st.number_input("Max plies", min_value=2, max_value=64, value=32, step=2)
+        # Wing box between the spars (chord fractions), as deep as the root airfoil
+        box_width = st.number_input("Box width [mm]", min_value=1.0, value=wing['root'] * (1 - wing['fwd_spar'] - wing['aft_spar']) * 1000)
+        box_height = st.number_input("Box height [mm]", min_value=1.0, value=float(wing_sections(wing, 0.0, 1.0)["depth"]))
+
+    loads = skin_running_loads(yk, Fk, box_width, box_height)
+    st.write(f"Root skin load Nx = {loads[0, 0]:.1f} N/mm (and reversed for negative load factors)")
+    if not st.button("Search stacking sequences"):
+        return
+    cases = np.concatenate([loads, -loads])
+    with st.spinner("Searching..."):
+        result = optimize_stacking(cases, material_id, ply_thickness, {"Ex": Ex, "Gxy": Gxy, "safety_factor": safety_factor}, criterion=criterion, plies=ply_table(composites), max_plies=int(max_plies))
+    stats = result["stats"]
+    st.caption(f"{stats['compositions']} compositions ({stats['bound']} below thickness bound, {stats['membrane']} failed membrane check), {stats['rules']} orders broke design rules, {stats['evaluated']} evaluated")
+    if not result["designs"]:
+        st.error(f"No stacking sequence up to {max_plies} plies meets the targets.")
+        return
+    st.success(f"{result['plies']} plies, h = {result['thickness']:.3f} mm")
+    st.dataframe({
+        "Layup": [format_layup(angles) for angles, _, _ in result["designs"]],
+        "Min reserve": [reserve for _, reserve, _ in result["designs"]],
+        "D11 [N mm]": [D11 for _, _, D11 in result["designs"]],
+    })
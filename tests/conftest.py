@@ -0,0 +1,19 @@
+# tests/conftest.py
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Modules import each other from the repository root (materials, femap, material_math)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from material_math.composite_materials import strength_columns
+from material_math.laminate import ply_table
+
+@pytest.fixture
+def plies():
+    # Ply table of one saved carbon/epoxy material (id 0), as laminate_stiffness and the failure code read it
+    return ply_table(pd.DataFrame([{'E1': 135.0, 'E2': 10.0, 'nu12': 0.3, 'G12': 5.0, 'alpha1': -0.5, 'alpha2': 30.0,
+                                    **strength_columns({'F1T': 1500.0, 'F1C': 1200.0, 'F2T': 50.0, 'F2C': 200.0, 'F6': 70.0}, 'Tsai-Hahn')}]))
@@ -0,0 +1,38 @@
+# tests/test_adaptive_sampling.py
+
+import numpy as np
+
+from materials import fibers, matrices
+from material_math.formulas import strength_properties
+from material_math.registry import get_registry
+from material_math.engine import evaluate_entry
+from material_math.adaptive_sampling import adaptive_sample
+
+def sampled_property(budget):
+    entry = get_registry(strength_properties)["F1C"]
+    calls = []
+    def evaluate(Vf):
+        calls.append(len(Vf))
+        return evaluate_entry(entry, fibers['AS-4'], matrices['3501-6'], Vf, 0.02)
+    return adaptive_sample(evaluate, entry["theory_names"], budget=budget), calls
+
+def test_large_budget_stays_sorted_and_takes_few_rounds():
+    result, calls = sampled_property(20000)
+    assert len(result["Vf"]) == 20000
+    assert np.all(np.diff(result["Vf"]) > 0)
+    # Batches grow with the sample count: refinement rounds scale with log(budget), not budget / 16
+    assert len(calls) < 100
+
+def test_crossovers_match_dense_sampling():
+    result, _ = sampled_property(200)
+    entry = get_registry(strength_properties)["F1C"]
+    x = np.linspace(0.0, 1.0, 200001)
+    dense = []
+    with np.errstate(all='ignore'):
+        values = evaluate_entry(entry, fibers['AS-4'], matrices['3501-6'], x, 0.02)
+        for a in range(len(values)):
+            for b in range(a + 1, len(values)):
+                diff = values[a] - values[b]
+                diff = np.where(np.abs(diff) <= 1e-9 * np.maximum(np.abs(values[a]), np.abs(values[b])), 0.0, diff)
+                dense += list(x[np.nonzero(diff[:-1] * diff[1:] < 0)[0]])
+    assert np.allclose(sorted(dense), [crossover[2] for crossover in result["crossovers"]], atol=1e-4)
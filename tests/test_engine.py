@@ -0,0 +1,46 @@
+# tests/test_engine.py
+
+import numpy as np
+import pytest
+
+from materials import fibers, matrices
+from material_math.formulas import micromech_properties, strength_properties
+from material_math.engine import evaluate_property
+
+VF, VVOID = 0.6, 0.02
+
+def baseline_theory(theory_details, fiber, matrix, Vf, Vvoid):
+    # The pre-engine per-theory call of properties.calculate_properties, scalar materials; None when it raised
+    Vm = 1 - Vf
+    try:
+        coefficients = {}
+        for coeff_name, coeff_details in theory_details.get('coefficients', {}).items():
+            if 'formula' not in coeff_details:
+                coefficients[coeff_name] = coeff_details['default']
+            elif coeff_details['formula'].__code__.co_argcount == 2:
+                coefficients[coeff_name] = coeff_details['formula'](fiber, matrix)
+            else:
+                coefficients[coeff_name] = coeff_details['formula'](fiber, matrix, Vf, Vm)
+        formula = theory_details["formula"]
+        if "Vvoid" in formula.__code__.co_varnames:
+            return formula(fiber, matrix, Vf, Vm, Vvoid, **coefficients)
+        return formula(fiber, matrix, Vf, Vm, **coefficients)
+    except (TypeError, KeyError, ZeroDivisionError):
+        return None
+
+@pytest.mark.parametrize("category", [micromech_properties, strength_properties], ids=["micromech", "strength"])
+def test_engine_matches_baseline(category):
+    compared = 0
+    for fiber in fibers.values():
+        for matrix in matrices.values():
+            for property_name, theories in category.items():
+                names, values = evaluate_property(category, property_name, fiber, matrix, VF, VVOID)
+                for theory_name, value in zip(names, values):
+                    expected = baseline_theory(theories[theory_name], fiber, matrix, VF, VVOID)
+                    if expected is None:
+                        # Missing constituent data: the old loop raised, the engine gives NaN
+                        assert np.isnan(value), (fiber, matrix, property_name, theory_name)
+                        continue
+                    assert np.isclose(float(value), float(expected), equal_nan=True), (fiber, matrix, property_name, theory_name)
+                    compared += 1
+    assert compared > 0
@@ -0,0 +1,18 @@
+# tests/test_failure.py
+
+from femap.failure import calculate_failure_criteria
+
+STRENGTHS = {"F1T": 1500.0, "F1C": 1200.0, "F2T": 50.0, "F2C": 200.0, "F6": 70.0}
+
+def test_three_scalar_stresses_skip_ply_criteria():
+    elements = [{"stress": value, "strain": 0.001} for value in (10.0, 20.0, 30.0)]
+    results = calculate_failure_criteria(elements, STRENGTHS)
+    assert results["Max_Stress_Criterion"] == 30.0
+    assert not any(key.endswith(" FI") for key in results)
+
+def test_ply_stresses_get_criteria():
+    elements = [{"stress": [100.0, 10.0, 5.0], "strain": 0.001}, {"stress": [-300.0, 20.0, 30.0], "strain": 0.002}]
+    results = calculate_failure_criteria(elements, STRENGTHS)
+    assert any(key.endswith(" FI") for key in results)
+    assert (results["Max |sigma1|"], results["Max |sigma2|"], results["Max |tau12|"]) == (300.0, 20.0, 30.0)
+    assert "Max_Stress_Criterion" not in results
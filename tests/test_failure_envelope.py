@@ -0,0 +1,25 @@
+# tests/test_failure_envelope.py
+
+import numpy as np
+import pytest
+
+from material_math.failure_kernels import failure_kernels
+from material_math.failure_envelope import failure_envelope, PLANES
+
+STRENGTHS = {"F1T": 1500.0, "F1C": 1200.0, "F2T": 50.0, "F2C": 200.0, "F6": 70.0}
+
+@pytest.mark.parametrize("plane", list(PLANES))
+@pytest.mark.parametrize("criterion", list(failure_kernels))
+def test_envelope_points_lie_on_the_failure_surface(criterion, plane):
+    envelope = failure_envelope(STRENGTHS, criterion, plane, n_rays=360)
+    closed = np.isfinite(envelope["x"]) & np.isfinite(envelope["y"])
+    assert closed.any()
+    stress = np.zeros((closed.sum(), 3))
+    stress[:, PLANES[plane][0]] = envelope["x"][closed]
+    stress[:, PLANES[plane][1]] = envelope["y"][closed]
+    assert np.allclose(failure_kernels[criterion](stress, STRENGTHS)["index"], 1.0)
+
+def test_envelope_meets_the_axes_at_the_strengths():
+    envelope = failure_envelope(STRENGTHS, "Tsai-Wu", "σ1–σ2", n_rays=4)
+    # Rays at 0, 90, 180 and 270 degrees
+    assert np.allclose([envelope["x"][0], envelope["y"][1], -envelope["x"][2], -envelope["y"][3]], [1500.0, 50.0, 1200.0, 200.0])
@@ -0,0 +1,21 @@
+# tests/test_failure_kernels.py
+
+import numpy as np
+import pytest
+
+from material_math.failure_kernels import tsai_wu, tsai_wu_coefficients
+
+STRENGTHS = {"F1T": 1500.0, "F1C": 1200.0, "F2T": 50.0, "F2C": 200.0, "F6": 70.0}
+
+# sigma = (500, 20, 10) MPa by hand: F1 s1 = -1/12, F2 s2 = 0.3, F11 s1^2 = 5/36, F22 s2^2 = 0.04,
+# F66 t^2 = 1/49 -> 0.415964 without interaction, then 2 F12 s1 s2 with s1 s2 = 10^4:
+#   Tsai-Hahn F12 = -0.5 sqrt(F11 F22) = -3.7268e-6 -> -0.074536
+#   Hoffman   F12 = -0.5 F11           = -2.7778e-7 -> -0.005556
+@pytest.mark.parametrize("model, expected", [("Tsai-Hahn", 0.341428), ("Hoffman", 0.410408), ("Zero", 0.415964)])
+def test_biaxial_index_per_f12_model(model, expected):
+    coefficients = tsai_wu_coefficients(STRENGTHS, model)
+    result = tsai_wu(np.array([500.0, 20.0, 10.0]), STRENGTHS, coefficients)
+    assert np.isclose(result["index"], expected, atol=1e-6)
+    # The reserve factor scales the stress onto the failure surface
+    scaled = tsai_wu(np.array([500.0, 20.0, 10.0]) * result["reserve"], STRENGTHS, coefficients)
+    assert np.isclose(scaled["index"], 1.0)
@@ -0,0 +1,24 @@
+# tests/test_internal_loads.py
+
+import numpy as np
+
+from femap.wing_load import wing_load_cases
+from femap.internal_loads import internal_loads
+
+def test_root_shear_equals_applied_load():
+    cases = wing_load_cases(np.array([500.0, 1500.0]), np.array([[-1.5], [3.0]]), 15, 12, 5000.0, np.array([20, 33])[:, None, None], integration="exact")
+    loads = internal_loads(cases["y"], cases["F"], np.linspace(0, 5000, 300))
+    np.testing.assert_allclose(loads["V"][..., 0], cases["applied_force"], rtol=1e-12)
+
+def test_matches_direct_sums():
+    cases = wing_load_cases(np.array([800.0, 2000.0]), 2.5, 15, 12, 4000.0, 20)
+    y, F = cases["y"], cases["F"]
+    stations = np.linspace(0, 4000, 57)
+    arms = np.nan_to_num(y) * 0.1
+    loads = internal_loads(y, F, stations, arms)
+    outboard = np.nan_to_num(y, nan=np.inf)[..., None, :] >= stations[:, None]
+    arm = np.where(outboard, np.nan_to_num(y)[..., None, :] - stations[:, None], 0.0)
+    np.testing.assert_allclose(loads["V"], (F[..., None, :] * outboard).sum(-1), atol=1e-9)
+    np.testing.assert_allclose(loads["M"], (F[..., None, :] * arm).sum(-1), atol=1e-6)
+    np.testing.assert_allclose(loads["T"], (F[..., None, :] * arms[..., None, :] * outboard).sum(-1), atol=1e-9)
+    np.testing.assert_allclose(loads["M"][..., -1], 0.0, atol=1e-6)
@@ -0,0 +1,22 @@
+# tests/test_laminate.py
+
+import numpy as np
+import pytest
+
+from material_math.laminate import laminate_stiffness, parse_layup
+
+def test_symmetric_laminates_have_no_coupling(plies):
+    angles = np.array([parse_layup(layup) for layup in ("[0/±45/90]s", "[±30/0_2]s", "[90/0/±60]s")])
+    laminate = laminate_stiffness(np.zeros(angles.shape, dtype=int), angles, np.full(angles.shape, 0.125), plies)
+    assert np.allclose(laminate["B"], 0.0, atol=1e-9 * np.abs(laminate["A"]).max())
+    assert np.allclose(laminate["A"], (laminate["Qbar"] * 0.125).sum(axis=-3))
+
+def test_unsymmetric_laminate_couples(plies):
+    angles = np.array([0.0, 90.0])
+    laminate = laminate_stiffness(np.zeros(2, dtype=int), angles, np.full(2, 0.125), plies)
+    assert np.abs(laminate["B"]).max() > 1.0
+
+@pytest.mark.parametrize("layup", ["", "[]s", "[ / ]"])
+def test_empty_layup_is_rejected(layup):
+    with pytest.raises(ValueError):
+        parse_layup(layup)
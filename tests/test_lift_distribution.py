@@ -0,0 +1,49 @@
+# tests/test_lift_distribution.py
+
+import numpy as np
+
+from cad.presets import aircraft_presets
+from femap.lift_distribution import station_grid, schrenk, elliptic, lifting_line, lifting_line_shape, lift_shapes
+
+WINGS = [preset["wing"] for preset in aircraft_presets.values()]
+
+def test_per_preset_angles_match_single_solves():
+    alpha = np.radians(np.arange(len(WINGS) * 3, dtype=float).reshape(len(WINGS), 3) - 2)
+    batched = lifting_line(WINGS, alpha)
+    for idx, wing in enumerate(WINGS):
+        single = lifting_line([wing], alpha[idx])
+        assert np.allclose(batched["CL"][idx], single["CL"][0])
+        assert np.allclose(batched["shape"][idx], single["shape"][0], equal_nan=True)
+
+def area(eta, shape):
+    return np.sum((shape[..., 1:] + shape[..., :-1]) / 2 * np.diff(eta), axis=-1)
+
+def test_shapes_integrate_to_one():
+    eta = station_grid()
+    # Lifting angles only: a symmetric airfoil wing has no lift, hence no shape, at alpha = 0
+    shapes = lift_shapes(WINGS, np.radians([4.0, 8.0]), eta)
+    for name, shape in shapes.items():
+        assert np.allclose(area(eta, shape), 1.0), name
+
+def test_schrenk_keeps_tip_lift():
+    eta = station_grid()
+    shape = schrenk(WINGS, eta)
+    ellipse = elliptic(WINGS, eta)
+    assert np.all(np.isfinite(shape)) and np.all(shape[:, :-1] > 0)
+    assert np.all(shape[:, -1] > ellipse[:, -1])
+
+def test_lifting_line_slope_is_below_section_slope():
+    # A finite wing's CLa stays below the 2 pi of its sections
+    result = lifting_line(WINGS, np.radians([0.0, 1.0]))
+    slope = (result["CL"][:, 1] - result["CL"][:, 0]) / np.radians(1.0)
+    assert np.all((slope > 3.0) & (slope < 2 * np.pi))
+
+def test_lifting_line_shape_rejects_zero_and_opposite_lift():
+    symmetric = aircraft_presets["330-LT"]["wing"]
+    eta = station_grid()
+    shape, CL = lifting_line_shape(symmetric, 0.0, 8.0, eta)
+    assert shape is None and abs(CL) < 1e-9
+    shape, CL = lifting_line_shape(symmetric, np.radians(-4.0), 8.0, eta)
+    assert shape is None and CL < 0
+    shape, CL = lifting_line_shape(symmetric, np.radians(-4.0), -3.2, eta)
+    assert np.all(np.isfinite(shape)) and np.isclose(area(eta, shape), 1.0)
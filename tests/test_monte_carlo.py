@@ -0,0 +1,21 @@
+# tests/test_monte_carlo.py
+
+import numpy as np
+
+from material_math.monte_carlo import RunningStats
+
+def test_percentiles_follow_chunks_outside_first_range():
+    rng = np.random.default_rng(0)
+    # First chunk is narrow, later chunks drift far past its padded range on both sides
+    chunks = [rng.normal(0.0, 1.0, (2, 1000))] + [rng.normal(shift, 5.0, (2, 1000)) for shift in (40.0, -60.0, 200.0)]
+    stats = RunningStats(2)
+    for chunk in chunks:
+        stats.update(chunk)
+    values = np.concatenate(chunks, axis=1)
+    assert stats.histogram.sum() == values.size
+    assert np.all(stats.lo <= values.min(axis=1)) and np.all(stats.hi >= values.max(axis=1))
+    for q in (1, 10, 37, 63, 99):
+        expected = np.percentile(values, q, axis=1)
+        assert np.allclose(stats.percentile(q), expected, atol=(stats.hi - stats.lo).max() / stats.bins * 2)
+    assert np.allclose(stats.mean, values.mean(axis=1))
+    assert np.allclose(stats.std, values.std(axis=1, ddof=1))
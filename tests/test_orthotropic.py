@@ -0,0 +1,17 @@
+# tests/test_orthotropic.py
+
+import numpy as np
+
+from material_math.orthotropic import catalog_solid_matrices
+
+def test_library_compliance_inverts_stiffness():
+    matrices = catalog_solid_matrices(0.6, 0.02)
+    S, C = matrices["S"], matrices["C"]
+    complete = np.isfinite(C).all(axis=(-2, -1))
+    assert complete.any()
+    S, C = S[complete], C[complete]
+    assert np.allclose(S @ C, np.eye(6), atol=1e-9)
+    assert np.allclose(S, np.swapaxes(S, -1, -2), rtol=1e-12, atol=0)
+    assert np.allclose(C, np.swapaxes(C, -1, -2), rtol=1e-9, atol=1e-9 * np.abs(C).max())
+    # Positive definite, as a physical stiffness must be
+    assert np.all(np.linalg.eigvalsh(C) > 0)
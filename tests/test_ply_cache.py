@@ -0,0 +1,31 @@
+# tests/test_ply_cache.py
+
+import numpy as np
+
+from material_math.laminate import ply_cache, ply_transforms, reduced_stiffness, stress_transformation, strain_transformation, transformed_stiffness, PLY_COLUMNS
+
+def uncached_transforms(plies, material_id, angle):
+    Q = reduced_stiffness(*(plies[column][material_id] for column in PLY_COLUMNS))
+    return {"T_sigma": stress_transformation(angle), "T_epsilon": strain_transformation(angle), "Q": Q, "Qbar": transformed_stiffness(Q, angle)}
+
+def test_repeated_pair_is_a_hit_with_identical_results(plies):
+    ply_cache.clear()
+    angles = np.array([30.0, -30.0, 30.0, 30.0])
+    first = ply_transforms(np.zeros(4, dtype=int), angles, plies)
+    # Two distinct (material, angle) pairs, each computed once
+    assert ply_cache.info()["misses"] == 2 and ply_cache.info()["hits"] == 0
+    second = ply_transforms(np.zeros(2, dtype=int), np.array([-30.0, 30.0]), plies)
+    assert ply_cache.info()["hits"] == 2 and ply_cache.info()["misses"] == 2
+    for name, matrices in uncached_transforms(plies, 0, 30.0).items():
+        assert np.array_equal(first[name][0], matrices)
+        assert np.array_equal(first[name][3], matrices)
+        assert np.array_equal(second[name][1], matrices)
+    for name, matrices in uncached_transforms(plies, 0, -30.0).items():
+        assert np.array_equal(second[name][0], matrices)
+
+def test_edited_table_is_not_served_stale(plies):
+    ply_cache.clear()
+    before = ply_transforms(np.zeros(1, dtype=int), np.array([45.0]), plies)["Qbar"]
+    stiffer = {**plies, "E1": plies["E1"] * 2}
+    after = ply_transforms(np.zeros(1, dtype=int), np.array([45.0]), stiffer)["Qbar"]
+    assert not np.allclose(before, after)
@@ -0,0 +1,16 @@
+# tests/test_progressive_failure.py
+
+import numpy as np
+import pytest
+
+from material_math.progressive_failure import progressive_failure
+
+@pytest.mark.parametrize("criterion", ["Tsai-Wu", "Maximum Stress"])
+@pytest.mark.parametrize("Nx, strength", [(100.0, "F1T"), (-100.0, "F1C")])
+def test_unidirectional_fails_at_fiber_strength(plies, criterion, Nx, strength):
+    # [0]_4 under Nx only: sigma_1 = Nx / t in every ply, so FPF = LPF = X t / |Nx|
+    thickness = np.full(4, 0.125)
+    result = progressive_failure(np.zeros(4, dtype=int), np.zeros(4), thickness, np.array([Nx, 0, 0, 0, 0, 0]), criterion, plies)
+    expected = plies[strength][0] * thickness.sum() / abs(Nx)
+    assert np.isclose(result["fpf"], expected)
+    assert np.isclose(result["lpf"], expected)
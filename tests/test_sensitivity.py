@@ -0,0 +1,46 @@
+# tests/test_sensitivity.py
+
+import numpy as np
+import pytest
+
+from materials import fibers, matrices
+from material_math.formulas import micromech_properties, strength_properties, thermal_properties
+from material_math.registry import get_registry
+from material_math.engine import evaluate_theory
+from material_math.sensitivity import evaluate_with_gradient
+
+FIBER, MATRIX = fibers['AS-4'], matrices['3501-6']
+VF, VVOID = np.array([0.3, 0.45, 0.6]), 0.02
+
+def central_difference(theory, variable, Vf, Vvoid):
+    # d/dvariable of the engine value, step relative to the variable's size
+    f, m = dict(FIBER), dict(MATRIX)
+    values = {"Vf": Vf, "Vvoid": Vvoid}
+    base = values[variable] if variable in values else (f[variable] if variable in f else m[variable])
+    h = 1e-6 * max(np.max(np.abs(base)), 1e-3)
+    shifted = []
+    for step in (h, -h):
+        f_step, m_step, values_step = dict(f), dict(m), dict(values)
+        if variable in values:
+            values_step[variable] = values[variable] + step
+        elif variable in f:
+            f_step[variable] = f[variable] + step
+        else:
+            m_step[variable] = m[variable] + step
+        shifted.append(evaluate_theory(theory, f_step, m_step, values_step["Vf"], values_step["Vvoid"]))
+    return (shifted[0] - shifted[1]) / (2 * h)
+
+@pytest.mark.parametrize("category", [micromech_properties, strength_properties, thermal_properties], ids=["micromech", "strength", "thermal"])
+def test_gradients_match_finite_differences(category):
+    checked = 0
+    for property_name, entry in get_registry(category).items():
+        for theory_name in entry["theory_names"]:
+            theory = entry["theories"][theory_name]
+            value, gradient = evaluate_with_gradient(category, property_name, theory_name, FIBER, MATRIX, VF, VVOID)
+            if not np.all(np.isfinite(value)):
+                continue
+            for variable, derivative in gradient.items():
+                expected = central_difference(theory, variable, VF, VVOID)
+                assert np.allclose(derivative, expected, rtol=1e-4, atol=1e-7 * (np.abs(value).max() + 1)), (property_name, theory_name, variable)
+                checked += 1
+    assert checked > 20
@@ -0,0 +1,31 @@
+# tests/test_thermal.py
+
+import numpy as np
+
+from material_math.laminate import ply_stresses, cure_residual_stresses, stress_transformation, ply_interfaces, parse_layup
+from material_math.hygrothermal import chamis_knockdown, wet_glass_transition
+
+def test_unidirectional_expands_freely(plies):
+    # Every ply expands the same way, so a uniform temperature change leaves no stress
+    angles = np.zeros(4)
+    result = ply_stresses(np.zeros(4, dtype=int), angles, np.full(4, 0.125), np.zeros(6), plies, delta_T=-150.0)
+    assert np.allclose(result["stress"], 0.0, atol=1e-9)
+    assert np.allclose(result["strain"][..., 0], -0.5e-6 * -150.0)
+    assert np.allclose(result["strain"][..., 1], 30e-6 * -150.0)
+
+def test_cross_ply_cure_stresses_balance(plies):
+    angles = np.array(parse_layup("[0/90_2/0]s"))
+    thickness = np.full(len(angles), 0.125)
+    stress = cure_residual_stresses(np.zeros(len(angles), dtype=int), angles, thickness, plies=plies)["stress"]
+    assert np.abs(stress).max() > 1.0
+    # Back to laminate axes; with no curvature the stress is constant through each ply
+    laminate_stress = np.linalg.solve(stress_transformation(angles)[:, None], stress[..., None])[..., 0].mean(axis=1)
+    z_bottom, z_top = ply_interfaces(thickness)
+    N = (laminate_stress * thickness[:, None]).sum(axis=0)
+    M = (laminate_stress * ((z_top ** 2 - z_bottom ** 2) / 2)[:, None]).sum(axis=0)
+    assert np.allclose(N, 0.0, atol=1e-9 * np.abs(laminate_stress).max())
+    assert np.allclose(M, 0.0, atol=1e-9 * np.abs(laminate_stress).max())
+
+def test_chamis_knockdown_limits():
+    assert np.isclose(chamis_knockdown(180.0, 21.0, 0.0, 21.0), 1.0)
+    assert chamis_knockdown(180.0, wet_glass_transition(180.0, 2.0), 2.0) == 0.0
@@ -0,0 +1,26 @@
+# tests/test_vn_diagram.py
+
+import copy
+
+import numpy as np
+
+from cad.presets import aircraft_presets
+from femap.vn_diagram import vn_envelope, corner_loads
+
+def test_preset_speeds_are_ordered():
+    envelope = vn_envelope(list(aircraft_presets.values()))
+    assert np.all(envelope["V_S"] <= envelope["V_A"])
+    assert np.all(envelope["V_A"] <= envelope["V_C"])
+    assert np.all(envelope["V_G"] <= envelope["V_C"])
+    assert np.all(envelope["V_C"] <= envelope["V_D"])
+
+def test_out_of_order_preset_is_masked_alone():
+    slow = copy.deepcopy(aircraft_presets["P-51"])
+    slow["specs"]["v_cruise"] = 100.0
+    presets = [slow, aircraft_presets["Glider"]]
+    envelope = vn_envelope(presets)
+    assert envelope["valid"].tolist() == [False, True]
+    assert np.all(np.isnan(envelope["n"][0])) and np.all(np.isfinite(envelope["n"][1]))
+    result = corner_loads(presets)
+    assert np.all(np.isfinite(result["loads"]["M"][1]))
+    assert np.isclose(np.abs(result["loads"]["M"][1, :, 0]).max(), np.abs(result["loads"]["M"][1, result["critical"][1], 0]))
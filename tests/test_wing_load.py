@@ -0,0 +1,64 @@
+# tests/test_wing_load.py
+
+import numpy as np
+import pytest
+
+from femap.wing_load import wing_load_cases, case_forces, elliptic_load_integral, skin_running_loads
+
+def baseline_forces(mass, load_factor, nodes_between_ribs, num_ribs, wing_length, num_nodes, g=9.80665):
+    # The pre-refactor calc_wing_load math, without the plots
+    total_force = mass * g * load_factor / 2
+    total_nodes = int(nodes_between_ribs * num_ribs - (num_ribs - 2))
+    y_positions = np.linspace(0, wing_length, total_nodes)
+    dy_position = y_positions[1] - y_positions[0]
+    p = round(wing_length / (dy_position * num_nodes))
+    dy = p * dy_position
+    y_interpolated = np.arange(0, num_nodes * dy, dy)
+    if y_interpolated[-1] > wing_length:
+        y_interpolated = y_interpolated[:-1]
+    a = 3 / 2 * total_force / wing_length
+    y = np.linspace(0, wing_length, 1001)
+    interpolated_forces = np.interp(y_interpolated, y, np.sqrt(a ** 2 / wing_length * (wing_length - y)))
+    yk = np.zeros(len(y_interpolated))
+    Fk = np.zeros(len(y_interpolated))
+    yk[1:] = np.cumsum(np.full(len(y_interpolated) - 1, dy))
+    Fk[1:] = (interpolated_forces[1:] + interpolated_forces[:-1]) / 2 * dy
+    return yk, Fk
+
+@pytest.mark.parametrize("case", [(5489.0, 10.0, 15, 12, 5643.0, 20), (950.0, 3.0, 21, 8, 3750.0, 33), (1500.0, 4.4, 10, 20, 10000.0, 10)])
+def test_trapezoid_matches_baseline(case):
+    yk, Fk = case_forces(wing_load_cases(*case))
+    y_base, F_base = baseline_forces(*case)
+    np.testing.assert_allclose(yk, y_base, atol=1e-9)
+    np.testing.assert_allclose(Fk, F_base, rtol=1e-10)
+
+def test_exact_integration_applies_total_force():
+    cases = wing_load_cases(np.linspace(500, 3000, 7)[:, None], np.array([-1.5, 1.0, 4.4]), 15, 12, 5000.0, 20, integration="exact")
+    np.testing.assert_allclose(cases["applied_force"], cases["total_force"], rtol=1e-12)
+    np.testing.assert_allclose(elliptic_load_integral(0.0, 5000.0, 1234.0, 5000.0), 1234.0)
+
+def test_root_strip_goes_to_first_free_node():
+    # The root node is constrained in the Femap model: nothing may stay on it
+    cases = wing_load_cases(5489.0, np.array([10.0, -4.0]), 15, 12, 5000.0, 20, integration="exact")
+    assert np.all(cases["F"][..., 0] == 0.0)
+    dy = cases["dy"][..., None]
+    first = elliptic_load_integral(0.0, 1.5 * dy, cases["total_force"][..., None], 5000.0)[..., 0]
+    np.testing.assert_allclose(cases["F"][..., 1], first)
+    np.testing.assert_allclose(cases["F"].sum(axis=-1), cases["total_force"])
+
+def test_coarse_spacing_is_rejected():
+    # 50 force nodes on a 13-node spar round the spacing p to 0
+    cases = wing_load_cases(1000.0, 3.0, np.array([7, 15]), 2, 5000.0, 50)
+    assert cases["valid"].tolist() == [False, True]
+    assert cases["nodes"][0] == 0 and np.isnan(cases["applied_force"][0])
+    assert np.isfinite(cases["relative_error"][1])
+    with pytest.raises(ValueError):
+        case_forces(cases, 0)
+
+def test_skin_running_loads_match_direct_moment():
+    yk, Fk = case_forces(wing_load_cases(1000.0, 3.0, 15, 12, 5000.0, 20, integration="exact"))
+    box_width, box_height = 600.0, 150.0
+    loads = skin_running_loads(yk, Fk, box_width, box_height)
+    moment = (np.maximum(yk[None, :] - yk[:, None], 0.0) * Fk[None, :]).sum(axis=1)
+    assert np.allclose(loads[:, 0], -moment / (box_height * box_width))
+    assert not np.any(loads[:, 1:])